@@ -166,12 +166,16 @@ class pyrocomp(object):
         )
         return itfm_df
 
-    def ILR(self):
+    def ILR(self, psi=None):
         """
         Isometric Log Ratio transformation.
 
         Parameters
         ---------------
+        psi : :class:`numpy.ndarray`
+            Orthonormal basis of shape :code:`(D-1, D)` (e.g. from
+            :func:`~pyrolite.util.math.balance_basis`). By default, a helmert basis is
+            used.
 
         Returns
         --------
@@ -180,14 +184,14 @@ class pyrocomp(object):
         """
         colnames = ["ILR{}".format(ix) for ix in range(self._obj.columns.size - 1)]
         tfm_df = pd.DataFrame(
-            ilr(self._obj.values), index=self._obj.index, columns=colnames,
+            ilr(self._obj.values, psi=psi), index=self._obj.index, columns=colnames,
         )
         tfm_df.inverts_to = (
             self._obj.columns.to_list()
         )  # save parameter for inverse_transform
         return tfm_df
 
-    def inverse_ILR(self, X=None):
+    def inverse_ILR(self, X=None, psi=None):
         """
         Inverse Isometric Log Ratio transformation.
 
@@ -196,6 +200,8 @@ class pyrocomp(object):
         X : :class:`numpy.ndarray`, :code:`None`
             Optional specification for an array from which to derive the orthonormal basis,
             with shape :code:`(N, D)`.
+        psi : :class:`numpy.ndarray`
+            Orthonormal basis of shape :code:`(D-1, D)` used for the forward transform.
 
         Returns
         --------
@@ -206,7 +212,9 @@ class pyrocomp(object):
             colnames = self._obj.inverts_to
 
         itfm_df = pd.DataFrame(
-            inverse_ilr(self._obj.values), index=self._obj.index, columns=colnames,
+            inverse_ilr(self._obj.values, X=X, psi=psi),
+            index=self._obj.index,
+            columns=colnames,
         )
         return itfm_df
 
@@ -216,6 +224,7 @@ class pyrocomp(object):
         lmbda_search_space=(-1, 5),
         search_steps=100,
         return_lmbda=False,
+        per_column=False,
     ):
         """
         Box-Cox transformation.
@@ -229,6 +238,8 @@ class pyrocomp(object):
             Range tuple (min, max).
         search_steps : :class:`int`
             Steps for lambda search range.
+        per_column : :class:`bool`
+            Whether to estimate a lambda value for each column.
 
         Returns
         -------
@@ -241,6 +252,7 @@ class pyrocomp(object):
             lmbda_search_space=lmbda_search_space,
             search_steps=search_steps,
             return_lmbda=True,
+            per_column=per_column,
         )
         tfm_df = pd.DataFrame(arr, index=self._obj.index, columns=self._obj.columns)
         tfm_df.boxcox_lmbda = lmbda  # save parameter for inverse_transform
@@ -252,8 +264,8 @@ class pyrocomp(object):
 
         Parameters
         ---------------
-        lmbda : :class:`float`
-            Lambda value used to forward-transform values.
+        lmbda : :class:`float` | :class:`numpy.ndarray`
+            Lambda value(s) used to forward-transform values.
 
         Returns
         -------
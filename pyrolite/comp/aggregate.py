@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 import warnings
-from .codata import alr, inverse_alr
+from .codata import alr, inverse_alr, clr, inverse_clr, ilr, inverse_ilr
 
 import logging
 
@@ -290,3 +290,198 @@ def standardise_aggregate(
         if renorm:
             ser /= np.nansum(ser.values)
         return ser
+
+
+class LogRatioAccumulator(object):
+    """
+    Accumulator for the compositional centre and log-ratio covariance of data
+    which are too large to hold in memory, updated with chunks of data using a
+    numerically stable (Welford-style) pairwise update.
+
+    Partial accumulators (e.g. from different worker processes) can be combined with
+    :meth:`merge`, and estimates can be obtained at any point using :meth:`finalize`.
+
+    Parameters
+    -----------
+    transform : :class:`str`, :code:`{'clr', 'ilr'}`
+        Log-ratio transform in which to accumulate the mean and covariance.
+    psi : :class:`numpy.ndarray`
+        Orthonormal basis of shape :code:`(D-1, D)` for the ILR transform (e.g. from
+        :func:`~pyrolite.util.math.balance_basis`). By default, a helmert basis is
+        used.
+
+    Attributes
+    -----------
+    n : :class:`int`
+        Number of records accumulated.
+    mean : :class:`numpy.ndarray`
+        Mean of the log-transformed records.
+    M2 : :class:`numpy.ndarray`
+        Sum of squared deviations (and cross-deviations) from the mean of the
+        log-transformed records.
+
+    Notes
+    -----
+        * Records with missing values are excluded, as for
+          :func:`~pyrolite.util.math.nancov`.
+        * Statistics are accumulated in double precision, independent of the
+          precision of the data.
+
+    Examples
+    ---------
+    .. code-block:: python
+
+        acc = LogRatioAccumulator()
+        for chunk in pd.read_csv("compositions.csv", chunksize=100000):
+            acc.update(chunk)
+        centre, cov = acc.finalize()
+    """
+
+    def __init__(self, transform="clr", psi=None):
+        if transform not in ["clr", "ilr"]:
+            msg = "Transform {} not in {{'clr', 'ilr'}}.".format(transform)
+            raise NotImplementedError(msg)
+        self.transform = transform
+        self.psi = None if psi is None else np.asarray(psi)
+        self.columns = None
+        self.n = 0
+        self.mean = None
+        self.M2 = None
+
+    def _combine(self, n, mean, M2):
+        """
+        Combine the statistics of a set of (transformed) records with those already
+        accumulated.
+        """
+        if n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.M2 = n, mean.copy(), M2.copy()
+            return
+        if mean.shape != self.mean.shape:
+            msg = "Cannot combine {}-dimensional statistics with {}-dimensional ones."
+            raise ValueError(msg.format(mean.size, self.mean.size))
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * (n / total)
+        self.M2 += M2 + np.outer(delta, delta) * (self.n * n / total)
+        self.n = total
+
+    def update(self, chunk):
+        """
+        Update the accumulated statistics with a chunk of compositional data.
+
+        Parameters
+        -----------
+        chunk : :class:`pandas.DataFrame` | :class:`numpy.ndarray`
+            Compositional data of shape :code:`(N, D)`.
+
+        Returns
+        --------
+        :class:`LogRatioAccumulator`
+            The updated accumulator.
+        """
+        if isinstance(chunk, pd.DataFrame):
+            if self.columns is None:
+                self.columns = chunk.columns
+            chunk = chunk.reindex(columns=self.columns).values
+        X = np.asarray(chunk)
+        if X.ndim < 2:
+            X = X.reshape(1, -1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.transform == "clr":
+                Y = clr(X, dtype=float)
+            else:
+                Y = ilr(X, psi=self.psi, dtype=float)
+        Y = Y[np.isfinite(Y).all(axis=1)]
+        if Y.shape[0] == 0:  # no complete records
+            return self
+        mean = Y.mean(axis=0)
+        Y -= mean
+        self._combine(Y.shape[0], mean, Y.T @ Y)
+        return self
+
+    def merge(self, other):
+        """
+        Combine the statistics from another accumulator with those of this one.
+
+        Parameters
+        -----------
+        other : :class:`LogRatioAccumulator`
+            Accumulator to merge, using the same transform (and ILR basis).
+
+        Returns
+        --------
+        :class:`LogRatioAccumulator`
+            The updated accumulator.
+
+        Notes
+        ------
+        Where both accumulators have columns in a different order, CLR statistics
+        are reordered to match this accumulator; ILR statistics cannot be reordered
+        in this way, and a :class:`ValueError` is raised.
+        """
+        if other.transform != self.transform:
+            msg = "Cannot merge {} statistics with {} statistics."
+            raise ValueError(msg.format(other.transform, self.transform))
+        if self.transform == "ilr" and not (
+            (self.psi is None and other.psi is None)
+            or (
+                self.psi is not None
+                and other.psi is not None
+                and self.psi.shape == other.psi.shape
+                and np.allclose(self.psi, other.psi)
+            )
+        ):
+            raise ValueError("Cannot merge statistics from different ILR bases.")
+        mean, M2 = other.mean, other.M2
+        if self.columns is None:
+            self.columns = other.columns
+        elif other.columns is not None and not self.columns.equals(other.columns):
+            if set(self.columns) != set(other.columns):
+                msg = "Cannot merge statistics for columns {} with those for {}."
+                raise ValueError(msg.format(list(other.columns), list(self.columns)))
+            if self.transform != "clr":
+                msg = "Cannot merge ILR statistics with different column orders."
+                raise ValueError(msg)
+            if other.n:
+                order = other.columns.get_indexer(self.columns)
+                mean, M2 = mean[order], M2[np.ix_(order, order)]
+        if other.n:
+            self._combine(other.n, mean, M2)
+        return self
+
+    def finalize(self, ddof=1):
+        """
+        Get the compositional centre and log-ratio covariance of the accumulated
+        records.
+
+        Parameters
+        -----------
+        ddof : :class:`int`
+            Delta degrees of freedom for the covariance estimate.
+
+        Returns
+        --------
+        centre : :class:`numpy.ndarray` | :class:`pandas.Series`
+            Compositional centre (closed to unity), of shape :code:`(D,)`.
+        cov : :class:`numpy.ndarray` | :class:`pandas.DataFrame`
+            Covariance matrix in the log-ratio space, of shape :code:`(D, D)` for the
+            CLR transform or :code:`(D-1, D-1)` for the ILR transform.
+        """
+        if self.n == 0:
+            raise ValueError("No complete records have been accumulated.")
+        if self.transform == "clr":
+            centre = inverse_clr(self.mean[np.newaxis, :])[0]
+        else:
+            centre = inverse_ilr(self.mean[np.newaxis, :], psi=self.psi)[0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self.M2 / (self.n - ddof)
+        if self.columns is not None:
+            centre = pd.Series(centre, index=self.columns)
+            if self.transform == "clr":
+                names = self.columns
+            else:
+                names = ["ILR{}".format(ix) for ix in range(cov.shape[0])]
+            cov = pd.DataFrame(cov, index=names, columns=names)
+        return centre, cov
@@ -1,7 +1,9 @@
+import os
 import numpy as np
 import pandas as pd
 import scipy.stats
 import scipy.special
+from concurrent.futures import ThreadPoolExecutor
 
 # from .renorm import renormalise, close
 from ..util.math import orthogonal_basis_default, orthogonal_basis_from_array
@@ -70,7 +72,39 @@ def renormalise(df: pd.DataFrame, components: list = [], scale=100.0):
         return dfc
 
 
-def alr(X: np.ndarray, ind: int = -1, null_col=False):
+# rows processed at a time where scratch space is needed
+__chunksize__ = 2 ** 16
+
+
+def _output_array(X, shape, out=None, dtype=None):
+    """
+    Get an array to write the output of a log-ratio transformation to.
+
+    Parameters
+    -----------
+    X : :class:`numpy.ndarray`
+        Input array.
+    shape : :class:`tuple`
+        Shape of the output.
+    out : :class:`numpy.ndarray`
+        Preallocated output array, which is validated and returned if given.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type for the output array. By default, this will be the floating point
+        type of the input (with integer types giving :class:`numpy.float64`).
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+    """
+    if out is None:
+        if dtype is None:
+            dtype = np.result_type(X, np.float32)
+        return np.empty(shape, dtype=dtype)
+    assert out.shape == shape, "Output array should be of shape {}.".format(shape)
+    return out
+
+
+def alr(X: np.ndarray, ind: int = -1, null_col=False, out=None, dtype=None):
     """
     Additive Log Ratio transformation.
 
@@ -82,32 +116,36 @@ def alr(X: np.ndarray, ind: int = -1, null_col=False):
         Index of column used as denominator.
     null_col : :class:`bool`
         Whether to keep the redundant column.
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D-1)` (or :code:`(N, D)` where :code:`null_col=True`).
+        Where :code:`null_col=True`, this can be the input array.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     ---------
     :class:`numpy.ndarray`
         ALR-transformed array, of shape :code:`(N, D-1)`.
     """
-
-    Y = X.copy()
-    assert Y.ndim in [1, 2]
-    dimensions = Y.shape[Y.ndim - 1]
+    X = np.asarray(X)
+    assert X.ndim in [1, 2]
+    dimensions = X.shape[-1]
     if ind < 0:
         ind += dimensions
 
-    if Y.ndim == 2:
-        Y = np.divide(Y, Y[:, ind][:, np.newaxis])
-        if not null_col:
-            Y = Y[:, [i for i in range(dimensions) if not i == ind]]
-    else:
-        Y = np.divide(X, X[ind])
-        if not null_col:
-            Y = Y[[i for i in range(dimensions) if not i == ind]]
-
-    return np.log(Y)
+    shape = X.shape[:-1] + (dimensions if null_col else dimensions - 1,)
+    out = _output_array(X, shape, out=out, dtype=dtype)
+    denominator = X[..., ind : ind + 1]
+    if null_col:
+        np.divide(X, denominator, out=out)
+    else:  # divide either side of the denominator column, without copying
+        np.divide(X[..., :ind], denominator, out=out[..., :ind])
+        np.divide(X[..., ind + 1 :], denominator, out=out[..., ind:])
+    return np.log(out, out=out)
 
 
-def inverse_alr(Y: np.ndarray, ind=-1, null_col=False):
+def inverse_alr(Y: np.ndarray, ind=-1, null_col=False, out=None, dtype=None):
     """
     Inverse Centred Log Ratio transformation.
 
@@ -120,37 +158,38 @@ def inverse_alr(Y: np.ndarray, ind=-1, null_col=False):
     null_col : :class:`bool`, :code:`False`
         Whether the array contains an extra redundant column
         (i.e. shape is :code:`(N, D)`).
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D)`.
+        Where :code:`null_col=True`, this can be the input array.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     --------
     :class:`numpy.ndarray`
         Inverse-ALR transformed array, of shape :code:`(N, D)`.
     """
+    Y = np.asarray(Y)
     assert Y.ndim in [1, 2]
+    dimensions = Y.shape[-1] if null_col else Y.shape[-1] + 1
+    out = _output_array(Y, Y.shape[:-1] + (dimensions,), out=out, dtype=dtype)
 
-    X = Y.copy()
-    dimensions = X.shape[X.ndim - 1]
-    if not null_col:
-        idx = np.arange(0, dimensions + 1)
-
-        if ind != -1:
-            idx = np.array(list(idx[idx < ind]) + [-1] + list(idx[idx >= ind + 1] - 1))
-
-        # Add a zero-column and reorder columns
-        if Y.ndim == 2:
-            X = np.concatenate((X, np.zeros((X.shape[0], 1))), axis=1)
-            X = X[:, idx]
-        else:
-            X = np.append(X, np.array([0]))
-            X = X[idx]
-
-    # Inverse log and closure operations
-    X = np.exp(X)
-    X = close(X)
-    return X
+    # Inverse log operation, inserting the denominator column (exp(0) = 1)
+    if null_col:
+        np.exp(Y, out=out)
+    else:
+        if ind < 0:
+            ind += dimensions
+        np.exp(Y[..., :ind], out=out[..., :ind])
+        out[..., ind] = 1.0
+        np.exp(Y[..., ind:], out=out[..., ind + 1 :])
+    # Closure operation
+    out /= np.sum(out, axis=-1, keepdims=True)
+    return out
 
 
-def clr(X: np.ndarray):
+def clr(X: np.ndarray, out=None, dtype=None):
     """
     Centred Log Ratio transformation.
 
@@ -158,19 +197,30 @@ def clr(X: np.ndarray):
     ---------------
     X : :class:`numpy.ndarray`
         Array on which to perform the transformation, of shape :code:`(N, D)`.
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D)`.
+        This can be the input array, to transform it in place.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     ---------
     :class:`numpy.ndarray`
         CLR-transformed array, of shape :code:`(N, D)`.
+
+    Notes
+    ------
+    Closure is not required prior to the log operation, as it cancels on centring.
     """
-    X = np.divide(X, np.sum(X, axis=1)[:, np.newaxis])  # Closure operation
-    Y = np.log(X)  # Log operation
-    Y -= 1 / X.shape[1] * np.nansum(Y, axis=1)[:, np.newaxis]
-    return Y
+    X = np.asarray(X)
+    out = _output_array(X, X.shape, out=out, dtype=dtype)
+    np.log(X, out=out)  # Log operation
+    out -= np.sum(out, axis=1, keepdims=True) / X.shape[1]
+    return out
 
 
-def inverse_clr(Y: np.ndarray):
+def inverse_clr(Y: np.ndarray, out=None, dtype=None):
     """
     Inverse Centred Log Ratio transformation.
 
@@ -178,20 +228,28 @@ def inverse_clr(Y: np.ndarray):
     ---------------
     Y : :class:`numpy.ndarray`
         Array on which to perform the inverse transformation, of shape :code:`(N, D)`.
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D)`.
+        This can be the input array, to transform it in place.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     ---------
     :class:`numpy.ndarray`
         Inverse-CLR transformed array, of shape :code:`(N, D)`.
     """
+    Y = np.asarray(Y)
+    out = _output_array(Y, Y.shape, out=out, dtype=dtype)
     # Inverse of log operation
-    X = np.exp(Y)
+    np.exp(Y, out=out)
     # Closure operation
-    X = np.divide(X, np.nansum(X, axis=1)[:, np.newaxis])
-    return X
+    out /= np.nansum(out, axis=1, keepdims=True)
+    return out
 
 
-def ilr(X: np.ndarray):
+def ilr(X: np.ndarray, psi=None, out=None, dtype=None):
     """
     Isometric Log Ratio transformation.
 
@@ -199,20 +257,43 @@ def ilr(X: np.ndarray):
     ---------------
     X : :class:`numpy.ndarray`
         Array on which to perform the transformation, of shape :code:`(N, D)`.
+    psi : :class:`numpy.ndarray`
+        Orthonormal basis of shape :code:`(D-1, D)` (e.g. from
+        :func:`~pyrolite.util.math.balance_basis`). By default, a cached helmert basis
+        is used.
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D-1)`.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     --------
     :class:`numpy.ndarray`
         ILR-transformed array, of shape :code:`(N, D-1)`.
-    """
-    d = X.shape[1]
-    Y = clr(X)
-    psi = orthogonal_basis_from_array(X)  # Get a basis
-    assert np.allclose(psi @ psi.T, np.eye(d - 1))
-    return Y @ psi.T
-
 
-def inverse_ilr(Y: np.ndarray, X: np.ndarray = None):
+    Notes
+    ------
+    Rows are transformed in chunks, such that only a chunk of the intermediate
+    CLR-transformed array is held in memory.
+    """
+    X = np.asarray(X)
+    N, d = X.shape
+    if psi is None:
+        psi = orthogonal_basis_from_array(X)  # cached, pre-validated basis
+    psi = np.asarray(psi)
+    assert psi.shape == (d - 1, d)
+    out = _output_array(X, (N, d - 1), out=out, dtype=dtype)
+    psi = psi.T.astype(out.dtype)
+    scratch = np.empty((min(N, __chunksize__), d), dtype=out.dtype)
+    for ix in range(0, N, __chunksize__):
+        rows = slice(ix, ix + __chunksize__)
+        Y = clr(X[rows], out=scratch[: X[rows].shape[0]])
+        np.matmul(Y, psi, out=out[rows])
+    return out
+
+
+def inverse_ilr(Y: np.ndarray, X: np.ndarray = None, psi=None, out=None, dtype=None):
     """
     Inverse Isometric Log Ratio transformation.
 
@@ -223,20 +304,157 @@ def inverse_ilr(Y: np.ndarray, X: np.ndarray = None):
     X : :class:`numpy.ndarray`, :code:`None`
         Optional specification for an array from which to derive the orthonormal basis,
         with shape :code:`(N, D)`.
+    psi : :class:`numpy.ndarray`
+        Orthonormal basis of shape :code:`(D-1, D)` used for the forward transform
+        (e.g. from :func:`~pyrolite.util.math.balance_basis`).
+    out : :class:`numpy.ndarray`
+        Array to write the output to, of shape :code:`(N, D)`.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output (e.g. :code:`"float32"`), where :code:`out` is not
+        given. By default, floating point inputs retain their precision.
 
     Returns
     --------
     :class:`numpy.ndarray`
         Inverse-ILR transformed array, of shape :code:`(N, D)`.
     """
-
-    if X is None:
+    Y = np.asarray(Y)
+    if psi is not None:
+        psi = np.asarray(psi)
+    elif X is None:
         psi = orthogonal_basis_default(D=Y.shape[1] + 1)
     else:
         psi = orthogonal_basis_from_array(X)
-    C = Y @ psi
-    X = inverse_clr(C)  # Inverse log operation
-    return X
+    out = _output_array(Y, (Y.shape[0], psi.shape[1]), out=out, dtype=dtype)
+    np.matmul(Y, psi.astype(out.dtype), out=out)
+    return inverse_clr(out, out=out)  # Inverse log operation
+
+
+def _boxcox_llf(logX, lmbda, n, sumlog):
+    """
+    Box-Cox log-likelihood for each column of a log-transformed array, ignoring
+    missing values.
+
+    Parameters
+    ---------------
+    logX : :class:`numpy.ndarray`
+        Natural logarithm of the data, of shape :code:`(N, D)` or :code:`(N,)`.
+    lmbda : :class:`float`
+        Lambda value at which to evaluate the log-likelihood.
+    n, sumlog : :class:`numpy.ndarray`
+        Number of finite values and sum of log values for each column.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Log-likelihood for each column.
+    """
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        if lmbda == 0:
+            Y = logX
+        else:
+            Y = np.expm1(lmbda * logX) / lmbda
+        mean = np.nansum(Y, axis=0) / n
+        var = np.nansum((Y - mean) ** 2, axis=0) / n
+        return (lmbda - 1) * sumlog - n / 2 * np.log(var)
+
+
+def boxcox_lmbda(
+    X: np.ndarray,
+    lmbda_search_space=(-1, 5),
+    search_steps=100,
+    per_column=True,
+    refine=True,
+    n_jobs=None,
+):
+    """
+    Estimate Box-Cox lambda values by maximising the log-likelihood, evaluating a
+    grid of lambda values for all columns at once and optionally refining the
+    estimates with a bounded scalar optimiser.
+
+    Parameters
+    ---------------
+    X : :class:`numpy.ndarray`
+        Array of positive values, of shape :code:`(N, D)` or :code:`(N,)`. Missing
+        values are ignored.
+    lmbda_search_space : :class:`tuple`
+        Range tuple (min, max).
+    search_steps : :class:`int`
+        Steps for lambda search range.
+    per_column : :class:`bool`
+        Whether to estimate a lambda for each column. Otherwise, a single lambda
+        maximising the summed log-likelihood over all columns is returned.
+    refine : :class:`bool`
+        Whether to refine grid estimates within the neighbouring grid steps using
+        :func:`scipy.optimize.minimize_scalar`.
+    n_jobs : :class:`int`
+        Number of threads to use for refining estimates. :code:`n_jobs = -1` will
+        use as many threads as available processors.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` | :class:`float`
+        Lambda values for each column (or a single lambda value, where
+        :code:`per_column=False`). Columns without any finite values are given a
+        lambda of :class:`numpy.nan`, and are ignored in estimating a single lambda.
+    """
+    if not (
+        n_jobs is None
+        or n_jobs == -1
+        or (isinstance(n_jobs, (int, np.integer)) and n_jobs >= 1)
+    ):
+        raise ValueError(
+            "n_jobs should be a positive integer, -1 or None, not {}.".format(n_jobs)
+        )
+    X = np.asarray(X, dtype=float)
+    if X.ndim < 2:
+        X = X.reshape(-1, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        logX = np.log(X)
+    n = np.isfinite(logX).sum(axis=0)
+    sumlog = np.nansum(logX, axis=0)
+
+    grid = np.linspace(*lmbda_search_space, search_steps)
+    llf = np.array([_boxcox_llf(logX, l, n, sumlog) for l in grid])
+    llf = np.where(np.isfinite(llf), llf, -np.inf)
+    if per_column:
+        targets = [(logX[:, ix], n[ix], sumlog[ix]) for ix in range(X.shape[1])]
+    else:
+        valid = n > 0  # columns without finite values don't inform a shared lambda
+        llf = np.where(valid.any(), llf[:, valid].sum(axis=1), -np.inf)[:, None]
+        targets = [(logX[:, valid], n[valid], sumlog[valid])]
+    best = np.argmax(llf, axis=0)
+    # where there are no finite log-likelihoods (e.g. no finite values), return nan
+    found = np.isfinite(llf[best, np.arange(llf.shape[1])])
+    lmbdas = np.where(found, grid[best], np.nan)
+
+    if refine and grid.size > 1:
+        import scipy.optimize
+
+        def _refine(ix):
+            if not np.isfinite(llf[best[ix], ix]):
+                return lmbdas[ix]
+            _logX, _n, _sumlog = targets[ix]
+            bounds = grid[max(best[ix] - 1, 0)], grid[min(best[ix] + 1, grid.size - 1)]
+            res = scipy.optimize.minimize_scalar(
+                lambda l: -np.sum(_boxcox_llf(_logX, l, _n, _sumlog)),
+                bounds=bounds,
+                method="bounded",
+            )
+            # keep the grid estimate if the refinement has not improved on it
+            return res.x if -res.fun >= llf[best[ix], ix] else lmbdas[ix]
+
+        if n_jobs in [None, 1]:
+            lmbdas = np.array([_refine(ix) for ix in range(len(targets))])
+        else:
+            workers = os.cpu_count() if n_jobs == -1 else n_jobs
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                lmbdas = np.array(list(executor.map(_refine, range(len(targets)))))
+
+    if per_column:
+        return lmbdas
+    else:
+        return lmbdas[0]
 
 
 def boxcox(
@@ -245,6 +463,9 @@ def boxcox(
     lmbda_search_space=(-1, 5),
     search_steps=100,
     return_lmbda=False,
+    per_column=False,
+    refine=True,
+    n_jobs=None,
 ):
     """
     Box-Cox transformation.
@@ -253,42 +474,49 @@ def boxcox(
     ---------------
     X : :class:`numpy.ndarray`
         Array on which to perform the transformation.
-    lmbda : :class:`numpy.number`, :code:`None`
-        Lambda value used to forward-transform values. If none, it will be calculated
-        using the mean
+    lmbda : :class:`numpy.number` | :class:`numpy.ndarray`, :code:`None`
+        Lambda value(s) used to forward-transform values, either a single value or one
+        for each column. If none, it will be estimated using :func:`boxcox_lmbda`.
     lmbda_search_space : :class:`tuple`
         Range tuple (min, max).
     search_steps : :class:`int`
         Steps for lambda search range.
     return_lmbda : :class:`bool`
         Whether to also return the lambda value.
+    per_column : :class:`bool`
+        Whether to estimate a lambda value for each column, rather than a single value
+        for the whole array.
+    refine : :class:`bool`
+        Whether to refine lambda estimates beyond the search grid.
+    n_jobs : :class:`int`
+        Number of threads to use for refining lambda estimates.
 
     Returns
     -------
     :class:`numpy.ndarray` | :class:`numpy.ndarray`(:class:`float`)
         Box-Cox transformed array. If `return_lmbda` is true, tuple contains data and
-        lambda value.
+        lambda value(s).
     """
     if isinstance(X, pd.DataFrame) or isinstance(X, pd.Series):
         _X = X.values
     else:
-        _X = X.copy()
+        _X = np.asarray(X)
 
-    if lmbda is None:
-        l_search = np.linspace(*lmbda_search_space, search_steps)
-        llf = np.apply_along_axis(scipy.stats.boxcox_llf, 0, np.array([l_search]), _X.T)
-        if llf.shape[0] == 1:
-            mean_llf = llf[0]
-        else:
-            mean_llf = np.nansum(llf, axis=0)
+    if (_X[np.isfinite(_X)] <= 0).any():
+        raise ValueError("Data must be positive.")
+    if _X.ndim == 2 and _X.shape[0] == 1:
+        _X = np.squeeze(_X, axis=0)  # a single record is treated as one variable
 
-        lmbda = l_search[mean_llf == np.nanmax(mean_llf)]
-    if _X.ndim < 2:
-        out = scipy.stats.boxcox(_X, lmbda)
-    elif _X.shape[0] == 1:
-        out = scipy.stats.boxcox(np.squeeze(_X), lmbda)
-    else:
-        out = np.apply_along_axis(scipy.stats.boxcox, 0, _X, lmbda)
+    if lmbda is None:
+        lmbda = boxcox_lmbda(
+            _X,
+            lmbda_search_space=lmbda_search_space,
+            search_steps=search_steps,
+            per_column=per_column and _X.ndim == 2,
+            refine=refine,
+            n_jobs=n_jobs,
+        )
+    out = scipy.special.boxcox(_X, lmbda)
 
     if isinstance(_X, pd.DataFrame) or isinstance(_X, pd.Series):
         _out = X.copy()
@@ -309,8 +537,9 @@ def inverse_boxcox(Y: np.ndarray, lmbda):
     ---------------
     Y : :class:`numpy.ndarray`
         Array on which to perform the transformation.
-    lmbda : :class:`float`
-        Lambda value used to forward-transform values.
+    lmbda : :class:`float` | :class:`numpy.ndarray`
+        Lambda value(s) used to forward-transform values, either a single value or one
+        for each column.
 
     Returns
     -------
@@ -13,11 +13,12 @@ from ..util import units
 from . import parse
 from . import transform
 from . import norm
+from . import alteration
+from .lazy import LazyChain
 from .ind import (
     common_elements,
     common_oxides,
-    __common_elements__,
-    __common_oxides__,
+    _column_index,
     REE,
 )
 
@@ -37,6 +38,22 @@ class pyrochem(object):
     def _validate(obj):
         pass
 
+    @property
+    def _columns(self):
+        """
+        Get the classification of the columns of the dataframe (see
+        :func:`~pyrolite.geochem.ind._column_index`), which is cached for each set
+        of columns.
+        """
+        return _column_index(tuple(self._obj.columns))
+
+    def _subset(self, kind):
+        """
+        Get a copy of a subset of the dataframe, taken by column positions.
+        """
+        positions, _ = self._columns[kind]
+        return self._obj.iloc[:, positions].copy()
+
     # pyrolite.geochem.ind functions
 
     @property
@@ -52,8 +69,7 @@ class pyrochem(object):
         -------
         The list will have the same ordering as the source DataFrame.
         """
-        fltr = self._obj.columns.isin(__common_elements__)
-        return self._obj.columns[fltr].tolist()
+        return list(self._columns["elements"][1])
 
     @property
     def list_REE(self):
@@ -68,7 +84,7 @@ class pyrochem(object):
         -------
         The returned list will reorder REE based on atomic number.
         """
-        return [i for i in REE() if i in self._obj.columns]
+        return list(self._columns["REE"][1])
 
     @property
     def list_oxides(self):
@@ -83,12 +99,11 @@ class pyrochem(object):
         -------
         The list will have the same ordering as the source DataFrame.
         """
-        fltr = self._obj.columns.isin(__common_oxides__)
-        return self._obj.columns[fltr].tolist()
+        return list(self._columns["oxides"][1])
 
     @property
     def list_compositional(self):
-        return list(self.list_oxides + self.list_elements)
+        return list(self._columns["compositional"][1])
 
     @property
     def elements(self):
@@ -99,7 +114,7 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj[self.list_elements]
+        return self._subset("elements")
 
     @elements.setter
     def elements(self, df):
@@ -114,7 +129,7 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj[self.list_REE]
+        return self._subset("REE")
 
     @REE.setter
     def REE(self, df):
@@ -129,7 +144,7 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj.loc[:, self.list_oxides]
+        return self._subset("oxides")
 
     @oxides.setter
     def oxides(self, df):
@@ -144,7 +159,7 @@ class pyrochem(object):
         --------
         :class:`pandas.Dataframe`
         """
-        return self._obj.loc[:, self.list_compositional]
+        return self._subset("compositional")
 
     @compositional.setter
     def compositional(self, df):
@@ -170,6 +185,24 @@ class pyrochem(object):
 
     # pyrolite.geochem.transform functions
 
+    def lazy(self):
+        """
+        Start a deferred chain of transformations, which are fused and evaluated
+        in a single pass when :meth:`~pyrolite.geochem.lazy.LazyChain.compute`
+        is called.
+
+        Returns
+        --------
+        :class:`~pyrolite.geochem.lazy.LazyChain`
+
+        Examples
+        ---------
+        .. code-block:: python
+
+            df.pyrochem.lazy().devolatilise().to_molecular().compute()
+        """
+        return LazyChain(self._obj)
+
     def to_molecular(self, renorm=True):
         """
         Converts mass quantities to molar quantities.
@@ -379,6 +412,37 @@ class pyrochem(object):
             self._obj, ratio, alias, norm_to=norm_to, molecular=molecular
         )
 
+    def get_ratios(
+        self, ratios: list, aliases: list = None, norm_to=None, molecular=False
+    ):
+        """
+        Get a set of ratios of components, each given in the form of string 'A/B'.
+        Each cation is aggregated only once across all of the ratios.
+
+        Parameters
+        -----------
+        ratios : :class:`list`
+            String decriptions of ratios in the form A/B[_n].
+        aliases : :class:`list`
+            Alternate names for ratios to be used as column names.
+        norm_to : :class:`str` | :class:`pyrolite.geochem.norm.Composition` | :class:`dict`, `None`
+            Reference composition to normalise to.
+        molecular : :class:`bool`, :code:`False`
+            Flag that data is in molecular units, rather than weight units.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Dataframe of ratios.
+
+        See Also
+        --------
+        :func:`~pyrolite.geochem.transform.get_ratios`
+        """
+        return transform.get_ratios(
+            self._obj, ratios, aliases=aliases, norm_to=norm_to, molecular=molecular
+        )
+
     def add_ratio(self, ratio: str, alias: str = None, norm_to=None, molecular=False):
         """
         Add a ratio of components A and B, given in the form of string 'A/B'.
@@ -451,6 +515,7 @@ class pyrochem(object):
         degree=4,
         append=[],
         scale="ppm",
+        algorithm=None,
         **kwargs
     ):
         """
@@ -470,9 +535,18 @@ class pyrochem(object):
         degree : :class:`int`, 5
             Maximum degree polynomial fit component to include.
         append : :class:`list`, :code:`None`
-            Whether to append lambda function (i.e. :code:`["function"]`).
+            Additional outputs to append. Options include the lambda function
+            (:code:`"function"`), residuals of the fit in log space
+            (:code:`"residuals"`) and Eu and Ce anomalies relative to the fitted
+            pattern (:code:`"Eu"`, :code:`"Ce"`).
         scale : :class:`str`
             Current units for the REE data, used to scale the reference dataset.
+        algorithm : :class:`str`, :code:`None`
+            Algorithm used to fit the lambdas, either a single linear least squares
+            solution for all rows (:code:`"lstsq"`, equivalent to optimisation with
+            :code:`costf_power=1`) or row-wise optimisation (:code:`"opt"`). By
+            default, :code:`"lstsq"` is used only where :code:`costf_power=1` is
+            given.
 
         References
         -----------
@@ -496,6 +570,7 @@ class pyrochem(object):
             degree=degree,
             append=append,
             scale=scale,
+            algorithm=algorithm,
             **kwargs
         )
 
@@ -534,49 +609,108 @@ class pyrochem(object):
             self._obj, to=to, logdata=logdata, renorm=renorm, molecular=molecular
         )  # can't update the source nicely here, need to assign output
 
+    # pyrolite.geochem.alteration functions
+
+    def alteration_indices(self, indices=None, molecular=False):
+        """
+        Calculate a set of alteration indices.
+
+        Parameters
+        -----------
+        indices : :class:`list`
+            Names of indices to calculate. If unspecified, all indices will be
+            calculated.
+        molecular : :class:`bool`, :code:`False`
+            Flag that data is in molecular units, rather than weight units.
+
+        Returns
+        --------
+        :class:`pandas.DataFrame`
+            Dataframe of alteration indices.
+
+        See Also
+        --------
+        :func:`~pyrolite.geochem.alteration.alteration_indices`
+        """
+        return alteration.alteration_indices(
+            self._obj, indices=indices, molecular=molecular
+        )
+
     # pyrolite.geochem.norm functions
 
-    def normalize_to(self, reference=None, units=None, convert_first=False):
+    def normalize_to(
+        self, reference=None, units=None, convert_first=False, as_array=False
+    ):
         """
         Normalise a dataframe to a given reference composition.
 
         Parameters
         -----------
-        reference : :class:`str` | :class:`~pyrolite.geochem.norm.Composition` | :class:`numpy.ndarray`
-            Reference composition to normalise to.
+        reference : :class:`str` | :class:`~pyrolite.geochem.norm.Composition` | :class:`numpy.ndarray` | :class:`list`
+            Reference composition to normalise to. A list of reference compositions
+            (names or :class:`~pyrolite.geochem.norm.Composition`) can be given to
+            normalise to each of these at once.
         units : :class:`str`
             Units of the input dataframe, to convert the reference composition.
         convert_first : :class:`bool`
             Whether to first convert the referenece compostion before normalisation.
             This is useful where elements are presented as different components (e.g.
             Ti, TiO2).
+        as_array : :class:`bool`
+            Where multiple references are given, whether to return an array of shape
+            :code:`(samples, references, components)` rather than a dataframe.
 
         Returns
         --------
-        :class:`pandas.DataFrame`
-            Dataframe with normalised chemistry.
+        :class:`pandas.DataFrame` | :class:`numpy.ndarray`
+            Dataframe with normalised chemistry. Where multiple references are
+            given, the columns will be a :class:`pandas.MultiIndex` of reference
+            names and components.
 
         Notes
         ------
         This assumes that dataframes have a single set of units.
         """
-
-        if isinstance(reference, (str, norm.Composition)):
-            if not isinstance(reference, norm.Composition):
-                N = norm.get_reference_composition(reference)
-            else:
-                N = reference
-            if units is not None:
-                N.set_units(units)
-            if convert_first:
-                N.comp = transform.convert_chemistry(N.comp, self.list_compositional)
-            norm_abund = N[self.list_compositional]
-        else:  # list, iterable, pd.Index etc
-            norm_abund = np.array(reference)
-            assert len(norm_abund) == len(self.list_compositional)
-
+        cols = self.list_compositional
+        values = self._subset("compositional").values
+        multiple = isinstance(reference, (list, tuple)) and all(
+            isinstance(r, (str, norm.Composition)) for r in reference
+        )
+        if multiple:
+            if not len(reference):
+                raise ValueError("No reference compositions given.")
+            names = [
+                r if isinstance(r, str) else (r.name or str(ix))
+                for ix, r in enumerate(reference)
+            ]
+            if len(set(names)) != len(names):
+                msg = "Reference compositions should be unique, got {}."
+                raise ValueError(msg.format(names))
+            # stack the aligned references for a single broadcast division
+            norm_abund = np.vstack(
+                [
+                    norm.get_reference_abundances(
+                        r, cols, units=units, convert_first=convert_first
+                    )
+                    for r in reference
+                ]
+            )
+            out = np.divide(values[:, np.newaxis, :], norm_abund[np.newaxis, :, :])
+            if as_array:
+                return out
+            return pd.DataFrame(
+                out.reshape(out.shape[0], -1),
+                index=self._obj.index,
+                columns=pd.MultiIndex.from_product([names, cols]),
+            )
+
+        norm_abund = norm.get_reference_abundances(
+            reference, cols, units=units, convert_first=convert_first
+        )
         # this list should have the same ordering as the input dataframe
-        return self._obj[self.list_compositional].div(norm_abund)
+        return pd.DataFrame(
+            np.divide(values, norm_abund), index=self._obj.index, columns=cols,
+        )
 
     def denormalize_from(self, reference=None, units=None):
         """
@@ -599,20 +733,15 @@ class pyrochem(object):
         This assumes that dataframes have a single set of units.
         """
 
-        if isinstance(reference, (str, norm.Composition)):
-            if not isinstance(reference, norm.Composition):
-                N = norm.get_reference_composition(reference)
-            else:
-                N = reference
-            if units is not None:
-                N.set_units(units)
-            N.comp = transform.convert_chemistry(N.comp, self.list_compositional)
-            norm_abund = N[self.list_compositional]
-        else:  # list, iterable, pd.Index etc
-            norm_abund = np.array(reference)
-            assert len(norm_abund) == len(self.list_compositional)
-
-        return self._obj[self.list_compositional] * norm_abund
+        cols = self.list_compositional
+        norm_abund = norm.get_reference_abundances(
+            reference, cols, units=units, convert_first=True
+        )
+        return pd.DataFrame(
+            np.multiply(self._subset("compositional").values, norm_abund),
+            index=self._obj.index,
+            columns=cols,
+        )
 
     def scale(self, in_unit, target_unit="ppm"):
         """
@@ -3,7 +3,9 @@ Functions for calcuating indexes of chemical alteration.
 """
 import numpy as np
 import pandas as pd
+from types import SimpleNamespace
 from ..util.meta import update_docstring_references
+from .ind import get_molecular_weights
 import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -123,3 +125,74 @@ def WIP(df: pd.DataFrame):
 
     """
     return 2 * df.Na2O / 0.35 + df.MgO / 0.9 + 2 * df.K2O / 0.25 + df.CaO / 0.7
+
+
+# indices and the components they require
+__indices__ = {
+    "CIA": (CIA, ["Al2O3", "CaO", "Na2O", "K2O"]),
+    "CIW": (CIW, ["Al2O3", "CaO", "Na2O"]),
+    "PIA": (PIA, ["Al2O3", "CaO", "Na2O", "K2O"]),
+    "SAR": (SAR, ["SiO2", "Al2O3"]),
+    "SiTiIndex": (SiTiIndex, ["SiO2", "TiO2", "Al2O3"]),
+    "WIP": (WIP, ["Na2O", "MgO", "K2O", "CaO"]),
+}
+
+
+def alteration_indices(df: pd.DataFrame, indices=None, molecular=False):
+    """
+    Calculate a set of alteration indices from a single pass over the
+    relevant components.
+
+    Parameters
+    ----------
+    df : :class:`pandas.DataFrame`
+        DataFrame to calculate indices from.
+    indices : :class:`list`
+        Names of indices to calculate (from :code:`"CIA"`, :code:`"CIW"`,
+        :code:`"PIA"`, :code:`"SAR"`, :code:`"SiTiIndex"` and :code:`"WIP"`). If
+        unspecified, all indices will be calculated.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units. Where data is
+        in weight units, components are converted to molecular proportions before
+        calculating the indices.
+
+    Returns
+    --------
+    :class:`pandas.DataFrame`
+        Dataframe of alteration indices.
+
+    Notes
+    ------
+    Molecular proportions are obtained by dividing by molecular weights (i.e. without
+    renormalisation). Indices other than :func:`WIP` are ratios and are invariant
+    to renormalisation; :func:`WIP` is equivalent to that calculated from
+    :code:`to_molecular(df, renorm=False)`. Where components are missing, the
+    dependent indices will be :class:`numpy.nan`.
+
+    See Also
+    ---------
+    :func:`CIA`
+    :func:`CIW`
+    :func:`PIA`
+    :func:`SAR`
+    :func:`SiTiIndex`
+    :func:`WIP`
+    """
+    indices = list(__indices__.keys()) if indices is None else list(indices)
+    unknown = [i for i in indices if i not in __indices__]
+    if unknown:
+        raise KeyError("Unknown alteration indices: {}".format(", ".join(unknown)))
+    components = [c for i in indices for c in __indices__[i][1]]
+    components = list(dict.fromkeys(components))  # unique, ordered
+    missing = [c for c in components if c not in df.columns]
+    if missing:
+        logger.warning("Missing components: {}".format(", ".join(missing)))
+
+    X = df.reindex(columns=components).to_numpy(dtype=float)
+    if not molecular:
+        X /= get_molecular_weights(components)[np.newaxis, :]
+    # the index functions only require attribute access to each component
+    arrays = SimpleNamespace(**dict(zip(components, X.T)))
+    return pd.DataFrame(
+        {i: __indices__[i][0](arrays) for i in indices}, index=df.index, columns=indices
+    )
@@ -8,12 +8,13 @@ Todo
 """
 import re
 import sys
+import json
+import types
 import functools
 from pathlib import Path
 import numpy as np
 import pandas as pd
 import periodictable as pt
-from tinydb import TinyDB, Query
 from ..mineral import ions
 from ..util.text import titlecase, remove_suffix
 from ..util.meta import pyrolite_datafolder, sphinx_doi_link
@@ -23,9 +24,144 @@ logging.getLogger(__name__).addHandler(logging.NullHandler())
 logger = logging.getLogger(__name__)
 
 _shannonradiifile = (pyrolite_datafolder(subfolder="shannon") / "radii.csv").resolve()
-assert _shannonradiifile.exists() and _shannonradiifile.is_file()
-__shannon__ = pd.read_csv(_shannonradiifile).set_index("index", drop=True)
-assert hasattr(__shannon__, "element")
+_geochemdbfile = (pyrolite_datafolder(subfolder="geochem") / "geochemdb.json").resolve()
+
+
+def _index_shannon_radii(table):
+    """
+    Index a table of Shannon radii by element, charge, coordination and variant.
+
+    Parameters
+    -----------
+    table : :class:`pandas.DataFrame`
+        Table of Shannon radii.
+
+    Returns
+    --------
+    radii : :class:`pandas.DataFrame`
+        Table indexed by (element, charge, coordination, variant).
+    unique : :class:`pandas.DataFrame`
+        Subset of the table indexed by (element, charge, coordination), for those
+        combinations which have only one entry.
+    """
+    radii = table.reset_index().assign(variant=table.variant.fillna("").values)
+    radii = radii.set_index(["element", "charge", "coordination", "variant"])
+    radii = radii.sort_index()
+    duplicated = radii.index.droplevel("variant").duplicated(keep=False)
+    unique = radii.loc[~duplicated, :]
+    unique.index = unique.index.droplevel("variant")
+    return radii, unique
+
+
+@functools.lru_cache(maxsize=None)
+def _shannon_radii():
+    """
+    Load and index the table of Shannon radii on first access.
+
+    Returns
+    --------
+    :class:`tuple`
+        Tuple of the table of Shannon radii and the indexed tables
+        (see :func:`_index_shannon_radii`).
+    """
+    assert _shannonradiifile.exists() and _shannonradiifile.is_file()
+    table = pd.read_csv(_shannonradiifile).set_index("index", drop=True)
+    assert hasattr(table, "element")
+    return (table,) + _index_shannon_radii(table)
+
+
+@functools.lru_cache(maxsize=None)
+def _common_components():
+    """
+    Load the collections of common elements and oxides on first access.
+
+    Returns
+    --------
+    :class:`tuple`
+        Tuple of :class:`frozenset` of common elements and common oxides.
+
+    Notes
+    ------
+    The collections are read directly from the geochem database json, and are
+    compiled to sets once per session.
+    """
+    with open(str(_geochemdbfile), "r") as f:
+        tables = json.load(f)
+    collections = {
+        doc["name"]: frozenset(doc["collection"])
+        for table in tables.values()
+        for doc in table.values()
+    }
+    return collections["elements"], collections["oxides"]
+
+
+@functools.lru_cache(maxsize=256)
+def _column_index(columns):
+    """
+    Classify a set of columns as elements, oxides and REE, once for each set of
+    columns.
+
+    Parameters
+    -----------
+    columns : :class:`tuple`
+        Column labels.
+
+    Returns
+    --------
+    :class:`dict`
+        Dictionary of :code:`(positions, labels)` for each of :code:`"elements"`,
+        :code:`"oxides"`, :code:`"REE"` and :code:`"compositional"`, where positions
+        are read-only integer arrays. REE are ordered by atomic number, other
+        subsets follow the order of the columns (oxides preceding elements for
+        :code:`"compositional"`).
+    """
+    elements, oxides = _common_components()
+    locations = {}
+    for ix, c in enumerate(columns):
+        locations.setdefault(c, []).append(ix)
+    positions = {
+        "elements": [ix for ix, c in enumerate(columns) if c in elements],
+        "oxides": [ix for ix, c in enumerate(columns) if c in oxides],
+        "REE": [ix for el in REE() for ix in locations.get(el, [])],
+    }
+    positions["compositional"] = positions["oxides"] + positions["elements"]
+    index = {}
+    for kind, pos in positions.items():
+        pos = np.array(pos, dtype=int)
+        pos.flags.writeable = False
+        index[kind] = (pos, tuple(columns[ix] for ix in pos))
+    return index
+
+
+class _IndModule(types.ModuleType):
+    """
+    Module type providing the module-level data collections, which are loaded on
+    first access.
+    """
+
+    @property
+    def __common_elements__(self):
+        return _common_components()[0]
+
+    @property
+    def __common_oxides__(self):
+        return _common_components()[1]
+
+    @property
+    def __shannon__(self):
+        return _shannon_radii()[0]
+
+    @property
+    def __shannon_index__(self):
+        return _shannon_radii()[1]
+
+    @property
+    def __shannon_unique__(self):
+        return _shannon_radii()[2]
+
+
+# module-level __getattr__ (PEP 562) is not available for Python 3.6
+sys.modules[__name__].__class__ = _IndModule
 
 
 @functools.lru_cache(maxsize=None)  # cache outputs for speed
@@ -156,7 +292,7 @@ def common_oxides(
     * Conditional additional components on the presence of others (e.g. Fe - FeOT)
     """
     if not elements:
-        elements = __common_elements__ - set(exclude)
+        elements = _common_components()[0] - set(exclude)
     else:
         # Check that all elements input are indeed elements..
         pass
@@ -210,6 +346,117 @@ def simple_oxides(cation, output="string"):
     return oxides
 
 
+__component_registry__ = {}
+
+
+def _register_component(component):
+    """
+    Parse a component formula and register its molecular weight and cation
+    stoichiometry in the component registry.
+
+    Parameters
+    -----------
+    component : :class:`str`
+        Component to register.
+
+    Returns
+    --------
+    :class:`tuple`
+        Tuple of molecular weight, cation name, number of cations per formula unit
+        and the mass of the cation.
+    """
+    form = pt.formula(component)
+    cations = [el for el in form.atoms.keys() if not str(el) == "O"]
+    if len(cations) == 1:
+        cation = cations[0]
+        record = (form.mass, str(cation), form.atoms[cation], cation.mass)
+    else:  # not a simple oxide or element
+        record = (form.mass, None, np.nan, np.nan)
+    __component_registry__[component] = record
+    return record
+
+
+def component_registry():
+    """
+    Get a table of molecular weights and cation stoichiometry for components,
+    building the registry for common elements and oxides on first access.
+
+    Returns
+    --------
+    :class:`pandas.DataFrame`
+        Table indexed by component, with columns :code:`mass`, :code:`cation`,
+        :code:`cations` (number of cations per formula unit) and :code:`cation_mass`.
+    """
+    if not getattr(component_registry, "_built", False):
+        elements, oxides = _common_components()
+        for c in elements | oxides:
+            if c not in __component_registry__:
+                try:
+                    _register_component(c)
+                except Exception:  # e.g. LOI
+                    pass
+        component_registry._built = True
+    return pd.DataFrame.from_dict(
+        __component_registry__,
+        orient="index",
+        columns=["mass", "cation", "cations", "cation_mass"],
+    )
+
+
+def _component_records(components):
+    """
+    Get registry records for a set of components, parsing and registering any
+    components which have not yet been encountered.
+    """
+    return [
+        __component_registry__.get(str(c)) or _register_component(str(c))
+        for c in components
+    ]
+
+
+def get_molecular_weights(components):
+    """
+    Get molecular weights for a set of components.
+
+    Parameters
+    -----------
+    components : :class:`list`
+        Components to obtain molecular weights for.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+    """
+    return np.array([r[0] for r in _component_records(components)], dtype=float)
+
+
+def get_cation_factors(components, molecular=False):
+    """
+    Get factors for converting abundances of a set of components to abundances of
+    their cations (e.g. FeO to Fe equivalent).
+
+    Parameters
+    -----------
+    components : :class:`list`
+        Components to obtain conversion factors for.
+    molecular : :class:`bool`, :code:`False`
+        Whether to obtain factors for molecular data.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Conversion factors, with :class:`numpy.nan` for components which are not
+        simple oxides or elements.
+    """
+    records = _component_records(components)
+    counts = np.array([r[2] for r in records], dtype=float)
+    if molecular:
+        return counts
+    masses = np.array([r[0] for r in records], dtype=float)
+    cation_masses = np.array([r[3] for r in records], dtype=float)
+    return counts * cation_masses / masses
+
+
 def get_cations(component: str, exclude=[], total_suffix="T"):
     """
     Returns the principal cations in an oxide component.
@@ -278,11 +525,13 @@ def get_ionic_radii(element, charge=None, coordination=None, variant=[], pauling
     element : :class:`str` | :class:`list`
         Element to obtain a radii for. If a list is passed, the function will be applied
         over each of the items.
-    charge : :class:`int`
+    charge : :class:`int` | :class:`list`
         Charge of the ion to obtain a radii for. If unspecified will use the default
-        charge from :mod:`pyrolite.mineral.ions`.
-    coordination : :class:`int`
-        Coordination of the ion to obtain a radii for.
+        charge from :mod:`pyrolite.mineral.ions`. Where a list of elements is passed,
+        a list of charges can be given for each.
+    coordination : :class:`int` | :class:`list`
+        Coordination of the ion to obtain a radii for. Where a list of elements is
+        passed, a list of coordinations can be given for each.
     variant : :class:`list`
         List of strings specifying particular variants (here 'squareplanar' or
         'pyramidal', 'highspin' or 'lowspin').
@@ -305,41 +554,69 @@ def get_ionic_radii(element, charge=None, coordination=None, variant=[], pauling
     .. [2] Pauling, L., 1960. The Nature of the Chemical Bond.
             Cornell University Press, Ithaca, NY.
 
+    Notes
+    ------
+    Where a list of elements is passed with charges and coordinations, radii for
+    unique combinations are obtained from the indexed table in a single query.
+
     Todo
     -----
     * Implement interpolation for coordination +/- charge.
     * Finish Shannon Radii tests
     """
-    if isinstance(element, list):
+    if isinstance(element, (list, tuple, np.ndarray, pd.Index)):
+        element = [str(e) for e in element]
+        charges, coordinations = [
+            list(v) if np.iterable(v) else [v] * len(element)
+            for v in [charge, coordination]
+        ]
+        assert len(charges) == len(coordinations) == len(element)
+        result = [None] * len(element)
+        if (not variant) and all(c is not None for c in coordinations):
+            # single vectorised lookup for unique (element, charge, coordination)
+            target = ["crystalradius", "ionicradius"][pauling]
+            _, _, unique = _shannon_radii()
+            lookup = [
+                getattr(pt, e).default_charge if c is None else c
+                for e, c in zip(element, charges)
+            ]
+            ixs = unique.index.get_indexer(
+                pd.MultiIndex.from_arrays([element, lookup, coordinations])
+            )
+            values = unique[target].values
+            result = [values[ix] if ix >= 0 else None for ix in ixs]
+        # entries not found are looked up individually, as for a single element
         return [
             get_ionic_radii(
-                e,
-                charge=charge,
-                coordination=coordination,
-                variant=variant,
-                pauling=pauling,
+                e, charge=c, coordination=co, variant=variant, pauling=pauling
             )
-            for e in element
+            if r is None
+            else r
+            for (e, c, co, r) in zip(element, charges, coordinations, result)
         ]
 
     target = ["crystalradius", "ionicradius"][pauling]
 
-    elfltr = __shannon__.element == element
-    fltrs = elfltr.copy().astype(int)
+    _, radii, _ = _shannon_radii()
+    if element in radii.index.get_level_values("element"):
+        rows = radii.xs(element, level="element", drop_level=False)
+    else:
+        rows = radii.iloc[:0, :]
+
     if charge is not None:
-        if charge in __shannon__.loc[elfltr, "charge"].unique():
-            fltrs *= __shannon__.charge == charge
+        if charge in rows.index.get_level_values("charge"):
+            rows = rows.xs(charge, level="charge", drop_level=False)
         else:
             logging.warn("Charge {:d} not in table.".format(int(charge)))
             # try to interpolate over charge?..
             # interpolate_charge=True
     else:
         charge = getattr(pt, element).default_charge
-        fltrs *= __shannon__.charge == charge
+        rows = rows.loc[rows.index.get_level_values("charge") == charge, :]
 
     if coordination is not None:
-        if coordination in __shannon__.loc[elfltr, "coordination"].unique():
-            fltrs *= __shannon__.coordination == coordination
+        if coordination in rows.index.get_level_values("coordination"):
+            rows = rows.xs(coordination, level="coordination", drop_level=False)
         else:
             logging.warn("Coordination {:d} not in table.".format(int(coordination)))
             # try to interpolate over coordination
@@ -349,9 +626,13 @@ def get_ionic_radii(element, charge=None, coordination=None, variant=[], pauling
 
     if variant:  # todo warning for missing variants
         for v in variant:
-            fltrs *= __shannon__.variant.apply(lambda x: v in x)
+            rows = rows.loc[rows.index.get_level_values("variant").str.contains(v), :]
 
-    result = __shannon__.loc[fltrs.astype(bool), target]
+    result = pd.Series(
+        rows[target].values,
+        index=pd.Index(rows["index"].values, name="index"),
+        name=target,
+    )
     if result.index.size == 1:
         return result.values[0]  # return the specific number
     else:
@@ -407,8 +688,3 @@ def by_incompatibility(els, reverse=False):
 get_ionic_radii.__doc__ = get_ionic_radii.__doc__.replace(
     "shannon1976", sphinx_doi_link("10.1107/S0567739476001551")
 )
-# generate sets
-__db__ = TinyDB(str(pyrolite_datafolder(subfolder="geochem") / "geochemdb.json"))
-__common_elements__ = set(__db__.search(Query().name == "elements")[0]["collection"])
-__common_oxides__ = set(__db__.search(Query().name == "oxides")[0]["collection"])
-__db__.close()
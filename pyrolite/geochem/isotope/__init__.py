@@ -58,6 +58,7 @@ import logging
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 logger = logging.getLogger(__name__)
 
-from .count import deadtime_correction
+from .count import deadtime_correction, block_statistics, reduce_counts
+
 # from .background import *
 # from .isobaric import *
@@ -1,32 +1,212 @@
 import numpy as np
+import pandas as pd
 import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 logger = logging.getLogger(__name__)
 
-def deadtime_correction(data, deadtime):
+
+def deadtime_correction(data, deadtime, method=None, out=None):
     """
     Apply a deadtime correction to count data.
 
     Parameters
     -------------
-    data : :class:`numpy.ndarray`
+    data : :class:`numpy.ndarray` | :class:`pandas.Series` | :class:`pandas.DataFrame`
         Array of count data.
     deadtime : :class:`float`
         Deadtime in nanoseconds.
+    method : :class:`str`
+        Deadtime model to use, either :code:`"paralyzable"` (approximated by nested
+        exponentials) or :code:`"nonparalyzable"`. If unspecified, the paralyzable
+        model will be used for data with a mean below 10,000,000.
+    out : :class:`numpy.ndarray`
+        Array to write the corrected data to. This can be :code:`data` itself
+        (including a memory-mapped array) to correct the data in place.
 
     Returns
     --------
-    :class:`numpy.ndarray`
-        Corrected count data.
+    :class:`numpy.ndarray` | :class:`pandas.Series` | :class:`pandas.DataFrame`
+        Corrected count data, of the same type as :code:`data`.
     """
     dt = deadtime / 10 ** 9  # nanoseconds
+    values = np.asanyarray(data)
+    if method is None:
+        method = ["nonparalyzable", "paralyzable"][bool(np.mean(values) < 10000000)]
+    assert method in ["paralyzable", "nonparalyzable"]
+    if out is None:
+        out = np.empty(values.shape, dtype=np.result_type(values, float))
     # Need to check for overflow and divide by zero errors
-    if np.mean(data) < 10000000:
-        data = data * np.exp(
-            data * dt * np.exp(data * dt * np.exp(data * dt * np.exp(data * dt)))
-        )
+    x = np.multiply(values, dt, out=np.empty(values.shape, dtype=out.dtype))
+    if dt == 0:  # no correction (and avoid dividing by the deadtime below)
+        np.copyto(out, values)
+    elif method == "paralyzable":
+        # data * exp(x * exp(x * exp(x * exp(x)))), evaluated in the output array
+        # such that x = data * dt is the only scratch buffer; out may be data itself
+        np.exp(x, out=out)
+        for _ in range(3):
+            np.multiply(x, out, out=out)
+            np.exp(out, out=out)
+        np.multiply(x, out, out=out)
+        np.divide(out, dt, out=out)
     else:
-        data = data / (1. - (data * dt))
+        np.subtract(1.0, x, out=x)
+        np.divide(values, x, out=out)
+
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(out, index=data.index, columns=data.columns)
+    elif isinstance(data, pd.Series):
+        return pd.Series(out, index=data.index, name=data.name)
+    elif out.ndim == 0:
+        return out[()]
+    return out
+
+
+def block_statistics(ratios, nsigma=2.0, maxiter=10):
+    """
+    Get statistics for blocks of cycle ratios, rejecting outliers from each block
+    by iterative sigma-clipping.
+
+    Parameters
+    -------------
+    ratios : :class:`numpy.ndarray`
+        Array of cycle ratios of shape :code:`(blocks, cycles, ratios)`. Missing
+        cycles can be given as :class:`numpy.nan`.
+    nsigma : :class:`float`
+        Number of standard deviations from the block mean beyond which cycles are
+        rejected. If :code:`None`, no outliers will be rejected.
+    maxiter : :class:`int`
+        Maximum number of rejection iterations.
+
+    Returns
+    --------
+    mean, std, se, n : :class:`numpy.ndarray`
+        Arrays of shape :code:`(blocks, ratios)` of the mean, standard deviation,
+        standard error and number of accepted cycles for each block.
+    """
+    accepted = np.isfinite(ratios)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(maxiter if nsigma is not None else 0):
+            n = accepted.sum(axis=1)
+            masked = np.where(accepted, ratios, 0.0)
+            mean = masked.sum(axis=1) / n
+            resid = np.where(accepted, ratios - mean[:, np.newaxis, :], 0.0)
+            std = np.sqrt((resid ** 2).sum(axis=1) / (n - 1))
+            outlier = np.abs(ratios - mean[:, np.newaxis, :]) > (
+                nsigma * std[:, np.newaxis, :]
+            )  # where the std is undefined, no cycles are rejected
+            keep = accepted & ~outlier
+            if (keep == accepted).all():
+                break
+            accepted = keep
+
+        n = accepted.sum(axis=1)
+        mean = np.where(accepted, ratios, 0.0).sum(axis=1) / n
+        resid = np.where(accepted, ratios - mean[:, np.newaxis, :], 0.0)
+        std = np.sqrt((resid ** 2).sum(axis=1) / (n - 1))
+        se = std / np.sqrt(n)
+    return mean, std, se, n
+
+
+def reduce_counts(
+    counts,
+    ratios,
+    cycles_per_block,
+    deadtime=None,
+    blank=None,
+    nsigma=2.0,
+    maxiter=10,
+    deadtime_method="paralyzable",
+    inplace=False,
+    chunksize=None,
+):
+    """
+    Reduce ion-counting data to block ratio statistics, processing blocks of
+    cycles in chunks such that large (e.g. memory-mapped) arrays can be streamed.
+
+    Parameters
+    -------------
+    counts : :class:`numpy.ndarray`
+        Array of count data of shape :code:`(cycles, channels)`.
+    ratios : :class:`list`
+        List of :code:`(numerator, denominator)` channel indexes for ratios.
+    cycles_per_block : :class:`int`
+        Number of cycles in each block. Where the number of cycles is not a multiple
+        of this, the final block will contain the remaining cycles.
+    deadtime : :class:`float`
+        Deadtime in nanoseconds. If unspecified, no deadtime correction is applied.
+    blank : :class:`numpy.ndarray`
+        Blank counts for each channel, which are subtracted from each cycle (after
+        deadtime correction).
+    nsigma : :class:`float`
+        Number of standard deviations from the block mean beyond which cycles are
+        rejected (see :func:`block_statistics`).
+    maxiter : :class:`int`
+        Maximum number of rejection iterations.
+    deadtime_method : :class:`str`
+        Deadtime model to use (see :func:`deadtime_correction`). Unlike
+        :func:`deadtime_correction`, this defaults to :code:`"paralyzable"` rather
+        than choosing a model based on the mean counts, as that choice would
+        otherwise be made separately for each chunk.
+    inplace : :class:`bool`
+        Whether to write the deadtime and blank corrected counts back to
+        :code:`counts` (which should then be a floating point array, e.g. a
+        memory-mapped array opened with :code:`mmap_mode="r+"`).
+    chunksize : :class:`int`
+        Number of blocks to process at a time. By default, all blocks are processed
+        at once.
+
+    Returns
+    --------
+    :class:`pandas.DataFrame`
+        Dataframe indexed by block, with columns for the :code:`mean`, :code:`std`,
+        :code:`se` and :code:`n` for each ratio.
+
+    Examples
+    ---------
+    .. code-block:: python
+
+        counts = np.load("counts.npy", mmap_mode="r")
+        stats = reduce_counts(counts, [(0, 1), (2, 1)], 20, deadtime=20, chunksize=100)
+    """
+    ncycles, nchannels = counts.shape
+    nblocks = -(-ncycles // cycles_per_block)  # ceiling division
+    chunksize = chunksize or max(nblocks, 1)
+    num, den = np.array(ratios, dtype=int).T.reshape(2, -1)
+    if blank is not None:
+        blank = np.asarray(blank, dtype=float)
+
+    stats = [np.empty((nblocks, num.size)) for _ in range(4)]
+    for start in range(0, nblocks, chunksize):
+        stop = min(start + chunksize, nblocks)
+        rows = slice(start * cycles_per_block, stop * cycles_per_block)
+        if inplace:
+            chunk = counts[rows]
+        else:
+            chunk = np.array(counts[rows], dtype=float)
+        if deadtime is not None:
+            deadtime_correction(chunk, deadtime, method=deadtime_method, out=chunk)
+        if blank is not None:
+            np.subtract(chunk, blank, out=chunk)
+        if inplace and isinstance(counts, np.memmap):
+            counts.flush()
+
+        # cycle ratios, padded with nan to complete the final block
+        cycle_ratios = np.full(((stop - start) * cycles_per_block, num.size), np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.divide(chunk[:, num], chunk[:, den], out=cycle_ratios[: chunk.shape[0]])
+        cycle_ratios = cycle_ratios.reshape(stop - start, cycles_per_block, -1)
+        block = block_statistics(cycle_ratios, nsigma=nsigma, maxiter=maxiter)
+        for stat, values in zip(stats, block):
+            stat[start:stop] = values
 
-    return data
+    names = ["{}/{}".format(n, d) for n, d in zip(num, den)]
+    columns = pd.MultiIndex.from_product([names, ["mean", "std", "se", "n"]])
+    out = pd.DataFrame(
+        np.stack(stats, axis=-1).reshape(nblocks, -1),
+        index=pd.RangeIndex(nblocks, name="block"),
+        columns=columns,
+    )
+    for name in names:
+        out[(name, "n")] = out[(name, "n")].astype(int)
+    return out
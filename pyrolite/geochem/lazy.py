@@ -0,0 +1,199 @@
+"""
+Deferred evaluation of chains of geochemical transformations, which can be fused
+and materialised as a single dataframe.
+"""
+import numpy as np
+import pandas as pd
+from ..util import units
+from .ind import get_molecular_weights
+from . import transform
+
+import logging
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+logger = logging.getLogger(__name__)
+
+
+class LazyChain(object):
+    """
+    Records a chain of transformations for a dataframe, which are evaluated only
+    when :meth:`~LazyChain.compute` is called.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to transform.
+
+    Notes
+    ------
+    Unit conversions and molecular/weight conversions are accumulated as a single
+    scaling factor per column, dropped columns are never copied and only the last
+    renormalisation in a chain is evaluated (earlier row scalings cancel). Iron
+    recalculation only materialises the iron species. The output dataframe is
+    then allocated and filled once, rather than once for each step in the chain.
+
+    Examples
+    ---------
+    .. code-block:: python
+
+        df.pyrochem.lazy().devolatilise().recalculate_Fe("FeOT").to_molecular().compute()
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._ops = []
+
+    def __repr__(self):
+        return "{}({})".format(
+            self.__class__.__name__, " -> ".join([op for (op, _) in self._ops])
+        )
+
+    def _record(self, op, **kwargs):
+        self._ops.append((op, kwargs))
+        return self
+
+    def to_molecular(self, renorm=True):
+        """
+        Defer conversion of mass quantities to molar quantities.
+
+        See Also
+        ---------
+        :func:`~pyrolite.geochem.transform.to_molecular`
+        """
+        return self._record("to_molecular", renorm=renorm)
+
+    def to_weight(self, renorm=True):
+        """
+        Defer conversion of molar quantities to mass quantities.
+
+        See Also
+        ---------
+        :func:`~pyrolite.geochem.transform.to_weight`
+        """
+        return self._record("to_weight", renorm=renorm)
+
+    def devolatilise(
+        self, exclude=["H2O", "H2O_PLUS", "H2O_MINUS", "CO2", "LOI"], renorm=True
+    ):
+        """
+        Defer exclusion of volatile components.
+
+        See Also
+        ---------
+        :func:`~pyrolite.geochem.transform.devolatilise`
+        """
+        return self._record("devolatilise", exclude=list(exclude), renorm=renorm)
+
+    def recalculate_Fe(
+        self, to="FeOT", renorm=False, total_suffix="T", molecular=False
+    ):
+        """
+        Defer recalculation of iron speciation.
+
+        See Also
+        ---------
+        :func:`~pyrolite.geochem.transform.recalculate_Fe`
+        """
+        return self._record(
+            "recalculate_Fe",
+            to=to,
+            renorm=renorm,
+            total_suffix=total_suffix,
+            molecular=molecular,
+        )
+
+    def renormalise(self, scale=100.0):
+        """
+        Defer renormalisation of the dataframe.
+
+        See Also
+        ---------
+        :func:`~pyrolite.comp.codata.renormalise`
+        """
+        return self._record("renormalise", scale=scale)
+
+    def scale(self, in_unit, target_unit="ppm"):
+        """
+        Defer scaling of the dataframe from one set of units to another.
+
+        See Also
+        ---------
+        :func:`~pyrolite.util.units.scale`
+        """
+        return self._record("scale", in_unit=in_unit, target_unit=target_unit)
+
+    def compute(self):
+        """
+        Evaluate the recorded chain of transformations.
+
+        Returns
+        --------
+        :class:`pandas.DataFrame`
+            Transformed dataframe.
+        """
+        columns = list(self._df.columns)
+        arrays = {c: self._df[c].to_numpy(dtype=float) for c in columns}
+        factors = {c: 1.0 for c in columns}
+        norm = None  # (snapshot of (array, factor) pairs, closure scale)
+
+        def _snapshot(scale=100.0):
+            return [(arrays[c], factors[c]) for c in columns], scale
+
+        for op, kwargs in self._ops:
+            if op in ["to_molecular", "to_weight"]:
+                MWs = get_molecular_weights(columns)
+                if op == "to_molecular":
+                    MWs = 1.0 / MWs
+                for c, mw in zip(columns, MWs):
+                    factors[c] *= mw
+                if kwargs["renorm"]:
+                    norm = _snapshot()
+            elif op == "scale":
+                f = units.scale(kwargs["in_unit"], kwargs["target_unit"])
+                for c in columns:
+                    factors[c] *= f
+            elif op == "devolatilise":
+                columns = [c for c in columns if c not in kwargs["exclude"]]
+                if kwargs["renorm"]:
+                    norm = _snapshot()
+            elif op == "renormalise":
+                norm = _snapshot(scale=kwargs["scale"])
+            elif op == "recalculate_Fe":
+                # row scalings are positive and commute with the recalculation
+                species, _ = transform._cation_sum_plan(
+                    tuple(columns), ("Fe",), total_suffix=kwargs["total_suffix"]
+                )
+                fe = pd.DataFrame(
+                    {s: arrays[s] * factors[s] for s in species}, index=self._df.index
+                )
+                fe = transform.recalculate_Fe(
+                    fe,
+                    to=kwargs["to"],
+                    total_suffix=kwargs["total_suffix"],
+                    molecular=kwargs["molecular"],
+                )
+                columns = [c for c in columns if c not in species or c in fe.columns]
+                for c in fe.columns:
+                    arrays[c], factors[c] = fe[c].to_numpy(dtype=float), 1.0
+                    if c not in columns:
+                        columns.append(c)
+                if kwargs["renorm"]:
+                    norm = _snapshot()
+            else:
+                raise NotImplementedError("Unknown operation: {}".format(op))
+
+        out = np.empty((self._df.index.size, len(columns)))
+        for ix, c in enumerate(columns):
+            np.multiply(arrays[c], factors[c], out=out[:, ix])
+
+        if norm is not None:
+            snapshot, scale = norm
+            total = np.zeros(out.shape[0])
+            for arr, f in snapshot:
+                v = arr * f
+                total += np.where(np.isnan(v), 0.0, v)
+            total[total == 0] = 100.0
+            out *= (scale / total)[:, np.newaxis]
+
+        logger.debug("Evaluated {}".format(self))
+        return pd.DataFrame(out, index=self._df.index, columns=columns)
@@ -5,7 +5,7 @@ functions for predicting and accounting for melt evolution.
 import numpy as np
 import pandas as pd
 import periodictable as pt
-from .ind import __common_elements__, __common_oxides__
+from .ind import _common_components
 from .transform import to_molecular, to_weight
 from ..util.meta import update_docstring_references
 from ..util.units import scale
@@ -96,7 +96,17 @@ def NaAt8MgO(Na2O: float, MgO: float) -> float:
 
 
 @update_docstring_references
-def SCSS(df, T, P, kelvin=False, grid=None, outunit="wt%"):
+def SCSS(
+    df,
+    T,
+    P,
+    kelvin=False,
+    grid=None,
+    outunit="wt%",
+    dtype="float",
+    out=None,
+    chunksize=None,
+):
     r"""
     Obtain the sulfur content at sulfate and sulfide saturation [#ref_1]_ [#ref_2]_.
 
@@ -113,12 +123,39 @@ def SCSS(df, T, P, kelvin=False, grid=None, outunit="wt%"):
     grid : :code:`None`, :code:`'geotherm'`, :code:`'grid'`
         Whether to consider temperature and pressure as a geotherm (:code:`geotherm`),
         or independently (as a grid, :code:`grid`).
+    outunit : :class:`str`
+        Units for the output abundances.
+    dtype : :class:`str` | :class:`numpy.dtype`
+        Data type of the output arrays (e.g. :code:`"float32"` to halve the memory
+        footprint of large grids). Ignored where :code:`out` is given.
+    out : :class:`tuple`
+        Tuple of preallocated arrays :code:`(sulfate, sulfide)` to write the output
+        to, which can be memory-mapped arrays (see Examples).
+    chunksize : :class:`int`
+        Number of samples to evaluate at a time (by default, all samples are
+        evaluated at once). Memory-mapped outputs are flushed after each chunk.
 
     Returns
     -------
     sulfate, sulfide : :class:`numpy.ndarray`, :class:`numpy.ndarray`
         Arrays of mass fraction sulfate and sulfide abundances at saturation.
 
+    Examples
+    ---------
+    For large temperature-pressure grids, saturation maps can be streamed to disk
+    by providing memory-mapped output arrays:
+
+    .. code-block:: python
+
+        from numpy.lib.format import open_memmap
+
+        shape = (df.index.size, T.size, P.size)
+        out = tuple(
+            open_memmap(f, mode="w+", dtype="float32", shape=shape)
+            for f in ["sulfate.npy", "sulfide.npy"]
+        )
+        sulfate, sulfide = SCSS(df, T, P, grid="grid", out=out, chunksize=1000)
+
     Notes
     ------
 
@@ -170,66 +207,95 @@ def SCSS(df, T, P, kelvin=False, grid=None, outunit="wt%"):
     * Produce an updated version based on log-regressions?
     * Add updates from Smythe et al. (2017)?
     """
-    T, P = np.array(T, dtype="float"), np.array(P, dtype="float")
+    T, P = np.atleast_1d(np.array(T, dtype="float"), np.array(P, dtype="float"))
     if not kelvin:
         T = T + 273.15
 
-    C = np.ones(df.index.size)
+    n = df.index.size
     assert grid in [None, "geotherm", "grid"]
     if grid == "grid":
-        cc, tt, pp = np.meshgrid(C, T, P, indexing="ij")
+        shape = (n, T.size, P.size)
     elif grid == "geotherm":
         assert T.shape == P.shape
-        cc = C[:, np.newaxis]
-        tt = T[np.newaxis, :]
-        pp = P[np.newaxis, :]
+        shape = (n, T.size)
     elif grid is None:
-        _dims = C.size, T.size, P.size
+        _dims = n, T.size, P.size
         maxdim = max(_dims)
         assert all([x == maxdim or x == 1 for x in _dims])
-        cc, tt, pp = C, T, P
+        shape = (maxdim,)
 
-    comp = set(df.columns) & (__common_elements__ | __common_oxides__)
+    elements, oxides = _common_components()
+    comp = [c for c in df.columns if c in (elements | oxides)]
     moldf = to_molecular(df.loc[:, comp], renorm=True) / 100.0  # mole-fraction
-    molsum = to_molecular(df.loc[:, comp], renorm=False).sum(axis=1)
+    moldf = moldf.fillna(0)
+    molsum = to_molecular(df.loc[:, comp], renorm=False).sum(axis=1).values
 
-    def gridify(ser):
+    def sample_factor(const, coeffs, mass):
         """
-        Create a parameter grid from a pandas series to facilitate
-        array-addition of each component.
+        Get the compositional component of the abundance for each sample, including
+        the conversion to mass fraction.
         """
-        arr = ser.replace(np.nan, 0).values
-        if grid == "grid":
-            return arr[:, np.newaxis, np.newaxis]
-        elif grid == "geotherm":
-            return arr[:, np.newaxis]
-        elif grid is None:
-            return arr
-
-    ln_sulfate = 10.07 * cc - 1.151 * 10 ** 4 / tt + 0.104 * pp
-    for chem, D in [("SiO2", -7.1), ("MgO", -14.02), ("Al2O3", -14.164)]:
-        if chem in moldf.columns:
-            ln_sulfate += gridify(moldf[chem]) * D * cc
-
-    ln_sulfide = -1.76 * cc - 0.474 * 10 ** 4 / tt + 0.021 * pp
-
-    for chem, D in [
-        ("FeO", 5.559),
-        ("TiO2", 2.565),
-        ("CaO", 2.709),
-        ("SiO2", -3.192),
-        ("H2O", -3.049),
-    ]:
-        if chem in moldf.columns:
-            ln_sulfide += gridify(moldf[chem]) * D * cc
-
-    sulfate, sulfide = np.exp(ln_sulfate), np.exp(ln_sulfide)
-
-    _s = gridify(molsum * pt.S.mass) * scale("wt%", outunit)
-    _so4 = gridify(molsum * pt.formula("SO4").mass) * scale("wt%", outunit)
-    sulfide *= _s
-    sulfate *= _so4
+        ln = np.full(n, const)
+        for chem, D in coeffs:
+            if chem in moldf.columns:
+                ln += moldf[chem].values * D
+        return np.exp(ln) * molsum * mass * scale("wt%", outunit)
 
+    def TP_factor(a, b):
+        """
+        Get the temperature and pressure component of the abundance, exp(a/T + bP).
+        """
+        if grid == "grid":
+            return np.exp(a / T)[:, np.newaxis] * np.exp(b * P)[np.newaxis, :]
+        return np.exp(a / T + b * P)
+
+    # the model is separable; the abundances are the product of the factors
+    sample_factors = [
+        sample_factor(
+            10.07,
+            [("SiO2", -7.1), ("MgO", -14.02), ("Al2O3", -14.164)],
+            pt.formula("SO4").mass,
+        ),
+        sample_factor(
+            -1.76,
+            [
+                ("FeO", 5.559),
+                ("TiO2", 2.565),
+                ("CaO", 2.709),
+                ("SiO2", -3.192),
+                ("H2O", -3.049),
+            ],
+            pt.S.mass,
+        ),
+    ]
+    TP_factors = [
+        TP_factor(-1.151 * 10 ** 4, 0.104),
+        TP_factor(-0.474 * 10 ** 4, 0.021),
+    ]
+    if grid is not None:  # add axes for broadcasting
+        sample_factors = [
+            f.reshape((n,) + (1,) * (len(shape) - 1)) for f in sample_factors
+        ]
+        TP_factors = [f[np.newaxis, ...] for f in TP_factors]
+
+    if out is None:
+        out = tuple(np.empty(shape, dtype=dtype) for _ in range(2))
+    assert all([o.shape == shape for o in out])
+
+    chunksize = chunksize or max(shape[0], 1)
+    for ix in range(0, shape[0], chunksize):
+        rows = slice(ix, ix + chunksize)
+        for sf, tpf, o in zip(sample_factors, TP_factors, out):
+            np.multiply(
+                sf if sf.shape[0] == 1 else sf[rows],
+                tpf if tpf.shape[0] == 1 else tpf[rows],
+                out=o[rows],
+            )
+        for o in out:
+            if isinstance(o, np.memmap):
+                o.flush()
+
+    sulfate, sulfide = out
     if sulfate.size == 1:  # 0D
         return sulfate.flatten()[0], sulfide.flatten()[0]
     else:  # 2D
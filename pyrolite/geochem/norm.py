@@ -8,6 +8,9 @@ import pandas as pd
 import numpy as np
 from tinydb import TinyDB, Query
 import json
+import threading
+import functools
+from copy import deepcopy
 from ..comp import *
 from ..util.pd import to_frame
 from ..util.units import scale
@@ -19,10 +22,13 @@ logger = logging.getLogger(__name__)
 
 __dbfile__ = pyrolite_datafolder(subfolder="geochem") / "refdb.json"
 
+__reference_registry__ = {}
+__reference_registry_lock__ = threading.Lock()
 
-def all_reference_compositions(path=None):
+
+def _load_reference_compositions(path):
     """
-    Get a dictionary of all reference compositions indexed by name.
+    Load all reference compositions from a reference database.
 
     Parameters
     -----------
@@ -32,17 +38,75 @@ def all_reference_compositions(path=None):
     --------
     :class:`dict`
     """
-    if path is None:
-        path = __dbfile__
     with TinyDB(str(path)) as db:
         refs = {}
-        for r in db.table().all():
+        for r in db.all():
             n, c = r["name"], r["composition"]
             refs[n] = Composition(json.loads(c), name=n)
         db.close()
     return refs
 
 
+def reference_registry():
+    """
+    Get the registry of reference compositions, which is loaded from the reference
+    database once and shared between calls.
+
+    Returns
+    --------
+    :class:`dict`
+        Dictionary of immutable reference compositions indexed by name.
+
+    Notes
+    ------
+    The compositions in the registry are shared, and are frozen to avoid
+    modification; their data are accessed as copies, and unit conversion with
+    :meth:`Composition.set_units` will raise an error. Use
+    :meth:`Composition.copy` (or :func:`get_reference_composition`) to obtain a
+    modifiable copy.
+    """
+    if not __reference_registry__:
+        with __reference_registry_lock__:
+            if not __reference_registry__:  # may have been built while waiting
+                refs = _load_reference_compositions(__dbfile__)
+                for ref in refs.values():
+                    ref._freeze()
+                __reference_registry__.update(refs)
+    return __reference_registry__
+
+
+def clear_reference_registry():
+    """
+    Clear the registry of reference compositions, such that they will be reloaded
+    from the reference database when next accessed.
+    """
+    with __reference_registry_lock__:
+        __reference_registry__.clear()
+        _aligned_reference_abundances.cache_clear()
+
+
+def all_reference_compositions(path=None):
+    """
+    Get a dictionary of all reference compositions indexed by name.
+
+    Parameters
+    -----------
+    path : :class:`str` | :class:`pathlib.Path`
+
+    Returns
+    --------
+    :class:`dict`
+
+    Notes
+    ------
+    Compositions from the default reference database are modifiable copies of
+    those in the shared registry (see :func:`reference_registry`).
+    """
+    if path is None or Path(path) == __dbfile__:
+        return {name: ref.copy() for name, ref in reference_registry().items()}
+    return _load_reference_compositions(path)
+
+
 def get_reference_composition(name):
     """
     Retrieve a particular composition from the reference database.
@@ -55,14 +119,114 @@ def get_reference_composition(name):
     Returns
     --------
     :class:`pyrolite.geochem.norm.Composition`
+
+    Notes
+    ------
+    The returned composition is a modifiable copy of that in the shared registry
+    (see :func:`reference_registry`), which avoids re-reading the reference database.
     """
-    with TinyDB(str(__dbfile__)) as db:
-        res = db.search(Query().name == name)
-        db.close()
-    assert len(res) == 1
-    res = res[0]
-    name, composition = res["name"], res["composition"]
-    return Composition(json.loads(composition), name=name)
+    return _shared_reference_composition(name).copy()
+
+
+def _shared_reference_composition(name):
+    """
+    Get a shared (immutable) composition from the reference registry, for internal
+    use where the composition is not modified.
+    """
+    registry = reference_registry()
+    assert name in registry, "Unknown reference composition: {}".format(name)
+    return registry[name]
+
+
+def _reference_abundances(N, columns, units=None, convert_first=False):
+    """
+    Get abundances from a reference composition aligned to a set of columns.
+
+    Parameters
+    ------------
+    N : :class:`Composition`
+        Reference composition.
+    columns : :class:`tuple`
+        Columns to align the abundances to.
+    units : :class:`str`
+        Units to convert the reference composition to.
+    convert_first : :class:`bool`
+        Whether to first convert the reference composition to the components
+        given by the columns.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+    """
+    comp = N.comp
+    if (units is not None) and (N.units is not None):  # leave N unmodified
+        comp = comp * N.units.apply(scale, target_unit=units).astype(float)
+    if convert_first:
+        from .transform import convert_chemistry  # avoid circular import
+
+        comp = convert_chemistry(comp, list(columns))
+    return comp.reindex(columns=[str(c) for c in columns]).values.flatten()
+
+
+@functools.lru_cache(maxsize=256)
+def _aligned_reference_abundances(name, columns, units=None, convert_first=False):
+    """
+    Cached and aligned abundances for a composition from the reference registry.
+    See :func:`get_reference_abundances`.
+    """
+    vec = _reference_abundances(
+        _shared_reference_composition(name),
+        columns,
+        units=units,
+        convert_first=convert_first,
+    ).astype(float)
+    vec.setflags(write=False)  # shared between calls
+    return vec
+
+
+def get_reference_abundances(reference, columns, units=None, convert_first=False):
+    """
+    Get abundances from a reference composition aligned to a set of columns, for
+    normalisation.
+
+    Parameters
+    ------------
+    reference : :class:`str` | :class:`Composition` | :class:`numpy.ndarray`
+        Reference composition, or an array of abundances.
+    columns : :class:`list`
+        Columns to align the abundances to.
+    units : :class:`str`
+        Units to convert the reference composition to.
+    convert_first : :class:`bool`
+        Whether to first convert the reference composition to the components
+        given by the columns. This is useful where elements are presented as
+        different components (e.g. Ti, TiO2).
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Array of abundances with the same ordering as the columns.
+
+    Notes
+    ------
+    Abundances for compositions in the reference registry are cached by reference
+    name, units and columns, and should not be modified.
+    """
+    columns = tuple(columns)
+    if isinstance(reference, Composition) and reference._frozen:
+        reference = reference.name  # shared reference compositions are cached
+    if isinstance(reference, str):
+        return _aligned_reference_abundances(
+            reference, columns, units=units, convert_first=convert_first
+        )
+    elif isinstance(reference, Composition):
+        return _reference_abundances(
+            reference, columns, units=units, convert_first=convert_first
+        )
+    else:  # list, iterable, pd.Index etc
+        vec = np.array(reference)
+        assert len(vec) == len(columns)
+        return vec
 
 
 def get_reference_files(directory=None, formats=["csv"]):
@@ -108,12 +272,15 @@ def update_database(path=None, encoding="cp1252", **kwargs):
                 {"name": C.name, "composition": C._df.T.to_json(force_ascii=False)}
             )
         db.close()
+    if Path(path) == __dbfile__:
+        clear_reference_registry()
 
 
 class Composition(object):
     def __init__(
         self, src, name=None, reference=None, reservoir=None, source=None, **kwargs
     ):
+        self._frozen = False
         self.comp = None
         self.units = None
         self.unc_2sigma = None
@@ -176,6 +343,63 @@ class Composition(object):
                 np.float
             )
 
+    @property
+    def comp(self):
+        if self._frozen:  # shared data are only accessed as copies
+            return self._comp.copy()
+        return self._comp
+
+    @comp.setter
+    def comp(self, value):
+        self._comp = value
+
+    @property
+    def units(self):
+        if self._frozen and (self._units is not None):
+            return self._units.copy()
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        self._units = value
+
+    @property
+    def unc_2sigma(self):
+        if self._frozen and (self._unc_2sigma is not None):
+            return self._unc_2sigma.copy()
+        return self._unc_2sigma
+
+    @unc_2sigma.setter
+    def unc_2sigma(self, value):
+        self._unc_2sigma = value
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "Shared reference compositions are immutable, use .copy() to "
+                "obtain a modifiable composition."
+            )
+        object.__setattr__(self, name, value)
+
+    def _freeze(self):
+        """
+        Prevent further modification of the composition.
+        """
+        self._frozen = True
+        return self
+
+    def copy(self):
+        """
+        Get a modifiable copy of the composition.
+
+        Returns
+        --------
+        :class:`Composition`
+        """
+        new = deepcopy(self)
+        object.__setattr__(new, "_frozen", False)
+        return new
+
     def set_units(self, to="wt%"):
         """
         Set the units of the dataframe.
@@ -183,7 +407,24 @@ class Composition(object):
         Parameters
         ------------
         to : :class:`str`, :code:`"wt%"`
+
+        Returns
+        --------
+        :class:`Composition`
+            Composition with updated units.
+
+        Notes
+        ------
+        Immutable (shared) compositions cannot be converted; use
+        :meth:`Composition.copy` to obtain a modifiable composition.
         """
+        if self._frozen:
+            raise AttributeError(
+                "Shared reference compositions are immutable, use "
+                ".copy().set_units({}) to obtain a converted composition.".format(
+                    repr(to)
+                )
+            )
         scales = self.units.apply(scale, target_unit=to).astype(np.float)
         self.comp *= scales
         self.units[:] = to
@@ -202,7 +443,7 @@ class Composition(object):
             vars = [v if isinstance(v, str) else str(v) for v in vars]
         else:
             vars = [str(vars)]
-        qry = self.comp.reindex(columns=vars).values.flatten()
+        qry = self._comp.reindex(columns=vars).values.flatten()
         if len(qry) == 1:
             qry = qry[0]
         return qry
@@ -6,8 +6,7 @@ import functools
 import pandas as pd
 from ..util.text import titlecase
 from .ind import (
-    __common_oxides__,
-    __common_elements__,
+    _common_components,
     get_cations,
     common_elements,
     common_oxides,
@@ -38,7 +37,7 @@ def is_isotoperatio(s):
     -----
         * Validate the isotope masses vs natural isotopes
     """
-    if s not in __common_oxides__:
+    if s not in _common_components()[1]:
         isotopes = get_isotopes(s)
         return len(isotopes) == 2
     else:
@@ -71,6 +70,48 @@ def repr_isotope_ratio(isotope_ratio):
     return "{}{}{}{}".format(num_iso, titlecase(num_el), den_iso, titlecase(den_el))
 
 
+@functools.lru_cache(maxsize=None)
+def _chem_translation():
+    """
+    Get a translation table from uppercase names of common elements and oxides to
+    their standard case.
+
+    Returns
+    --------
+    :class:`dict`
+
+    Notes
+    ------
+    Where an element and oxide share an uppercase name, the element takes
+    precedence (e.g. 'CO' is translated to 'Co').
+    """
+    elements, oxides = _common_components()
+    trans = {str(o).upper(): str(o) for o in oxides}
+    trans.update({str(e).upper(): str(e) for e in elements})
+    return trans
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _tochem(h):
+    """
+    Convert a single header to 'chemical case', memoised such that recently used
+    headers are parsed only once.
+
+    Parameters
+    ----------
+    h : :class:`str`
+        Header to convert.
+
+    Returns
+    --------
+    :class:`str`
+    """
+    trans = _chem_translation()
+    if str(h).upper() in trans:
+        return trans[str(h).upper()]
+    return repr_isotope_ratio(h)  # translate potential isotope ratios
+
+
 def ischem(s):
     """
     Checks if a string corresponds to chemical component (compositional).
@@ -89,7 +130,7 @@ def ischem(s):
     -----
         * Implement checking for other compounds, e.g. carbonates.
     """
-    chems = set(map(str.upper, (__common_elements__ | __common_oxides__)))
+    chems = _chem_translation()
     if isinstance(s, list):
         return [str(st).upper() in chems for st in s]
     else:
@@ -103,7 +144,7 @@ def tochem(strings: list, abbrv=["ID", "IGSN"], split_on=r"[\s_]+"):
 
     Parameters
     ----------
-    strings : :class:`list`
+    strings : :class:`list` | :class:`pandas.Index` | :class:`str`
         Strings to convert to 'chemical case'.
     abbr : :class:`list`, :code:`["ID", "IGSN"]`
         Abbreivated phrases to ignore in capitalisation.
@@ -113,24 +154,16 @@ def tochem(strings: list, abbrv=["ID", "IGSN"], split_on=r"[\s_]+"):
     Returns
     --------
     :class:`list` | :class:`str`
-    """
-    # listify single string passed
-    listified = False
-    if not type(strings) in [list, pd.core.indexes.base.Index]:
-        strings = [strings]
-        listified = True
 
-    # translate elements and oxides
-    # elements second, Co guaranteed to override CO for python 3.6 +
-    chems = __common_oxides__ | __common_elements__
-    trans = {str(e).upper(): str(e) for e in chems}
-    strings = [trans[str(h).upper()] if str(h).upper() in trans else h for h in strings]
-
-    # translate potential isotope ratios
-    strings = [h if (h in chems) else repr_isotope_ratio(h) for h in strings]
-    if listified:
-        strings = strings[0]
-    return strings
+    Notes
+    ------
+    Elements and oxides are translated using a table which is built once per
+    session, and conversions are memoised such that each unique header is parsed
+    only once (including those which are not recognised).
+    """
+    if not isinstance(strings, (list, pd.Index)):  # single string passed
+        return _tochem(strings)
+    return [_tochem(h) for h in strings]
 
 
 def check_multiple_cation_inclusion(df, exclude=["LOI", "FeOT", "Fe2O3T"]):
@@ -153,7 +186,7 @@ def check_multiple_cation_inclusion(df, exclude=["LOI", "FeOT", "Fe2O3T"]):
     -----
         * Options for output (string/formula).
     """
-    major_components = [i for i in __common_oxides__ if i in df.columns]
+    major_components = [i for i in _common_components()[1] if i in df.columns]
     elements_as_majors = [
         get_cations(oxide)[0] for oxide in major_components if not oxide in exclude
     ]
@@ -10,8 +10,15 @@ from ..comp.codata import renormalise, close
 from ..util.text import titlecase, remove_suffix
 from ..util.types import iscollection
 from ..util.meta import update_docstring_references
-from ..util.math import OP_constants, lambdas, lambda_poly_func
+from ..util.math import (
+    OP_constants,
+    lambdas,
+    lambdas_lstsq,
+    lambda_poly_func,
+    lambda_poly_basis,
+)
 from ..util.units import scale
+from ..util.missing import md_pattern
 
 from .ind import (
     REE,
@@ -19,11 +26,18 @@ from .ind import (
     simple_oxides,
     common_elements,
     common_oxides,
-    __common_elements__,
-    __common_oxides__,
+    _common_components,
     get_cations,
+    get_molecular_weights,
+    get_cation_factors,
+    _component_records,
+)
+from .norm import (
+    Composition,
+    get_reference_composition,
+    get_reference_abundances,
+    _shared_reference_composition,
 )
-from .norm import Composition, get_reference_composition
 from .parse import tochem, check_multiple_cation_inclusion
 
 import logging
@@ -53,7 +67,7 @@ def to_molecular(df: pd.DataFrame, renorm=True):
     Does not convert units (i.e. mass% --> mol%; mass-ppm --> mol-ppm).
     """
     # df = df.to_frame()
-    MWs = [pt.formula(c).mass for c in df.columns]
+    MWs = get_molecular_weights(df.columns)
     if renorm:
         return renormalise(df.div(MWs))
     else:
@@ -81,7 +95,7 @@ def to_weight(df: pd.DataFrame, renorm=True):
     Does not convert units (i.e. mol% --> mass%; mol-ppm --> mass-ppm).
     """
     # df = df.to_frame()
-    MWs = [pt.formula(c).mass for c in df.columns]
+    MWs = get_molecular_weights(df.columns)
     if renorm:
         return renormalise(df.multiply(MWs))
     else:
@@ -136,31 +150,19 @@ def oxide_conversion(oxin, oxout, molecular=False):
         Function to convert a :class:`pandas.Series` from one elment-oxide
         component to another.
     """
-    if not isinstance(oxin, pt.formulas.Formula):
-        oxin = pt.formula(oxin)
-    if not isinstance(oxout, pt.formulas.Formula):
-        oxout = pt.formula(oxout)
-
-    inatoms = {k: v for (k, v) in oxin.atoms.items() if not str(k) == "O"}
-    in_els = inatoms.keys()
-    outatoms = {k: v for (k, v) in oxout.atoms.items() if not str(k) == "O"}
-    out_els = outatoms.keys()
-    try:
-        assert (len(in_els) == len(out_els)) & (
-            len(in_els) == 1
-        )  # Assertion of simple oxide
-        assert in_els == out_els  # Need to be dealilng with the same element!
-    except:
-        raise ValueError("Incompatible compounds: {} --> {}".format(in_els, out_els))
-    # Moles of product vs. moles of reactant
-    cation_coefficient = list(inatoms.values())[0] / list(outatoms.values())[0]
+    oxin, oxout = str(oxin), str(oxout)
+    (in_cation, out_cation) = [r[1] for r in _component_records([oxin, oxout])]
+    # Assertion of simple oxide, and need to be dealing with the same element!
+    if (in_cation is None) or (out_cation is None) or (in_cation != out_cation):
+        raise ValueError("Incompatible compounds: {} --> {}".format(oxin, oxout))
+    # ratio of cation-equivalent conversion factors for weight and molecular data
+    factors = {
+        m: np.divide(*get_cation_factors([oxin, oxout], molecular=m))
+        for m in [True, False]
+    }
 
     def convert_series(dfser: pd.Series, molecular=molecular):
-        if molecular:
-            factor = cation_coefficient
-        else:
-            factor = cation_coefficient * oxout.mass / oxin.mass
-        converted = dfser * factor
+        converted = dfser * factors[bool(molecular)]
         return converted
 
     doc = "Convert series from " + str(oxin) + " to " + str(oxout)
@@ -168,6 +170,95 @@ def oxide_conversion(oxin, oxout, molecular=False):
     return convert_series
 
 
+@functools.lru_cache(maxsize=128)
+def _cation_sum_plan(columns, cations, total_suffix="T", molecular=False):
+    """
+    Compile a matrix which converts the abundances of relevant species in a set of
+    columns to cation-equivalent abundances, summed for each of a set of cations.
+
+    Parameters
+    -----------
+    columns : :class:`tuple`
+        Columns of the dataframe.
+    cations : :class:`tuple`
+        Cations to obtain sums for.
+    total_suffix : :class:`str`, 'T'
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+    molecular : :class:`bool`, :code:`False`
+        Whether to perform a sum of molecular data.
+
+    Returns
+    --------
+    species : :class:`list`
+        Columns which contribute to the cation sums.
+    G : :class:`numpy.ndarray`
+        Matrix of shape :code:`(len(species), len(cations))`.
+    """
+    species, species_cations = [], []
+    for cation in cations:
+        poss_specs = [cation] + simple_oxides(cation)
+        poss_specs += [i + total_suffix for i in poss_specs]
+        specs = [i for i in columns if i in poss_specs and i not in species]
+        if not specs:
+            logger.warning(
+                "No relevant species ({}) found to aggregate.".format(poss_specs)
+            )
+        species += specs
+        species_cations += [cations.index(cation)] * len(specs)
+
+    G = np.zeros((len(species), len(cations)))
+    G[np.arange(len(species)), species_cations] = get_cation_factors(
+        [remove_suffix(s, suffix=total_suffix) for s in species], molecular=molecular
+    )
+    return species, G
+
+
+def _elemental_sums(
+    df, cations, total_suffix="T", logdata=False, molecular=False, columns=None
+):
+    """
+    Sum cation-equivalent abundances for a set of cations, using a single array
+    of the relevant species.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        DataFrame for which to aggregate cation data.
+    cations : :class:`list`
+        Cations to obtain sums for.
+    total_suffix : :class:`str`, 'T'
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+    logdata : :class:`bool`, :code:`False`
+        Whether data has been log transformed.
+    molecular : :class:`bool`, :code:`False`
+        Whether to perform a sum of molecular data.
+    columns : :class:`list`, :code:`None`
+        Subset of columns to use for the sums. Defaults to all columns.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Array of shape :code:`(df.index.size, len(cations))`, where non-positive sums
+        are given as :class:`numpy.nan`.
+    """
+    columns = df.columns if columns is None else columns
+    species, G = _cation_sum_plan(
+        tuple(map(str, columns)),
+        tuple(map(str, cations)),
+        total_suffix=total_suffix,
+        molecular=molecular,
+    )
+    A = df.loc[:, species].values.astype(float)
+    if logdata:
+        logger.debug("Inverse-log-transforming data.")
+        np.exp(A, out=A)
+    logger.debug("Zeroing non-finite and negative values.")
+    A[~(A >= 0.0) | np.isinf(A)] = 0.0
+    sums = A @ G
+    sums[~(sums > 0.0)] = np.nan
+    return sums
+
+
 def elemental_sum(
     df: pd.DataFrame,
     component=None,
@@ -208,44 +299,23 @@ def elemental_sum(
 
     cationname = str(cation)
     logger.debug("Agregating {} Data.".format(cationname))
-    # different species
-    poss_specs = [cationname] + simple_oxides(cation)
-    poss_specs += [i + total_suffix for i in poss_specs]
-    species = [i for i in set(poss_specs) if i in df.columns]
-    if not species:
-        logger.warning(
-            "No relevant species ({}) found to aggregate.".format(poss_specs)
-        )
-        # return nulls
-        subsum = pd.Series(np.ones(df.index.size) * np.nan, index=df.index)
-    else:
-        subdf = df.loc[:, species].copy(deep=True)
-        if logdata:
-            logger.debug("Inverse-log-transforming {} data.".format(cationname))
-            subdf = subdf.applymap(np.exp)
-
-        logger.debug(
-            "Converting all {} data to metallic {} equiv.".format(
-                cationname, cationname
-            )
-        )
-        for s in species:
-            form = remove_suffix(s, suffix=total_suffix)
-            subdf[s] = subdf[s].apply(
-                oxide_conversion(form, cationname, molecular=molecular)
-            )
-
-        logger.debug("Zeroing non-finite and negative {} values.".format(cationname))
-        subdf[(~np.isfinite(subdf.values)) | (subdf < 0.0)] = 0.0
-        subsum = subdf.sum(axis=1)
-        subsum[subsum <= 0.0] = np.nan
-
+    subsum = pd.Series(
+        _elemental_sums(
+            df,
+            [cationname],
+            total_suffix=total_suffix,
+            logdata=logdata,
+            molecular=molecular,
+        )[:, 0],
+        index=df.index,
+    )
     if to is None:
         subsum.name = cationname
         return subsum
     else:
+        subsum = oxide_conversion(cationname, to, molecular=molecular)(subsum)
         subsum.name = to
-        return subsum.apply(oxide_conversion(cationname, to, molecular=molecular))
+        return subsum
 
 
 def aggregate_element(
@@ -397,6 +467,152 @@ def recalculate_Fe(
     )
 
 
+def _parse_ratio(ratio: str):
+    """
+    Parse a ratio given in the form A/B[_n].
+
+    Parameters
+    -----------
+    ratio : :class:`str`
+        String decription of ratio in the form A/B[_n].
+
+    Returns
+    --------
+    :class:`tuple`
+        Numerator, denominator and whether the ratio is to be normalised.
+    """
+    num, den = ratio.split("/")
+    _to_norm = False
+    if den.lower().endswith("_n"):
+        den = titlecase(den.lower().replace("_n", ""))
+        _to_norm = True
+    return num, den, _to_norm
+
+
+def _component_abundances(df: pd.DataFrame, components, molecular=False):
+    """
+    Get abundances of a set of components from a dataframe, aggregating all species
+    of the relevant cations in a single pass.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to obtain abundances from.
+    components : :class:`list`
+        Components to obtain abundances for.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Array of shape :code:`(df.index.size, len(components))`.
+    """
+    cations = [str(get_cations(c)[0]) for c in components]
+    unique_cations = list(dict.fromkeys(cations))
+    sums = _elemental_sums(df, unique_cations, molecular=molecular)
+    # convert the cation-equivalent sums to abundances of each component
+    return sums[:, [unique_cations.index(c) for c in cations]] / get_cation_factors(
+        components, molecular=molecular
+    )
+
+
+def _reference_abundances(norm_to, components, molecular=False):
+    """
+    Get abundances of a set of components within a reference composition.
+
+    Parameters
+    -----------
+    norm_to : :class:`str` | :class:`~pyrolite.geochem.norm.Composition` | :class:`dict` | :class:`pandas.Series`
+        Reference composition, or a mapping of components to reference abundances.
+    components : :class:`list`
+        Components to obtain abundances for.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+    """
+    if isinstance(norm_to, (dict, pd.Series)):
+        return np.array([norm_to.get(c, np.nan) for c in components], dtype=float)
+
+    if isinstance(norm_to, str):
+        norm = _shared_reference_composition(norm_to)
+    elif isinstance(norm_to, Composition):
+        norm = norm_to
+    else:
+        logger.warning("Unknown normalization, defaulting to Chondrite.")
+        norm = _shared_reference_composition("Chondrite_PON")
+
+    ref = norm.comp
+    if norm.units is not None:  # use consistent units across species
+        ref = ref * norm.units.apply(scale, target_unit="ppm").astype(float)
+    ref = _component_abundances(ref, components)[0]
+    if molecular:  # reference compositions are given in weight units
+        ref = ref / get_molecular_weights(components)
+    return ref
+
+
+def get_ratios(
+    df: pd.DataFrame, ratios: list, aliases: list = None, norm_to=None, molecular=False
+):
+    """
+    Get a set of ratios of components, each given in the form of string 'A/B'.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to calculate ratios for.
+    ratios : :class:`list`
+        String decriptions of ratios in the form A/B[_n].
+    aliases : :class:`list`
+        Alternate names for ratios to be used as column names.
+    norm_to : :class:`str` | :class:`~pyrolite.geochem.norm.Composition` | :class:`dict`, `None`
+        Reference composition to normalise to. Ratios with a denominator suffixed
+        with :code:`_n` will be normalised to Chondrite if this is not specified.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+        Dataframe of ratios.
+
+    Notes
+    ------
+    The abundance of each cation is aggregated once for all ratios, and the
+    reference composition is resolved once.
+
+    See Also
+    --------
+    :func:`~pyrolite.geochem.transform.get_ratio`
+    """
+    parsed = [_parse_ratio(r) for r in ratios]
+    names = [
+        r if ((aliases is None) or (not a)) else a
+        for r, a in zip(ratios, aliases or [None] * len(ratios))
+    ]
+    logger.debug("Adding Ratios: {}".format(", ".join(names)))
+    components = list(
+        dict.fromkeys([c for (num, den, _) in parsed for c in (num, den)])
+    )
+    num_ix = [components.index(num) for (num, _, _) in parsed]
+    den_ix = [components.index(den) for (_, den, _) in parsed]
+
+    abund = _component_abundances(df, components, molecular=molecular)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = abund[:, num_ix] / abund[:, den_ix]
+
+        to_norm = np.array([n or (norm_to is not None) for (_, _, n) in parsed])
+        if to_norm.any():
+            ref = _reference_abundances(norm_to, components, molecular=molecular)
+            out[:, to_norm] /= (ref[num_ix] / ref[den_ix])[to_norm]
+
+    out[~np.isfinite(out)] = np.nan  # avoid inf
+    return pd.DataFrame(out, index=df.index, columns=names)
+
+
 def get_ratio(
     df: pd.DataFrame, ratio: str, alias: str = None, norm_to=None, molecular=False
 ):
@@ -425,45 +641,21 @@ def get_ratio(
     Todo
     ------
 
-        * Use elemental sum from reference compositions
         * Use sympy-like functionality to accept arbitrary input for calculation
 
             e.g. :code:`"MgNo = Mg / (Mg + Fe)"`
 
     See Also
     --------
+    :func:`~pyrolite.geochem.transform.get_ratios`
     :func:`~pyrolite.geochem.transform.add_MgNo`
     """
-    num, den = ratio.split("/")
-    _to_norm = False
-    if den.lower().endswith("_n"):
-        den = titlecase(den.lower().replace("_n", ""))
-        _to_norm = True
-
-    if _to_norm or (norm_to is not None):  # if molecular, this will need to change
-        if isinstance(norm_to, str):
-            norm = get_reference_composition(norm_to)
-            num_n, den_n = norm[num], norm[den]
-        elif isinstance(norm_to, Composition):
-            norm = norm_to
-            num_n, den_n = norm[num], norm[den]
-        elif iscollection(norm_to):  # list, iterable, pd.Index etc
-            num_n, den_n = norm_to
-        else:
-            logger.warning("Unknown normalization, defaulting to Chondrite.")
-            norm = get_reference_composition("Chondrite_PON")
-            num_n, den_n = norm[num], norm[den]
-
-    name = [ratio if ((not alias) or (alias is None)) else alias][0]
-    logger.debug("Adding Ratio: {}".format(name))
-    numsum, densum = (
-        elemental_sum(df, num, to=num, molecular=molecular),
-        elemental_sum(df, den, to=den, molecular=molecular),
-    )
-    ratio = numsum / densum
-    ratio[~np.isfinite(ratio.values)] = np.nan  # avoid inf
-    ratio.name = name
-    return ratio
+    if iscollection(norm_to) and not isinstance(norm_to, (dict, pd.Series)):
+        num, den, _ = _parse_ratio(ratio)
+        norm_to = dict(zip([num, den], norm_to))  # reference abundances of A, B
+    return get_ratios(
+        df, [ratio], aliases=[alias], norm_to=norm_to, molecular=molecular
+    ).iloc[:, 0]
 
 
 def add_MgNo(
@@ -499,20 +691,18 @@ def add_MgNo(
     :func:`~pyrolite.geochem.transform.get_ratio`
     """
     logger.debug("Adding Mg#")
-    mg = elemental_sum(df, "Mg", molecular=molecular)
     if use_total_approx:
-        speciation = {"FeO": 1.0 - approx_Fe203_frac, "Fe2O3": approx_Fe203_frac}
-        fe = aggregate_element(df, "Fe", to=speciation, molecular=molecular).FeO
+        mg, fe = _elemental_sums(df, ["Mg", "Fe"], molecular=molecular).T
+        fe = fe * (1.0 - approx_Fe203_frac)  # ferrous proportion of total iron
     else:
         filter = [i for i in df.columns if "Fe2O3" not in i]  # exclude ferric iron
-        fe = elemental_sum(df.loc[:, filter], "Fe", molecular=molecular)
+        mg, fe = _elemental_sums(
+            df, ["Mg", "Fe"], molecular=molecular, columns=filter
+        ).T
     if not molecular:  # convert these outputs to molecular, unless already so
-        mg, fe = (
-            to_molecular(mg.to_frame(), renorm=False),
-            to_molecular(fe.to_frame(), renorm=False),
-        )
+        mg, fe = np.array([mg, fe]) / get_molecular_weights(["Mg", "Fe"])[:, None]
 
-    mgnos = mg.values / (mg.values + fe.values)
+    mgnos = mg / (mg + fe)
     if mgnos.size:  # to cope with empty arrays
         df[name] = mgnos
     else:
@@ -528,6 +718,7 @@ def lambda_lnREE(
     degree=4,
     append=[],
     scale="ppm",
+    algorithm=None,
     **kwargs
 ):
     """
@@ -549,14 +740,32 @@ def lambda_lnREE(
     degree : :class:`int`, 5
         Maximum degree polynomial fit component to include.
     append : :class:`list`, :code:`None`
-        Whether to append lambda function (i.e. :code:`["function"]`).
+        Additional outputs to append. Options include the lambda function
+        (:code:`"function"`), residuals of the fit in log space for each REE used
+        in the fit (:code:`"residuals"`, as columns :code:`"La_residual"` etc.)
+        and Eu and Ce anomalies relative to the fitted pattern (:code:`"Eu"`,
+        :code:`"Ce"`, as columns :code:`"Eu/Eu*"` and :code:`"Ce/Ce*"`).
     scale : :class:`str`
         Current units for the REE data, used to scale the reference dataset.
+    algorithm : :class:`str`, :code:`None`
+        Algorithm used to fit the lambdas. :code:`"lstsq"` solves the linear least
+        squares problem for all rows at once
+        (see :func:`~pyrolite.util.math.lambdas_lstsq`), whereas :code:`"opt"` will
+        optimise each row individually (see :func:`~pyrolite.util.math.lambdas`).
+        The least squares solution is equivalent to the optimisation with
+        :code:`costf_power=1` (an L2 norm, as the optimiser squares the cost
+        function). By default, :code:`"lstsq"` is used where :code:`costf_power=1` is
+        passed as a keyword argument, and :code:`"opt"` is used otherwise (including
+        for the default :code:`costf_power=2`, an L4 norm).
+
+    Notes
+    ------
+    Rows with missing or non-positive REE abundances are fit using the available
+    REE, grouping rows which share a pattern of missing data. Rows with fewer REE
+    than the number of parameters will return :class:`numpy.nan`.
 
     Todo
     -----
-        * Operate only on valid rows.
-        * Add residuals, Eu, Ce anomalies as options to `append`.
         * Pre-build orthagonal parameters for REE combinations for calculation speed?
 
     References
@@ -574,64 +783,99 @@ def lambda_lnREE(
     :func:`~pyrolite.plot.REE_radii_plot`
     """
     non_null_cols = df.columns[~df.isnull().all(axis=0)]
-    ree = [
+    all_ree = [
         i
         for i in REE()
-        if i in df.columns
-        and (not str(i) in exclude)
-        and (str(i) in non_null_cols or i in non_null_cols)
-    ]  # no promethium
-    radii = np.array(get_ionic_radii(ree, coordination=8, charge=3))
+        if i in df.columns and (str(i) in non_null_cols or i in non_null_cols)
+    ]
+    ree = [i for i in all_ree if not str(i) in exclude]  # no promethium
+    fit_ix = [all_ree.index(i) for i in ree]
+    all_radii = np.array(get_ionic_radii(all_ree, coordination=8, charge=3))
+    radii = all_radii[fit_ix]
 
     if params is None:
         params = OP_constants(radii, degree=degree)
     else:
         degree = len(params)
 
-    null_in_row = pd.isnull(df.loc[:, ree]).any(axis=1)
-    norm_df = df.loc[~null_in_row, ree].copy()  # initialize normdf
+    norm_df = df.loc[:, all_ree].astype(float)  # initialize normdf
 
     labels = [chr(955) + str(d) for d in range(degree)]
 
     if norm_to is not None:  # None = already normalised data
-        if isinstance(norm_to, str):
-            norm = get_reference_composition(norm_to)
-            norm.set_units(scale)
-            norm_abund = norm[ree]
-        elif isinstance(norm_to, Composition):
-            norm = norm_to
-            norm.set_units(scale)
-            norm_abund = norm[ree]
+        if isinstance(norm_to, (str, Composition)):
+            norm_abund = get_reference_abundances(norm_to, all_ree, units=scale)
         else:  # list, iterable, pd.Index etc
             norm_abund = np.array(norm_to)
             assert len(norm_abund) == len(ree)
+            # excluded elements can't be normalised
+            norm_abund = pd.Series(norm_abund, index=ree).reindex(all_ree).values
 
-        norm_df.loc[:, ree] = np.divide(norm_df.loc[:, ree].values, norm_abund)
+        norm_df.loc[:, all_ree] = np.divide(norm_df.values, norm_abund)
 
-    norm_df.loc[(norm_df <= 0.0).any(axis=1), :] = np.nan  # remove zero or below
-    norm_df.loc[:, ree] = norm_df.loc[:, ree].applymap(np.log)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        all_arr = np.log(norm_df.values)
+    all_arr[~np.isfinite(all_arr)] = np.nan  # remove zero or below
+    arr = all_arr[:, fit_ix]
 
     lambdadf = pd.DataFrame(index=df.index, columns=labels)
-    lambda_partial = functools.partial(
-        lambdas, xs=radii, params=params, degree=degree, **kwargs
-    )  # pass kwargs to lambdas
-    # apply along rows
+    l2 = (kwargs.get("costf_power", 2.0) == 1) and ("min_func" not in kwargs)
+    if algorithm is None:
+        algorithm = ["opt", "lstsq"][l2]
+    elif algorithm == "lstsq" and (
+        (kwargs.get("costf_power", 1) != 1) or ("min_func" in kwargs)
+    ):
+        msg = "The least squares solution applies only to costf_power=1 (an L2 norm)."
+        raise ValueError(msg)
+
     logger.debug("lambda-fitting")
-    lambdadf.loc[~null_in_row, labels] = np.apply_along_axis(
-        lambda_partial, 1, norm_df.values
-    )
-    lambdadf.loc[(lambdadf == 0.0).all(axis=1), :] = np.nan
-    if append is not None:
-        if "function" in append:
-            # append the smooth f(radii) function to the dataframe
-            func_partial = functools.partial(
-                lambda_poly_func, pxs=radii, params=params, degree=degree
-            )
-            lambdadf["lambda_poly_func"] = np.apply_along_axis(
-                func_partial, 1, lambdadf.values
+    if algorithm == "lstsq":
+        # rows are grouped by missing data pattern and each group solved at once
+        lambdadf.loc[:, labels] = lambdas_lstsq(
+            arr, xs=radii, params=params, degree=degree
+        )
+    elif algorithm == "opt":
+        pID, pD = md_pattern(arr)
+        for ID, pattern in pD.items():
+            rows, avail = pID == ID, ~pattern["pattern"]
+            if (not rows.any()) or (avail.sum() < degree):  # underdetermined
+                continue
+            lambda_partial = functools.partial(
+                lambdas, xs=radii[avail], params=params, degree=degree, **kwargs
+            )  # pass kwargs to lambdas
+            # apply along rows
+            lambdadf.loc[rows, labels] = np.apply_along_axis(
+                lambda_partial, 1, arr[np.ix_(rows, avail)]
             )
-
+    else:
+        raise NotImplementedError("Unknown algorithm: {}".format(algorithm))
+    lambdadf.loc[(lambdadf == 0.0).all(axis=1), :] = np.nan
     lambdadf = lambdadf.apply(pd.to_numeric, errors="coerce")
+
+    append = append or []
+    anomalies = [a for a in ["Ce", "Eu"] if a in append]
+    if ("residuals" in append) or anomalies:
+        # reconstruct the fitted patterns for all rows in a single product
+        fitted = lambdadf.values @ lambda_poly_basis(all_radii, params).T
+        if "residuals" in append:
+            res = arr - fitted[:, fit_ix]
+            for ix, el in enumerate(ree):
+                lambdadf["{}_residual".format(el)] = res[:, ix]
+        for el in anomalies:
+            name = "{}/{}*".format(el, el)
+            if el in all_ree:
+                ix = all_ree.index(el)
+                lambdadf[name] = np.exp(all_arr[:, ix] - fitted[:, ix])
+            else:
+                logger.warning("{} not present, anomaly not calculated.".format(el))
+                lambdadf[name] = np.nan
+
+    if "function" in append:
+        # append the smooth f(radii) function to the dataframe
+        lambdadf["lambda_poly_func"] = [
+            lambda_poly_func(l, params=params) for l in lambdadf.loc[:, labels].values
+        ]
+
     assert lambdadf.index.size == df.index.size
     return lambdadf
 
@@ -639,6 +883,122 @@ def lambda_lnREE(
 lambda_lnREE = update_docstring_references(lambda_lnREE, ref="localref")
 
 
+def _freeze_targets(to):
+    """
+    Convert a list of conversion targets to a hashable form for caching.
+    """
+    return tuple(
+        tuple((str(k), float(v)) for k, v in t.items())
+        if isinstance(t, dict)
+        else str(t)
+        for t in to
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _conversion_plan(columns, to, total_suffix="T", molecular=False):
+    """
+    Compile a set of target components into a linear map from the columns of a
+    dataframe, consisting of a matrix which sums cation-equivalent abundances and
+    a matrix which distributes cation sums to the target components.
+
+    Parameters
+    -----------
+    columns : :class:`tuple`
+        Columns of the dataframe to convert.
+    to : :class:`tuple`
+        Frozen set of targets (see :func:`_freeze_targets`).
+    total_suffix : :class:`str`, 'T'
+        Suffix of 'total' variables. E.g. 'T' for FeOT, Fe2O3T.
+    molecular : :class:`bool`, :code:`False`
+        Flag that data is in molecular units, rather than weight units.
+
+    Returns
+    --------
+    :class:`dict`
+    """
+    elements, oxides = _common_components()
+    compositional_components = oxides | elements
+    # multi-component dictionaries which are not elements/oxides/ratios
+    coupled_sets = [dict(i) for i in to if isinstance(i, tuple)]
+    logger.debug(
+        "Found coupled sets: {}".format(", ".join([str(set(s)) for s in coupled_sets]))
+    )
+    coupled_components = [k for s in coupled_sets for k in s.keys()]
+    present_comp = [
+        i for i in columns if i in compositional_components
+    ] + coupled_components
+    noncomp = [i for i in columns if (i not in present_comp)]
+    new_ratios = [i for i in to if isinstance(i, str) and "/" in i and i not in columns]
+    get_comp = [
+        i
+        for i in to
+        if isinstance(i, str) and i not in noncomp + new_ratios + coupled_components
+    ]
+    # present iron components are not aggregated, as these are distinct redox species
+    passthrough = [i for i in get_comp if "Fe" in i and i in columns]
+    # also pass through present components which aren't simple oxides (e.g. LOI)
+    for i in get_comp:
+        if i in columns and i not in passthrough:
+            try:
+                _component_records([remove_suffix(i, suffix=total_suffix)])
+            except Exception:
+                passthrough.append(i)
+
+    get_fe = [i for i in get_comp if "Fe" in i and i not in present_comp]
+    coupled_fe = [s for s in coupled_sets if all(["Fe" in k for k in s])]
+    if coupled_fe:
+        get_fe = coupled_fe
+    if len(get_fe) > 1:
+        raise NotImplementedError("Need to specify speciation for >1 Fe components.")
+
+    # target groups of (targets, proportions) for a single cation
+    groups = [([t], np.array([1.0])) for t in get_comp if t not in passthrough]
+    groups += [
+        (list(s.keys()), close(np.array(list(s.values())).astype(float)))
+        for s in coupled_sets
+    ]
+    targets = [t for g, _ in groups for t in g]
+    cations = []
+    for g, _ in groups:
+        cation = str(get_cations(g[0], total_suffix=total_suffix)[0])
+        if cation not in cations:
+            cations.append(cation)
+
+    species, _ = _cation_sum_plan(
+        columns, tuple(cations), total_suffix=total_suffix, molecular=molecular
+    )
+    # cation equivalent sums -> targets
+    T = np.zeros((len(cations), len(targets)))
+    target_cations = np.zeros(len(targets), dtype=int)
+    tx = 0
+    for g, props in groups:
+        factors = get_cation_factors(
+            [remove_suffix(t, suffix=total_suffix) for t in g], molecular=molecular
+        )
+        cx = cations.index(str(get_cations(g[0], total_suffix=total_suffix)[0]))
+        for t, p, f in zip(g, props, factors):
+            T[cx, tx] = p / f
+            target_cations[tx] = cx
+            tx += 1
+
+    return dict(
+        noncomp=noncomp,
+        passthrough=passthrough,
+        cations=cations,
+        targets=targets,
+        T=T,
+        target_cations=target_cations,
+        new_ratios=new_ratios,
+        output_columns=noncomp + get_comp + coupled_components + new_ratios,
+        compositional=[
+            i
+            for i in columns
+            if i in compositional_components and i not in species + passthrough
+        ],
+    )
+
+
 def convert_chemistry(input_df, to=[], logdata=False, renorm=False, molecular=False):
     """
     Attempts to convert a dataframe with one set of components to another.
@@ -664,84 +1024,62 @@ def convert_chemistry(input_df, to=[], logdata=False, renorm=False, molecular=Fa
     :class:`pandas.DataFrame`
         Dataframe with converted chemistry.
 
+    Notes
+    ------
+    The set of targets is compiled into a linear map from the relevant columns of
+    the dataframe (which is cached for a given set of columns and targets), such that
+    all components are converted in one pass without intermediate copies of the
+    dataframe. Components which are present but are distinct iron species
+    (e.g. FeO, Fe2O3) are passed through without aggregation.
+
     Todo
     ------
     * Check for conflicts between oxides and elements
     * Aggregator for ratios
     * Implement generalised redox transformation.
     * Add check for dicitonary components (e.g. Fe) in tests
-    * Subsequent calls to convert_chemistry via normalize_to result in memory leaks
     """
-    df = input_df.copy(deep=True)
-    oxides = __common_oxides__
-    elements = __common_elements__
-    compositional_components = oxides | elements
-    # multi-component dictionaries which are not elements/oxides/ratios
-    coupled_sets = [
-        i for i in to if not isinstance(i, (str, pt.core.Element, pt.formulas.Formula))
-    ]
-    logger.debug(
-        "Found coupled sets: {}".format(", ".join([str(set(s)) for s in coupled_sets]))
+    plan = _conversion_plan(
+        tuple(map(str, input_df.columns)), _freeze_targets(to), molecular=molecular
     )
-    # check that all sets in coupled_sets have the same cation
-    coupled_components = [k for s in coupled_sets for k in s.keys()]
-    # need to get the additional things from here
-    present_comp = [
-        i for i in df.columns if i in compositional_components
-    ] + coupled_components
-    noncomp = [i for i in df.columns if (i not in present_comp)]
-    new_ratios = [i for i in to if "/" in i and i not in df.columns]
-    get_comp = [i for i in to if i not in coupled_sets + noncomp + new_ratios]
-    agg_present, get_notpresent = (
-        [i for i in get_comp if i in present_comp],
-        [i for i in get_comp if i not in present_comp],
+    # cation-equivalent sums for each of the cations present in the targets
+    sums = _elemental_sums(
+        input_df, plan["cations"], logdata=logdata, molecular=molecular
     )
-    # remove iron components from main getter, we'll deal with them separately
-    # fe_components = ["Fe", "FeO", "Fe2O3", "Fe2O3T", "FeOT"]
-    current_fe = [i for i in present_comp if "Fe" in str(i)]
-    get_fe = [i for i in get_notpresent if "Fe" in str(i)]
-
-    agg_present = list(set(agg_present) - set(current_fe))
-    get_notpresent = list(set(get_notpresent) - set(get_fe))
-
-    # Aggregate the columns which are otherwise OK, then get new columns
-    for item in agg_present + get_notpresent:
-        df = aggregate_element(df, to=item, logdata=logdata, molecular=molecular)
-
-    # --- Try to get the new columns - iron redox section ------------------------------
-    # check if there's a multicomponent speciation problem
-    logger.debug("Checking Iron Redox")
-    c_fe_str = ", ".join(current_fe)
-    # check if any of the coupled_sets dictionaries correspond to iron
-    coupled_fe = [s for s in coupled_sets if all(["Fe" in k for k in s])]
-    if coupled_fe:
-        get_fe = coupled_fe
-
-    if len(get_fe) > 1:
-        raise NotImplementedError("Need to specify speciation for >1 Fe components.")
-
-    if get_fe:
-        get_fe = get_fe[0]
-        logger.debug("Transforming {} to {}.".format(c_fe_str, get_fe))
-        df = recalculate_Fe(
-            df, to=get_fe, renorm=False, logdata=logdata, molecular=molecular
-        )
+    valid = np.isfinite(sums)
+    sums[~valid] = 0.0
+    out = sums @ plan["T"]
+    out[~valid[:, plan["target_cations"]]] = np.nan
+    if logdata:
+        logger.debug("Log-transforming data.")
+        with np.errstate(divide="ignore"):
+            np.log(out, out=out)
 
+    parts = [
+        input_df.loc[:, plan["noncomp"] + plan["passthrough"]],
+        pd.DataFrame(out, index=input_df.index, columns=plan["targets"]),
+    ]
     # Try to get some ratios -----------------------------------------------------------
-    if new_ratios:
-        logger.debug("Adding Requested Ratios: {}".format(", ".join(new_ratios)))
-        for r in new_ratios:
-            r = get_ratio(df, r, molecular=molecular)
-            df[r.name] = r
+    if plan["new_ratios"]:
+        logger.debug(
+            "Adding Requested Ratios: {}".format(", ".join(plan["new_ratios"]))
+        )
+        parts.append(get_ratios(input_df, plan["new_ratios"], molecular=molecular))
+    df = pd.concat(parts, axis=1)
 
     # Last Minute Checks ---------------------------------------------------------------
-    remaining = [i for i in get_comp if i not in df.columns]
+    output_columns = plan["output_columns"]
+    remaining = [i for i in output_columns if i not in df.columns]
     assert not len(remaining), "Columns not attained: {}".format(", ".join(remaining))
-    output_columns = noncomp + get_comp + coupled_components + new_ratios
-    present_comp = [i for i in df.columns if i in compositional_components]
     if renorm:
         logger.debug("Recalculation Done, Renormalising compositional components.")
-        df.loc[:, present_comp] = renormalise(df.loc[:, present_comp])
+        comp = plan["passthrough"] + plan["targets"]
+        total = df.loc[:, comp].sum(axis=1) + input_df.loc[
+            :, plan["compositional"]
+        ].sum(axis=1)
+        df.loc[:, comp] = 100.0 * df.loc[:, comp].divide(
+            total.replace(0, 100.0), axis=0
+        )
         return df.loc[:, output_columns]
     else:
         logger.debug("Recalculation Done. Data not renormalised.")
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import periodictable as pt
 from ..util.pd import to_frame
+from ..geochem.ind import get_molecular_weights
 import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -78,7 +79,7 @@ def recalc_cations(
     assert ideal_cations is not None or ideal_oxygens is not None
     # if Fe2O3 and FeO are specified, calculate based on oxygen
     moles = to_frame(df)
-    moles = moles.div([pt.formula(c).mass for c in moles.columns])
+    moles = moles.div(get_molecular_weights(moles.columns))
     moles = moles.where(~np.isclose(moles, 0.0), np.nan)
 
     # determine whether oxygen is an open or closed system
@@ -126,7 +127,7 @@ def recalc_cations(
     ref.columns = ref.columns.map(str)
     ref.index = components
 
-    cation_masses = {c: pt.formula(c).mass for c in ref.columns}
+    cation_masses = dict(zip(ref.columns, get_molecular_weights(ref.columns)))
     oxygen_index = [i for i in ref.columns if "O" in i][0]
     ref = ref.loc[:, [i for i in ref.columns if not i == oxygen_index] + [oxygen_index]]
     moles_ref = ref.copy(deep=True)
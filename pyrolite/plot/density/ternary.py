@@ -35,7 +35,8 @@ def ternary_heatmap(
     mode : :class:`str`, :code:`{'histogram', 'density'}`
         Which mode to render the histogram/KDE in.
     transform : :class:`callable` | :class:`sklearn.base.TransformerMixin`
-        Callable function or Transformer class.
+        Callable function, or Transformer class or instance (e.g.
+        :code:`ILRTransform(psi=balance_basis(sbp))` for a balance basis).
     inverse_transform : :class:`callable`
         Inverse function for `transform`, necessary if transformer class not specified.
     ternary_min_value : :class:`float`
@@ -66,9 +67,9 @@ def ternary_heatmap(
     arr = close(data)  # should remove zeros/nans
     arr = arr[np.isfinite(arr).all(axis=1)]
 
-    if inspect.isclass(transform):
+    if inspect.isclass(transform) or hasattr(transform, "inverse_transform"):
         # TransformerMixin
-        tcls = transform()
+        tcls = transform() if inspect.isclass(transform) else transform
         tfm = tcls.transform
         itfm = tcls.inverse_transform
     else:
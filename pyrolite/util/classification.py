@@ -4,9 +4,6 @@ from pathlib import Path
 import pickle
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
-from matplotlib.collections import PatchCollection
 import logging
 import joblib
 from pyrolite.util.meta import pyrolite_datafolder
@@ -91,6 +88,9 @@ class SimpleDeterministicClassifer(object):
             pass
 
     def add_to_axes(self, ax=None, fill=False, **kwargs):
+        import matplotlib.pyplot as plt  # plotting imports deferred for headless use
+        from matplotlib.patches import Polygon
+
         polys = [(c, self.fields[c]) for c in self.fclasses if self.fields[c]["poly"]]
         if ax is None:
             fig, ax = plt.subplots(1)
@@ -107,9 +107,11 @@ class SimpleDeterministicClassifer(object):
         # ax.add_collection(PatchCollection(pgns), autolim=True)
 
     def predict(self, df: pd.DataFrame, cols: list = ["x", "y"]):
+        import matplotlib.path  # no backend required for point-in-polygon tests
+
         points = df.loc[:, cols].values
         polys = [
-            Polygon(self.fields[c]["poly"], closed=True) for c in self.fclasses
+            matplotlib.path.Path(self.fields[c]["poly"]) for c in self.fclasses
         ]  # if self.fields[c]['poly']
         indexes = np.array([p.contains_points(points) for p in polys]).T
         notfound = np.logical_not(indexes.sum(axis=-1))
@@ -160,6 +162,8 @@ class Geochemistry(object):
 
         def add_to_axes(self, ax=None, **kwargs):
             if ax is None:
+                import matplotlib.pyplot as plt
+
                 fig, ax = plt.subplots(1)
             self.clsf.add_to_axes(ax=ax, **kwargs)
             ax.set_xlim((35, 85))
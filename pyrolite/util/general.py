@@ -1,5 +1,6 @@
 import os, sys
 import re
+import json
 import time
 import shutil
 from tempfile import mkdtemp
@@ -7,6 +8,7 @@ import operator
 import inspect
 import zipfile
 import timeit
+import subprocess
 from collections import Mapping
 from pathlib import Path
 import numpy as np
@@ -198,3 +200,47 @@ def extract_zip(zipfile, output_dir):
                 content = zipfile.open(m, "r").read()
                 with open(str(output_dir / name), "wb") as out:
                     out.write(content)
+
+
+def import_in_subprocess(module, check=(), evaluate=None):
+    """
+    Import a module in a fresh interpreter, returning the import time, which of a
+    list of (heavy) modules were imported alongside it, and the values of any
+    expressions to evaluate after the import.
+
+    Parameters
+    -----------
+    module : :class:`str`
+        Name of the module to import.
+    check : :class:`list`
+        Names of modules to check for in :code:`sys.modules` after the import.
+    evaluate : :class:`dict`
+        Expressions to evaluate after the import, keyed by name. These should
+        evaluate to JSON-serializable values.
+
+    Returns
+    --------
+    :class:`dict`
+        Dictionary with the import :code:`time`, the :code:`loaded` modules and
+        the :code:`values` of the evaluated expressions.
+    """
+    script = "\n".join(
+        [
+            "import sys, json, time",
+            "start = time.perf_counter()",
+            "import {}".format(module),
+            "elapsed = time.perf_counter() - start",
+            "loaded = [m for m in {} if m in sys.modules]".format(repr(list(check))),
+            "values = {{k: eval(v) for k, v in {}.items()}}".format(
+                repr(dict(evaluate or {}))
+            ),
+            "print(json.dumps({'time': elapsed, 'loaded': loaded, 'values': values}))",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        env={**os.environ, "MPLBACKEND": "Agg"},
+        check=True,
+    ).stdout
+    return json.loads(output.decode().strip().splitlines()[-1])
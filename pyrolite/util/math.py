@@ -1,11 +1,11 @@
 import numpy as np
-from sympy.solvers.solvers import nsolve
-from sympy import symbols, var
-from functools import partial
+from functools import partial, lru_cache
 import scipy
+import json
 import logging
 from copy import copy
 from .meta import update_docstring_references
+from .missing import md_pattern
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -507,6 +507,16 @@ def equal_within_significance(arr, equal_nan=False, rtol=1e-15):
         return equal
 
 
+@lru_cache(maxsize=None)
+def _helmert_basis(D, full=False):
+    """
+    Get a cached, read-only (D-1, D) helmert basis for a given dimension.
+    """
+    H = scipy.linalg.helmert(D, full=full)[::-1].copy()
+    H.setflags(write=False)
+    return H
+
+
 def orthogonal_basis_default(D: int, **kwargs):
     """
     Generate a set of orthogonal basis vectors .
@@ -520,9 +530,12 @@ def orthogonal_basis_default(D: int, **kwargs):
     --------
     :class:`numpy.ndarray`
         (D-1, D) helmert matrix corresponding to default orthogonal basis.
+
+    Notes
+    -----
+        * Bases are cached for each dimension, and are returned as read-only arrays.
     """
-    H = scipy.linalg.helmert(D, **kwargs)
-    return H[::-1]
+    return _helmert_basis(int(D), **kwargs)
 
 
 def orthogonal_basis_from_array(X: np.ndarray, **kwargs):
@@ -543,13 +556,74 @@ def orthogonal_basis_from_array(X: np.ndarray, **kwargs):
     -----
         * Currently returns the default set of basis vectors for an array of given dim.
 
-    Todo
-    -----
-        * Update to provide other potential sets of basis vectors.
+    See Also
+    ---------
+    :func:`balance_basis`
     """
     return orthogonal_basis_default(X.shape[1], **kwargs)
 
 
+@lru_cache(maxsize=128)
+def _balance_basis(sbp):
+    """
+    Compile and validate a (D-1, D) balance basis from a hashable sequential binary
+    partition.
+    """
+    sbp = np.array(sbp, dtype=int)
+    if sbp.ndim != 2 or sbp.shape[0] != sbp.shape[1] - 1:
+        msg = "A sequential binary partition should have shape (D-1, D), not {}."
+        raise ValueError(msg.format(sbp.shape))
+    if not np.isin(sbp, [-1, 0, 1]).all():
+        raise ValueError("Sequential binary partitions should only contain -1, 0, 1.")
+    r, s = (sbp == 1).sum(axis=1), (sbp == -1).sum(axis=1)
+    if not ((r > 0) & (s > 0)).all():
+        raise ValueError("Each partition should contain both +1 and -1 groups.")
+    scale = np.sqrt(r * s / (r + s))[:, np.newaxis]
+    psi = scale * np.where(
+        sbp == 1,
+        1.0 / r[:, np.newaxis],
+        np.where(sbp == -1, -1.0 / s[:, np.newaxis], 0),
+    )
+    if not np.allclose(psi @ psi.T, np.eye(psi.shape[0])):
+        msg = "Partitions are not hierarchical, and do not give an orthonormal basis."
+        raise ValueError(msg)
+    psi.setflags(write=False)
+    return psi
+
+
+def balance_basis(sbp):
+    """
+    Generate an orthonormal basis of balances from a sequential binary partition.
+
+    Parameters
+    ---------------
+    sbp : :class:`numpy.ndarray` | :class:`list`
+        Sequential binary partition of shape (D-1, D), where each row divides a group
+        of components into those in the numerator (:code:`1`) and those in the
+        denominator (:code:`-1`) of a balance, with components outside of the group
+        given as :code:`0`.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        (D-1, D) read-only array of balance basis vectors, which can be passed to
+        :func:`~pyrolite.comp.codata.ilr` and
+        :func:`~pyrolite.comp.codata.inverse_ilr`.
+
+    Notes
+    -----
+        * Bases are validated once when compiled, and are cached for each partition.
+
+    Examples
+    ---------
+    .. code-block:: python
+
+        # (a, b | c, d), (a | b), (c | d)
+        psi = balance_basis([[1, 1, -1, -1], [1, -1, 0, 0], [0, 0, 1, -1]])
+    """
+    return _balance_basis(tuple(map(tuple, np.asarray(sbp, dtype=int))))
+
+
 def on_finite(X, f):
     """
     Calls a function on an array ignoring np.nan and +/- np.inf. Note that the
@@ -590,8 +664,138 @@ def nancov(X):
     return np.cov(Xnanfree)
 
 
+__OP_cache__ = {}
+
+
+def _OP_cache_key(xs, degree):
+    """
+    Key for the orthogonal polynomial parameter cache, consisting of the rounded
+    values of independent variable `x` and the polynomial degree.
+    """
+    return (tuple(np.round(np.array(xs, dtype=float), 12).tolist()), int(degree))
+
+
+def save_OP_cache(path):
+    """
+    Save the in-memory orthogonal polynomial parameter cache to disk.
+
+    Parameters
+    ----------
+    path : :class:`str` | :class:`pathlib.Path`
+        Path of the JSON file to write.
+
+    See Also
+    ---------
+    :func:`~pyrolite.util.math.load_OP_cache`
+    :func:`~pyrolite.util.math.OP_constants`
+    """
+    entries = [
+        {"xs": list(xs), "degree": degree, "params": [list(p) for p in params]}
+        for (xs, degree), params in __OP_cache__.items()
+    ]
+    with open(str(path), "w") as f:
+        json.dump(entries, f)
+
+
+def load_OP_cache(path):
+    """
+    Load orthogonal polynomial parameters from disk into the in-memory cache.
+
+    Parameters
+    ----------
+    path : :class:`str` | :class:`pathlib.Path`
+        Path of the JSON file to read (see :func:`save_OP_cache`).
+
+    Returns
+    --------
+    :class:`int`
+        Number of entries loaded.
+    """
+    with open(str(path), "r") as f:
+        entries = json.load(f)
+    for e in entries:
+        key = _OP_cache_key(e["xs"], e["degree"])
+        __OP_cache__[key] = tuple(tuple(float(v) for v in p) for p in e["params"])
+    return len(entries)
+
+
+def clear_OP_cache():
+    """
+    Clear the in-memory orthogonal polynomial parameter cache.
+    """
+    __OP_cache__.clear()
+
+
+def _OP_constants_numeric(xs, degree=3):
+    """
+    Numerically generate orthogonal polynomial parameters using the three-term
+    recurrence relation for polynomials orthogonal over a discrete set of points.
+
+    The parameters for each polynomial component are the roots of the monic
+    orthogonal polynomial of that degree, which are the eigenvalues of the
+    (symmetric tridiagonal) Jacobi matrix of the recurrence coefficients.
+    """
+    xs = np.array(xs, dtype=float)
+    alphas, betas = [], []  # recurrence coefficients
+    p_prev, p = np.zeros_like(xs), np.ones_like(xs)
+    norm_prev = 1.0
+    for k in range(max(degree - 1, 0)):
+        norm = p @ p
+        alphas.append((xs * p) @ p / norm)
+        betas.append(norm / norm_prev if k else 0.0)
+        p_prev, p = p, (xs - alphas[-1]) * p - betas[-1] * p_prev
+        norm_prev = norm
+
+    params = [()]
+    for d in range(1, degree):
+        J = np.diag(alphas[:d])
+        if d > 1:
+            off = np.sqrt(betas[1:d])
+            J += np.diag(off, 1) + np.diag(off, -1)
+        params.append(tuple(np.sort(np.linalg.eigvalsh(J)).tolist()))
+    return params[:degree]
+
+
+def _OP_constants_symbolic(xs, degree=3, tol=10 ** -14):
+    """
+    Generate orthogonal polynomial parameters by solving the systems of equations
+    for orthogonality symbolically with :mod:`sympy`.
+    """
+    import sympy  # imported here, as sympy is slow to import
+
+    xs = np.array(xs)
+    x = sympy.var("x")
+    params = []
+    for d in range(degree):
+        ps = sympy.symbols("{}0:{}".format(chr(945 + d), d))
+        logger.debug("Generating {} DIM {} equations for {}.".format(d, d, ps))
+        if d:
+            eqs = []
+            for _deg in range(d):
+                q = 1
+                if _deg:
+                    q = x ** _deg
+                for p in ps:
+                    q *= x - p
+                eqs.append(q)
+
+            sums = []
+            for q in eqs:
+                sumq = 0.0
+                for xi in xs:
+                    sumq += q.subs(dict(x=xi))
+                sums.append(sumq)
+
+            guess = np.linspace(np.nanmin(xs), np.nanmax(xs), d + 2)[1:-1]
+            result = sympy.nsolve(sums, ps, list(guess), tol=tol)
+            params.append(tuple(result))
+        else:
+            params.append(())  # first parameter
+    return params
+
+
 @update_docstring_references
-def OP_constants(xs, degree=3, tol=10 ** -14):
+def OP_constants(xs, degree=3, tol=10 ** -14, algorithm="numeric", cache=True):
     r"""
     Finds the parameters
     :math:`(\beta_0), (\gamma_0, \gamma_1), (\delta_0, \delta_1, \delta_2)` etc.
@@ -607,7 +811,14 @@ def OP_constants(xs, degree=3, tol=10 ** -14):
         Maximum polynomial degree. E.g. 2 will generate constant, linear, and quadratic
         polynomial components.
     tol : :class:`float`
-        Convergence tolerance for solver.
+        Convergence tolerance for solver (used only for the symbolic algorithm).
+    algorithm : :class:`str`, :code:`"numeric"`
+        Algorithm used to generate the parameters. The default :code:`"numeric"` uses
+        the three-term recurrence relation for discrete orthogonal polynomials, whereas
+        :code:`"symbolic"` solves the orthogonality equations using :mod:`sympy`.
+    cache : :class:`bool`, :code:`True`
+        Whether to use and populate the in-memory cache of numeric parameters, keyed
+        by `xs` and `degree` (see also :func:`save_OP_cache`, :func:`load_OP_cache`).
 
     Returns
     ---------
@@ -638,35 +849,18 @@ def OP_constants(xs, degree=3, tol=10 ** -14):
            Rare Earth Element Patterns in Basalts. J Petrology 57:1463–1508.
            doi: `10.1093/petrology/egw047 <https://dx.doi.org/10.1093/petrology/egw047>`__
     """
-    xs = np.array(xs)
-    x = var("x")
-    params = []
-    for d in range(degree):
-        ps = symbols("{}0:{}".format(chr(945 + d), d))
-        logger.debug("Generating {} DIM {} equations for {}.".format(d, d, ps))
-        if d:
-            eqs = []
-            for _deg in range(d):
-                q = 1
-                if _deg:
-                    q = x ** _deg
-                for p in ps:
-                    q *= x - p
-                eqs.append(q)
+    if algorithm == "symbolic":
+        return _OP_constants_symbolic(xs, degree=degree, tol=tol)
+    elif algorithm != "numeric":
+        raise NotImplementedError("Unknown algorithm: {}".format(algorithm))
 
-            sums = []
-            for q in eqs:
-                sumq = 0.0
-                for xi in xs:
-                    sumq += q.subs(dict(x=xi))
-                sums.append(sumq)
+    if not cache:
+        return _OP_constants_numeric(xs, degree=degree)
 
-            guess = np.linspace(np.nanmin(xs), np.nanmax(xs), d + 2)[1:-1]
-            result = nsolve(sums, ps, list(guess), tol=tol)
-            params.append(tuple(result))
-        else:
-            params.append(())  # first parameter
-    return params
+    key = _OP_cache_key(xs, degree)
+    if key not in __OP_cache__:
+        __OP_cache__[key] = tuple(_OP_constants_numeric(xs, degree=degree))
+    return list(__OP_cache__[key])
 
 
 def lambda_poly(x, ps):
@@ -706,7 +900,8 @@ def lambda_min_func(ls, ys, arrs, power=2.0):
         Arrays representing the individual unweighted orthaogonal polynomial components.
         E.g. arrs[0] = `[a, a, a]`, arrs[1] = `[(x-b), (x-b), (x-b)]` etc.
     power : :class:`float`
-        Power for the cost function. 1 for MAE/L1 norm, 2 for MSD/L2 norm.
+        Power for the cost function. As :func:`scipy.optimize.least_squares` squares
+        these costs, 1 corresponds to an L2 norm and 2 to an L4 norm.
 
     Returns
     -------
@@ -751,7 +946,8 @@ def lambdas(
     degree : :class:`int`
         Maximum degree polymomial component to include.
     costf_power : :class:`float`
-        Power of the optimization cost function.
+        Power of the optimization cost function (see :func:`lambda_min_func`). The
+        default of 2 corresponds to an L4 norm, and 1 to an L2 norm.
     residuals : :class:`bool`
         Whether to return residuals with the optimized results.
     min_func : :class:`Callable`
@@ -798,6 +994,102 @@ def lambdas(
         return x
 
 
+def lambda_poly_basis(xs, params):
+    """
+    Design matrix of the unweighted orthogonal polynomial components evaluated
+    over a given set of values for independent variable `x`.
+
+    Parameters
+    -----------
+    xs : :class:`numpy.ndarray`
+        Values of `x` to evaluate the polymomials over.
+    params : :class:`list`
+        Orthogonal polynomial coefficients (see :func:`OP_constants`).
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Array of shape :code:`(len(xs), len(params))`.
+    """
+    return np.array([lambda_poly(xs, pset) for pset in params]).T
+
+
+@update_docstring_references
+def lambdas_lstsq(
+    arr: np.ndarray, xs=np.array([]), params=None, degree=5, residuals=False
+):
+    """
+    Parameterises values based on linear combination of orthogonal polynomials
+    over a given set of values for independent variable `x` [#ref_1]_, solving for
+    all rows of an array with a single linear least squares problem.
+
+    Parameters
+    -----------
+    arr : :class:`numpy.ndarray`
+        Target data to fit, of shape :code:`(samples, len(xs))`.
+    xs : :class:`numpy.ndarray`
+        Values of `x` to construct the polymomials over.
+    params : :class:`list`, :code:`None`
+        Orthogonal polynomial coefficients (see :func:`OP_constants`). Defaults to
+        `None`, in which case these coefficinets are generated automatically.
+    degree : :class:`int`
+        Maximum degree polymomial component to include.
+    residuals : :class:`bool`
+        Whether to return residuals with the optimized results.
+
+    Returns
+    --------
+    :class:`numpy.ndarray` | (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        Weights of orthogonal polymomial regression (`lambdas`) of shape
+        :code:`(samples, degree)`.
+
+    Notes
+    ------
+        This is equivalent to :func:`lambdas` with :code:`costf_power=1` (an L2
+        norm, as the residual costs are squared by the optimiser). As the model is
+        linear in the lambdas, the design matrix is built once and solved for all
+        rows sharing a pattern of missing data at once, using only the available
+        values of `x` (see :func:`~pyrolite.util.missing.md_pattern`). The same
+        orthogonal polynomial parameters are used for each pattern, such that the
+        lambdas remain comparable. Rows with fewer finite values than the number of
+        parameters will return :class:`numpy.nan`.
+
+    See Also
+    ---------
+    :func:`~pyrolite.util.math.lambdas`
+    :func:`~pyrolite.util.math.OP_constants`
+    :func:`~pyrolite.geochem.transform.lambda_lnREE`
+
+    References
+    -----------
+    .. [#ref_1] O’Neill HSC (2016) The Smoothness and Shapes of Chondrite-normalized
+           Rare Earth Element Patterns in Basalts. J Petrology 57:1463–1508.
+           doi: `10.1093/petrology/egw047 <https://dx.doi.org/10.1093/petrology/egw047>`__
+    """
+    arr = np.atleast_2d(np.array(arr, dtype=float))
+    if params is None:
+        params = OP_constants(xs, degree=degree)
+    degree = len(params)
+    B = lambda_poly_basis(xs, params)  # (len(xs), degree)
+
+    x = np.nan * np.ones((arr.shape[0], degree))
+    res = np.nan * np.ones(arr.shape)
+    pID, pD = md_pattern(arr)
+    for ID, pattern in pD.items():
+        rows, avail = pID == ID, ~pattern["pattern"]
+        if (not rows.any()) or (avail.sum() < degree):  # underdetermined
+            continue
+        # single factorisation of the design matrix for all rows with this pattern
+        Bp = B[avail]
+        sol, _, _, _ = np.linalg.lstsq(Bp, arr[np.ix_(rows, avail)].T, rcond=None)
+        x[rows] = sol.T
+        res[np.ix_(rows, avail)] = arr[np.ix_(rows, avail)] - sol.T @ Bp.T
+    if residuals:
+        return x, res
+    else:
+        return x
+
+
 def lambda_poly_func(lambdas: np.ndarray, params=None, pxs=None, degree=5):
     """
     Expansion of lambda parameters back to the original space. Returns a
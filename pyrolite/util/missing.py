@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.special import comb
 from collections import defaultdict
 
 
@@ -21,30 +20,26 @@ def md_pattern(Y):
         for each pattern ID.
     """
     N, D = Y.shape
-    pID = np.zeros(N).astype(int)
     Ymiss = ~np.isfinite(Y)
-    rows = np.arange(N)[~np.isfinite(np.sum(Y, axis=1))]
-    max_pats = comb((D - 1) * np.ones(D - 2), np.arange(D - 2) + 1).sum().astype(int)
-    pID[rows] = max_pats * 10  # initialise to high value
+    pID = np.zeros(N).astype(int)
     pD = defaultdict(dict)
-
-    pindex = 0  # 0 = no missing data
-    pD[int(0)] = {"pattern": np.zeros(D).astype(bool), "freq": np.sum(pID == 0)}
-    indexes = np.arange(N).astype(int)
-    indexes = indexes[pID[indexes] > pindex]  # only look at md rows
-    for idx in indexes:
-        if pID[idx] > pindex:  # has missing data
-            pindex += 1
-            pID[idx] = pindex
-            pattern = Ymiss[idx, :]
-            pD[int(pindex)] = {"pattern": pattern, "freq": 0}
-            if idx < N:
-                _rix = np.arange(idx + 1, N)
-                to_compare = _rix[pID[_rix] > pindex]
-                where_same = to_compare[(Ymiss[to_compare, :] == pattern).all(axis=1)]
-                pID[where_same] = pindex
-    for ID in np.unique(pID).astype(int):
-        pD[ID]["freq"] = np.sum(pID == ID)
+    pD[int(0)] = {"pattern": np.zeros(D).astype(bool), "freq": 0}  # no missing data
+    if N:
+        # group identical rows of the missing data mask in a single sort
+        patterns, first, inverse = np.unique(
+            Ymiss, axis=0, return_index=True, return_inverse=True
+        )
+        ids = np.zeros(patterns.shape[0]).astype(int)
+        pindex = 0
+        for ix in np.argsort(first):  # number patterns in order of appearance
+            if patterns[ix].any():
+                pindex += 1
+                ids[ix] = pindex
+                pD[int(pindex)] = {"pattern": patterns[ix], "freq": 0}
+        pID = ids[inverse.flatten()]
+    for ID, freq in enumerate(np.bincount(pID)):
+        if freq:
+            pD[int(ID)]["freq"] = freq
     return pID, pD
 
 
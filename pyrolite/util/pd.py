@@ -336,3 +336,148 @@ def df_from_csvs(csvs, dropna=True, ignore_index=False, **kwargs):
 
     df = accumulate(dfs, ignore_index=ignore_index)
     return df
+
+
+def _apply_step(df, step):
+    """
+    Apply a single step of a pipeline to a dataframe.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to transform.
+    step : :class:`str` | :class:`tuple` | :class:`callable`
+        Step of the pipeline, either a callable accepting and returning a dataframe,
+        the name of an accessor method (e.g. :code:`"pyrochem.to_molecular"`) or a
+        tuple of the name of the method and a dictionary of keyword arguments.
+
+    Returns
+    --------
+    :class:`pandas.DataFrame`
+    """
+    if callable(step):
+        return step(df)
+    if isinstance(step, str):
+        name, kwargs = step, {}
+    else:
+        name, kwargs = step
+    method = df
+    for attr in name.split("."):  # e.g. pyrochem.normalize_to
+        method = getattr(method, attr)
+    return method(**kwargs)
+
+
+def apply_pipeline(df, pipeline=[]):
+    """
+    Apply a pipeline of operations to a dataframe.
+
+    Parameters
+    -----------
+    df : :class:`pandas.DataFrame`
+        Dataframe to transform.
+    pipeline : :class:`list`
+        Sequence of steps, each either a callable accepting and returning a dataframe,
+        the name of an accessor method (e.g. :code:`"pyrocomp.CLR"`) or a tuple of the
+        name of the method and a dictionary of keyword arguments
+        (e.g. :code:`("pyrochem.normalize_to", dict(reference="Chondrite_PON"))`).
+
+    Returns
+    --------
+    :class:`pandas.DataFrame`
+        Transformed dataframe.
+    """
+    for step in pipeline:
+        df = _apply_step(df, step)
+    return df
+
+
+def iter_pipeline(chunks, pipeline=[]):
+    """
+    Apply a pipeline of operations to each of an iterable of dataframes, such as
+    those returned by :code:`pd.read_csv(..., chunksize=...)`.
+
+    Parameters
+    -----------
+    chunks : :class:`iterable`
+        Iterable of dataframes.
+    pipeline : :class:`list`
+        Sequence of steps to apply to each chunk (see :func:`apply_pipeline`).
+
+    Yields
+    -------
+    :class:`pandas.DataFrame`
+        Transformed chunks.
+
+    Notes
+    ------
+    Only one chunk is held in memory at a time, and as such the pipeline should only
+    consist of operations which are independent between rows.
+    """
+    for chunk in chunks:
+        yield apply_pipeline(chunk, pipeline)
+
+
+def write_pipeline(chunks, pipeline=[], path=None, **kwargs):
+    """
+    Apply a pipeline of operations to each of an iterable of dataframes, writing
+    the transformed chunks to a single file.
+
+    Parameters
+    -----------
+    chunks : :class:`iterable`
+        Iterable of dataframes.
+    pipeline : :class:`list`
+        Sequence of steps to apply to each chunk (see :func:`apply_pipeline`).
+    path : :class:`str` | :class:`pathlib.Path`
+        Path of the output file, either a .csv or .parquet file.
+
+    Returns
+    --------
+    :class:`int`
+        Number of rows written.
+
+    Notes
+    ------
+    The output columns are set by the first chunk, and subsequent chunks will be
+    reindexed to match. Writing to .parquet requires :mod:`pyarrow`.
+    """
+    path = Path(path)
+    ext = path.suffix.replace(".", "")
+    assert ext in ["csv", "parquet"]
+    columns, writer, rows = None, None, 0
+    try:
+        for df in iter_pipeline(chunks, pipeline):
+            if columns is None:
+                columns = df.columns
+            else:
+                extra = [c for c in df.columns if c not in columns]
+                if extra:
+                    logger.warning(
+                        "Dropping columns not in first chunk: {}".format(extra)
+                    )
+                df = df.reindex(columns=columns)
+            if ext == "csv":
+                df.to_csv(
+                    str(path),
+                    mode="w" if writer is None else "a",
+                    header=writer is None,
+                    **subkwargs(kwargs, df.to_csv)
+                )
+                writer = True
+            else:
+                try:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                except ImportError:
+                    raise ImportError("Requires pyarrow.")
+                if writer is None:
+                    table = pa.Table.from_pandas(df)
+                    writer = pq.ParquetWriter(str(path), table.schema)
+                else:
+                    table = pa.Table.from_pandas(df, schema=writer.schema)
+                writer.write_table(table)
+            rows += df.index.size
+    finally:
+        if ext == "parquet" and writer is not None:
+            writer.close()
+    return rows
@@ -1,7 +1,7 @@
 import logging
 import numpy as np
 import pandas as pd
-from ...geochem.ind import __common_elements__, __common_oxides__, REE
+from ...geochem.ind import _common_components, REE
 
 try:
     from sklearn.base import TransformerMixin, BaseEstimator
@@ -45,9 +45,7 @@ class ColumnSelector(BaseEstimator, TransformerMixin):
 
 
 class CompositionalSelector(BaseEstimator, TransformerMixin):
-    def __init__(
-        self, components=__common_elements__ | __common_oxides__, inverse=False
-    ):
+    def __init__(self, components=None, inverse=False):
         self.columns = components
         self.inverse = inverse
 
@@ -56,16 +54,20 @@ class CompositionalSelector(BaseEstimator, TransformerMixin):
 
     def transform(self, X):
         assert isinstance(X, pd.DataFrame)
+        columns = self.columns
+        if columns is None:
+            elements, oxides = _common_components()
+            columns = elements | oxides
         if self.inverse:
-            out_cols = [i for i in X.columns if i not in self.columns]
+            out_cols = [i for i in X.columns if i not in columns]
         else:
-            out_cols = [i for i in X.columns if i in self.columns]
+            out_cols = [i for i in X.columns if i in columns]
         out = X.loc[:, out_cols]
         return out
 
 
 class MajorsSelector(BaseEstimator, TransformerMixin):
-    def __init__(self, components=__common_oxides__):
+    def __init__(self, components=None):
         self.columns = components
 
     def fit(self, X, y=None):
@@ -73,13 +75,16 @@ class MajorsSelector(BaseEstimator, TransformerMixin):
 
     def transform(self, X):
         assert isinstance(X, pd.DataFrame)
-        out_cols = [i for i in X.columns if i in self.columns]
+        columns = self.columns
+        if columns is None:
+            columns = _common_components()[1]
+        out_cols = [i for i in X.columns if i in columns]
         out = X.loc[:, out_cols]
         return out
 
 
 class ElementSelector(BaseEstimator, TransformerMixin):
-    def __init__(self, components=__common_elements__):
+    def __init__(self, components=None):
         self.columns = components
 
     def fit(self, X, y=None):
@@ -87,7 +92,10 @@ class ElementSelector(BaseEstimator, TransformerMixin):
 
     def transform(self, X):
         assert isinstance(X, pd.DataFrame)
-        out_cols = [i for i in X.columns if i in self.columns]
+        columns = self.columns
+        if columns is None:
+            columns = _common_components()[0]
+        out_cols = [i for i in X.columns if i in columns]
         out = X.loc[:, out_cols]
         return out
 
@@ -231,17 +231,26 @@ class CLRTransform(BaseEstimator, TransformerMixin):
 class ILRTransform(BaseEstimator, TransformerMixin):
     """
     Isometric Log Ratio Transformer for scikit-learn like use.
+
+    Parameters
+    -----------
+    psi : :class:`numpy.ndarray`
+        Orthonormal basis of shape :code:`(D-1, D)` to use for the transformation
+        (e.g. a balance basis from :func:`~pyrolite.util.math.balance_basis`). By
+        default, a helmert basis is used.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, psi=None, **kwargs):
         self.kpairs = kwargs
         self.label = "ILR"
         self.forward = ilr
         self.inverse = inverse_ilr
+        self.psi = psi
         self.X = None
 
     def transform(self, X, *args, **kwargs):
         self.X = np.array(X)
+        kwargs.setdefault("psi", self.psi)
         if isinstance(X, pd.DataFrame):
             out = pd.DataFrame(
                 index=X.index, data=self.forward(X.values, *args, **kwargs)
@@ -257,6 +266,7 @@ class ILRTransform(BaseEstimator, TransformerMixin):
         if "X" not in kwargs:
             if not self.X is not None:
                 kwargs.update(dict(X=self.X))
+        kwargs.setdefault("psi", self.psi)
         if isinstance(Y, pd.DataFrame):
             out = pd.DataFrame(
                 index=Y.index, data=self.inverse(Y.values, *args, **kwargs)
@@ -274,26 +284,31 @@ class ILRTransform(BaseEstimator, TransformerMixin):
 class BoxCoxTransform(BaseEstimator, TransformerMixin):
     """
     BoxCox Transformer for scikit-learn like use.
+
+    Parameters
+    -----------
+    per_column : :class:`bool`
+        Whether to estimate a lambda value for each column.
+    n_jobs : :class:`int`
+        Number of threads to use for refining lambda estimates.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, per_column=True, n_jobs=None, **kwargs):
         self.kpairs = kwargs
         self.label = "BoxCox"
         self.forward = boxcox
         self.inverse = inverse_boxcox
+        self.per_column = per_column
+        self.n_jobs = n_jobs
         self.lmbda = None
 
     def transform(self, X, *args, **kwargs):
         self.X = np.array(X)
         if "lmbda" not in kwargs:
-            if not (self.lmbda is None):
-                kwargs.update(dict(lmbda=self.lmbda))
-                data = self.forward(X, *args, **kwargs)
-            else:
-                kwargs.update(dict(return_lmbda=True))
-                data, lmbda = self.forward(X, *args, **kwargs)
-                self.lmbda = lmbda
-        return data
+            if self.lmbda is None:  # fit and transform in one pass
+                return self._fit(X, *args, **kwargs)
+            kwargs.update(dict(lmbda=self.lmbda))
+        return self.forward(X, *args, **kwargs)
 
     def inverse_transform(self, Y, *args, **kwargs):
         if "lmbda" not in kwargs:
@@ -301,8 +316,19 @@ class BoxCoxTransform(BaseEstimator, TransformerMixin):
         return self.inverse(Y, *args, **kwargs)
 
     def fit(self, X, *args, **kwargs):
-        bc_data, lmbda = boxcox(X, *args, **kwargs)
+        self._fit(X, *args, **kwargs)
+        return self
+
+    def _fit(self, X, *args, **kwargs):
+        """
+        Estimate the lambda values for the data, returning the transformed data.
+        """
+        kwargs.update(dict(return_lmbda=True))
+        kwargs.setdefault("per_column", self.per_column)
+        kwargs.setdefault("n_jobs", self.n_jobs)
+        bc_data, lmbda = self.forward(X, *args, **kwargs)
         self.lmbda = lmbda
+        return bc_data
 
 
 class Devolatilizer(BaseEstimator, TransformerMixin):
@@ -66,6 +66,7 @@ def random_composition(
     missingcols=None,
     missing=None,
     seed=None,
+    psi=None,
 ):
     """
     Generate a simulated random unimodal compositional dataset,
@@ -96,6 +97,11 @@ def random_composition(
             * If :code:`missing = "MAR"``, data will be missing with some relationship to other parameters.
             * If :code:`missing = "MNAR"``, data will be thresholded at some lower bound.
 
+    psi : :class:`numpy.ndarray`, :code:`None`
+        Optional orthonormal basis of shape :code:`(D-1, D)` (e.g. from
+        :func:`~pyrolite.util.math.balance_basis`) in which the covariance matrix
+        is specified. By default, a helmert basis is used.
+
     Returns
     --------
     :class:`numpy.ndarray`
@@ -132,7 +138,7 @@ def random_composition(
             data /= np.nanmax(data)
             return data
     else:
-        mean = ilr(mean.reshape(1, D)).reshape(
+        mean = ilr(mean.reshape(1, D), psi=psi).reshape(
             1, -1
         )  # ilr of a (1, D) mean to (1, D-1)
 
@@ -146,12 +152,12 @@ def random_composition(
     assert cov.shape in [(D - 1, D - 1), (1, 1)]
 
     if size == 1:  # single sample
-        data = inverse_ilr(mean).reshape(size, D)
+        data = inverse_ilr(mean, psi=psi).reshape(size, D)
 
     # if the covariance matrix isn't for the logspace data, we'd have to convert it
     if data is None:
         data = inverse_ilr(
-            np.random.multivariate_normal(mean.reshape(D - 1), cov, size=size)
+            np.random.multivariate_normal(mean.reshape(D - 1), cov, size=size), psi=psi
         ).reshape(size, D)
 
     if missingcols is None:
@@ -1,7 +1,11 @@
+import pickle
+import warnings
 import unittest
 import numpy as np
 from pyrolite.comp.aggregate import *
-from pyrolite.util.synthetic import test_df
+from pyrolite.comp.codata import clr, ilr, logratiomean
+from pyrolite.util.math import nancov, balance_basis
+from pyrolite.util.synthetic import test_df, random_composition
 
 import logging
 
@@ -392,5 +396,94 @@ class TestStandardiseAggregate(unittest.TestCase):
                     )
 
 
+class TestLogRatioAccumulator(unittest.TestCase):
+    """Tests the incremental accumulation of log-ratio statistics."""
+
+    def setUp(self):
+        self.cols = ["SiO2", "CaO", "MgO", "FeO", "TiO2"]
+        self.df = random_composition(size=1000, D=len(self.cols))
+        self.df = pd.DataFrame(self.df, columns=self.cols)
+
+    def test_default(self):
+        acc = LogRatioAccumulator()
+        for ix in range(0, self.df.index.size, 300):
+            acc.update(self.df.iloc[ix : ix + 300])
+        centre, cov = acc.finalize()
+        self.assertEqual(acc.n, self.df.index.size)
+        self.assertTrue(np.allclose(centre, logratiomean(self.df)))
+        self.assertTrue(np.allclose(cov, nancov(clr(self.df.values))))
+        self.assertTrue((cov.columns == self.cols).all())
+
+    def test_ilr(self):
+        psi = balance_basis(np.eye(5)[:-1] - np.triu(np.ones((5, 5)), k=1)[:-1])
+        acc = LogRatioAccumulator(transform="ilr", psi=psi)
+        for ix in range(0, self.df.index.size, 300):
+            acc.update(self.df.values[ix : ix + 300])
+        centre, cov = acc.finalize()
+        self.assertTrue(np.allclose(centre, logratiomean(self.df)))
+        self.assertTrue(np.allclose(cov, nancov(ilr(self.df.values, psi=psi))))
+
+    def test_merge(self):
+        parts = [LogRatioAccumulator() for _ in range(3)]
+        for ix, acc in enumerate(parts):
+            acc.update(self.df.iloc[ix::3])
+        acc = LogRatioAccumulator().merge(parts[0]).merge(parts[1]).merge(parts[2])
+        full = LogRatioAccumulator().update(self.df)
+        for merged, expect in zip(acc.finalize(), full.finalize()):
+            self.assertTrue(np.allclose(merged, expect))
+
+    def test_merge_column_order(self):
+        reordered = self.df.loc[:, self.cols[::-1]]
+        acc = LogRatioAccumulator().update(self.df.iloc[:500])
+        acc.merge(LogRatioAccumulator().update(reordered.iloc[500:]))
+        full = LogRatioAccumulator().update(self.df)
+        for merged, expect in zip(acc.finalize(), full.finalize()):
+            self.assertTrue(np.allclose(merged, expect))
+            self.assertTrue((merged.index == self.cols).all())
+
+        with self.assertRaises(ValueError):  # different columns
+            other = LogRatioAccumulator().update(self.df.iloc[:, :-1])
+            LogRatioAccumulator().update(self.df).merge(other)
+
+        with self.assertRaises(ValueError):  # ILR coordinates can't be reordered
+            other = LogRatioAccumulator(transform="ilr").update(reordered)
+            LogRatioAccumulator(transform="ilr").update(self.df).merge(other)
+
+    def test_merge_ilr_basis(self):
+        psi = balance_basis(np.eye(5)[:-1] - np.triu(np.ones((5, 5)), k=1)[:-1])
+        acc = LogRatioAccumulator(transform="ilr", psi=psi).update(self.df)
+        for other in [LogRatioAccumulator(transform="ilr"), LogRatioAccumulator()]:
+            with self.subTest(other=other):
+                with self.assertRaises(ValueError):
+                    acc.merge(other.update(self.df))
+
+    def test_missing(self):
+        df = self.df.copy()
+        df.iloc[::4, 1] = np.nan
+        acc = LogRatioAccumulator().update(df)
+        self.assertEqual(acc.n, df.dropna().index.size)
+        self.assertTrue(np.allclose(acc.finalize()[1], nancov(clr(df.values))))
+
+    def test_no_complete_records(self):
+        df = self.df.copy()
+        df.iloc[:10, 1] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            acc = LogRatioAccumulator().update(df.iloc[:10])
+        self.assertEqual(acc.n, 0)
+        acc.update(df.iloc[10:])
+        self.assertEqual(acc.n, df.index.size - 10)
+
+    def test_pickle(self):
+        acc = LogRatioAccumulator().update(self.df.iloc[:500])
+        acc = pickle.loads(pickle.dumps(acc)).update(self.df.iloc[500:])
+        full = LogRatioAccumulator().update(self.df)
+        self.assertTrue(np.allclose(acc.finalize()[1], full.finalize()[1]))
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            LogRatioAccumulator().finalize()
+
+
 if __name__ == "__main__":
     unittest.main()
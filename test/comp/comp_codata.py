@@ -1,6 +1,8 @@
 import unittest
 import numpy as np
+import scipy.stats
 from pyrolite.comp.codata import *
+from pyrolite.util.math import balance_basis
 from pyrolite.util.synthetic import test_df
 
 
@@ -145,6 +147,71 @@ class TestILR(unittest.TestCase):
         inv = inverse_ilr(out, X=df.values)
         self.assertTrue(np.allclose(inv, df.values))
 
+    def test_balance_basis(self):
+        """Checks that the transform can use a balance basis."""
+        X = close(self.df.values[:, :4])
+        psi = balance_basis([[1, 1, -1, -1], [1, -1, 0, 0], [0, 0, 1, -1]])
+        out = ilr(X, psi=psi)
+        logX = np.log(X)
+        # (a, b | c, d) balance, with a scaling of sqrt(2 * 2 / (2 + 2)) = 1
+        self.assertTrue(
+            np.allclose(out[:, 0], logX[:, :2].mean(1) - logX[:, 2:].mean(1))
+        )
+        inv = inverse_ilr(out, psi=psi)
+        self.assertTrue(np.allclose(inv, X))
+
+
+class TestLogRatioBuffers(unittest.TestCase):
+    """Tests output buffers, in-place operation and precision of log transforms."""
+
+    def setUp(self):
+        self.X = close(np.random.rand(100, 6))
+
+    def test_out(self):
+        for tfm, inv, dims in [
+            (clr, inverse_clr, 6),
+            (ilr, inverse_ilr, 5),
+            (alr, inverse_alr, 5),
+        ]:
+            with self.subTest(tfm=tfm.__name__):
+                out = np.empty((self.X.shape[0], dims))
+                Y = tfm(self.X, out=out)
+                self.assertIs(Y, out)
+                inv_out = np.empty(self.X.shape)
+                X = inv(Y, out=inv_out)
+                self.assertIs(X, inv_out)
+                self.assertTrue(np.allclose(X, self.X))
+
+    def test_inplace(self):
+        for tfm, inv in [(clr, inverse_clr), (alr, inverse_alr)]:
+            with self.subTest(tfm=tfm.__name__):
+                kwargs = dict(null_col=True) if tfm is alr else {}
+                X = self.X.copy()
+                expect = tfm(self.X, **kwargs)
+                Y = tfm(X, out=X, **kwargs)
+                self.assertIs(Y, X)
+                self.assertTrue(np.allclose(Y, expect))
+                self.assertTrue(np.allclose(inv(Y, out=Y, **kwargs), self.X))
+
+    def test_float32(self):
+        for tfm, inv in [(clr, inverse_clr), (ilr, inverse_ilr), (alr, inverse_alr)]:
+            with self.subTest(tfm=tfm.__name__):
+                Y = tfm(self.X.astype("float32"))
+                self.assertEqual(Y.dtype, np.float32)
+                self.assertEqual(tfm(self.X, dtype="float32").dtype, np.float32)
+                self.assertEqual(inv(Y).dtype, np.float32)
+                self.assertTrue(np.allclose(inv(Y), self.X, atol=1e-6))
+
+    def test_ilr_peak_memory(self):
+        import tracemalloc
+
+        X = close(np.random.rand(200000, 10))
+        tracemalloc.start()
+        Y = ilr(X)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, 1.5 * Y.nbytes)
+
 
 class TestBoxCox(unittest.TestCase):
     """Test the isometric log ratio transformation."""
@@ -176,6 +243,75 @@ class TestBoxCox(unittest.TestCase):
         inv = inverse_boxcox(out, lmbda)
         self.assertTrue(np.allclose(inv, df.values))
 
+    def test_per_column(self):
+        """Checks that lambdas can be estimated and inverted for each column."""
+        df = self.df
+        out, lmbda = boxcox(df.values, return_lmbda=True, per_column=True)
+        self.assertEqual(lmbda.shape, (df.columns.size,))
+        inv = inverse_boxcox(out, lmbda)
+        self.assertTrue(np.allclose(inv, df.values))
+
+
+class TestBoxCoxLambda(unittest.TestCase):
+    """Test the estimation of Box-Cox lambda values."""
+
+    def setUp(self):
+        rs = np.random.RandomState(0)
+        self.X = np.exp(rs.randn(200, 5) * np.linspace(0.2, 1.0, 5))
+
+    def test_maximum_likelihood(self):
+        """Checks that the refined lambdas match maximum likelihood estimates."""
+        lmbda = boxcox_lmbda(self.X)
+        expect = [scipy.stats.boxcox(x)[1] for x in self.X.T]
+        self.assertTrue(np.allclose(lmbda, expect, atol=10 ** -4))
+
+    def test_grid(self):
+        """Checks that unrefined lambdas lie on the search grid."""
+        grid = np.linspace(-1, 5, 100)
+        lmbda = boxcox_lmbda(self.X, refine=False)
+        self.assertTrue(np.isin(lmbda, grid).all())
+
+    def test_shared(self):
+        """Checks that a single lambda can be estimated for all columns."""
+        lmbda = boxcox_lmbda(self.X, per_column=False)
+        self.assertTrue(np.isscalar(lmbda))
+
+    def test_missing(self):
+        """Checks that missing values are ignored."""
+        X = self.X.copy()
+        X[::3, 1] = np.nan
+        lmbda = boxcox_lmbda(X)
+        self.assertTrue(np.isfinite(lmbda).all())
+        expect = scipy.stats.boxcox(X[:, 1][np.isfinite(X[:, 1])])[1]
+        self.assertTrue(np.isclose(lmbda[1], expect, atol=10 ** -4))
+
+    def test_all_missing(self):
+        """Checks that columns without finite values are given a nan lambda."""
+        X = self.X.copy()
+        X[:, 1] = np.nan
+        lmbda = boxcox_lmbda(X)
+        self.assertTrue(np.isnan(lmbda[1]))
+        self.assertTrue(
+            np.allclose(lmbda[[0, 2, 3, 4]], boxcox_lmbda(self.X)[[0, 2, 3, 4]])
+        )
+        shared = boxcox_lmbda(X, per_column=False)
+        expect = boxcox_lmbda(X[:, [0, 2, 3, 4]], per_column=False)
+        self.assertTrue(np.isclose(shared, expect))
+        self.assertTrue(np.isnan(boxcox_lmbda(X[:, 1], per_column=False)))
+
+    def test_threads(self):
+        """Checks that refining lambdas with multiple threads gives the same result."""
+        self.assertTrue(
+            np.allclose(boxcox_lmbda(self.X, n_jobs=2), boxcox_lmbda(self.X))
+        )
+
+    def test_threads_invalid(self):
+        """Checks that invalid numbers of threads are rejected."""
+        for n_jobs in [0, -2, 1.5]:
+            with self.subTest(n_jobs=n_jobs):
+                with self.assertRaises(ValueError):
+                    boxcox_lmbda(self.X, n_jobs=n_jobs)
+
 
 if __name__ == "__main__":
     unittest.main()
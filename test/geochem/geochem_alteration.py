@@ -1,6 +1,8 @@
 import unittest
 import numpy as np
+import pyrolite.geochem
 from pyrolite.geochem.alteration import *
+from pyrolite.geochem.transform import to_molecular
 
 
 class TestCIA(unittest.TestCase):
@@ -87,5 +89,50 @@ class TestWIP(unittest.TestCase):
         df.loc[:, "WIP"] = WIP(df)
 
 
+class TestAlterationIndices(unittest.TestCase):
+    """Tests calculation of multiple alteration indices."""
+
+    def setUp(self):
+        self.cols = ["SiO2", "CaO", "MgO", "FeO", "TiO2", "Na2O", "K2O", "Al2O3"]
+        self.df = pd.DataFrame(
+            {k: v for k, v in zip(self.cols, np.random.rand(len(self.cols), 10))}
+        )
+
+    def test_default(self):
+        out = alteration_indices(self.df)
+        self.assertEqual(
+            list(out.columns), ["CIA", "CIW", "PIA", "SAR", "SiTiIndex", "WIP"]
+        )
+        self.assertEqual(out.index.size, self.df.index.size)
+
+    def test_consistent(self):
+        moldf = to_molecular(self.df, renorm=False)
+        out = alteration_indices(self.df)
+        for index, func in zip(
+            ["CIA", "CIW", "PIA", "SAR", "SiTiIndex", "WIP"],
+            [CIA, CIW, PIA, SAR, SiTiIndex, WIP],
+        ):
+            with self.subTest(index=index):
+                self.assertTrue(np.allclose(out[index], func(moldf)))
+
+    def test_molecular(self):
+        out = alteration_indices(self.df, indices=["WIP", "CIA"], molecular=True)
+        self.assertEqual(list(out.columns), ["WIP", "CIA"])
+        self.assertTrue(np.allclose(out["CIA"], CIA(self.df)))
+
+    def test_missing_components(self):
+        out = alteration_indices(self.df.drop(columns=["TiO2"]))
+        self.assertTrue(out["SiTiIndex"].isnull().all())
+        self.assertTrue(out["CIA"].notnull().all())
+
+    def test_unknown_index(self):
+        with self.assertRaises(KeyError):
+            alteration_indices(self.df, indices=["NotAnIndex"])
+
+    def test_pyrochem(self):
+        out = self.df.pyrochem.alteration_indices(["CIA", "SAR"])
+        self.assertTrue(np.allclose(out, alteration_indices(self.df, ["CIA", "SAR"])))
+
+
 if __name__ == "__main__":
     unittest.main()
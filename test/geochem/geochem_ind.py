@@ -1,5 +1,9 @@
 import unittest
+import numpy as np
+import pandas as pd
+import periodictable as pt
 from pyrolite.geochem.ind import *
+from pyrolite.util.general import import_in_subprocess
 
 
 class TestGetCations(unittest.TestCase):
@@ -215,6 +219,112 @@ class TestGetIonicRadii(unittest.TestCase):
         radii = get_ionic_radii(self.ree, charge=3, coordination=8)
         self.assertTrue(isinstance(radii, list))
 
+    def test_ree_radii_list_consistent(self):
+        radii = get_ionic_radii(self.ree, charge=3, coordination=8)
+        expect = [get_ionic_radii(el, charge=3, coordination=8) for el in self.ree]
+        self.assertTrue(np.allclose(radii, expect))
+
+    def test_array_charges_coordinations(self):
+        els = np.array(["Ca", "Fe", "Fe", "Eu"])
+        charges, coordinations = [2, 2, 3, 2], [8, 6, 6, 8]
+        radii = get_ionic_radii(els, charge=charges, coordination=coordinations)
+        expect = [
+            get_ionic_radii(el, charge=c, coordination=co)
+            for el, c, co in zip(els, charges, coordinations)
+        ]
+        self.assertEqual(len(radii), len(expect))
+        for r, e in zip(radii, expect):
+            if isinstance(e, pd.Series):  # e.g. high and low spin variants
+                self.assertTrue(np.allclose(r.values, e.values))
+            else:
+                self.assertTrue(np.isclose(r, e))
+
+    def test_default_charge_consistent(self):
+        """Checks lists behave as single elements where default charges are used."""
+        els = ["Ca", "Ag", "La"]  # the default charge of Ag is not tabulated
+        radii = get_ionic_radii(els, coordination=8)
+        expect = [get_ionic_radii(el, coordination=8) for el in els]
+        for r, e in zip(radii, expect):
+            if isinstance(e, pd.Series):
+                self.assertTrue(r.equals(e))
+            else:
+                self.assertTrue(np.isclose(r, e))
+
+    def test_variant(self):
+        radii = get_ionic_radii("Fe", charge=2, coordination=6)
+        self.assertTrue(isinstance(radii, pd.Series))
+        self.assertEqual(radii.index.size, 2)
+        highspin = get_ionic_radii(
+            "Fe", charge=2, coordination=6, variant=["highspin"]
+        )
+        self.assertTrue(isinstance(highspin, float))
+        self.assertIn(highspin, radii.values)
+
+
+class TestComponentRegistry(unittest.TestCase):
+    """Checks the registry of molecular weights and cation stoichiometry."""
+
+    def setUp(self):
+        self.components = ["SiO2", "FeO", "Fe2O3", "Fe", "MgO"]
+
+    def test_registry(self):
+        reg = component_registry()
+        self.assertTrue(isinstance(reg, pd.DataFrame))
+        self.assertIn("Fe2O3", reg.index)
+        self.assertEqual(reg.loc["Fe2O3", "cations"], 2)
+
+    def test_molecular_weights(self):
+        mws = get_molecular_weights(self.components)
+        expect = [pt.formula(c).mass for c in self.components]
+        self.assertTrue(np.allclose(mws, expect))
+
+    def test_cation_factors(self):
+        factors = get_cation_factors(self.components)
+        self.assertTrue((factors <= 1.0).all())
+        self.assertTrue(np.isclose(factors[3], 1.0))
+        self.assertTrue(
+            np.isclose(factors[2], 2 * pt.Fe.mass / pt.formula("Fe2O3").mass)
+        )
+
+    def test_cation_factors_molecular(self):
+        factors = get_cation_factors(self.components, molecular=True)
+        self.assertTrue(np.allclose(factors, [1, 1, 2, 1, 1]))
+
+    def test_non_simple_components(self):
+        factors = get_cation_factors(["MgSiO3"])
+        self.assertTrue(np.isnan(factors).all())
+
+
+class TestImportCost(unittest.TestCase):
+    """
+    Checks that package data and slow dependencies are loaded on first use, rather
+    than on import.
+    """
+
+    def test_import_deferred(self):
+        ind = "pyrolite.geochem.ind"
+        result = import_in_subprocess(
+            ind,
+            check=["sympy"],
+            evaluate={
+                "shannon": ind + "._shannon_radii.cache_info().currsize",
+                "components": ind + "._common_components.cache_info().currsize",
+            },
+        )
+        msg = "Import of {} took {:.2f} s.".format(ind, result["time"])
+        self.assertFalse(result["values"]["shannon"], msg)
+        self.assertFalse(result["values"]["components"], msg)
+        self.assertEqual(result["loaded"], [], msg)
+
+    def test_module_collections(self):
+        from pyrolite.geochem import ind
+
+        self.assertIn("Si", ind.__common_elements__)
+        self.assertIn("SiO2", ind.__common_oxides__)
+        self.assertIn("element", ind.__shannon__.columns)
+        with self.assertRaises(AttributeError):
+            ind.__not_a_collection__
+
 
 # todo: get_cations
 
@@ -1,10 +1,125 @@
+import os
 import unittest
-from pyrolite.geochem.isotope.count import deadtime_correction
-
+import tempfile
+import numpy as np
+import pandas as pd
+from pyrolite.geochem.isotope.count import (
+    deadtime_correction,
+    block_statistics,
+    reduce_counts,
+)
 
 
 class TestDeadtimeCorrection(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.uniform(1000, 100000, size=(20, 3))
 
     def test_default(self):
         pass
         deadtime_correction(10000, 20)
+
+    def test_paralyzable(self):
+        x = self.data * 20 / 10 ** 9
+        expect = self.data * np.exp(x * np.exp(x * np.exp(x * np.exp(x))))
+        out = deadtime_correction(self.data, 20)
+        self.assertTrue(np.allclose(out, expect))
+
+    def test_nonparalyzable(self):
+        expect = self.data / (1.0 - self.data * 20 / 10 ** 9)
+        out = deadtime_correction(self.data, 20, method="nonparalyzable")
+        self.assertTrue(np.allclose(out, expect))
+
+    def test_inplace(self):
+        data = self.data.copy()
+        out = deadtime_correction(data, 20, out=data)
+        self.assertIs(out, data)
+        self.assertTrue(np.allclose(out, deadtime_correction(self.data, 20)))
+
+    def test_zero_deadtime(self):
+        for method in ["paralyzable", "nonparalyzable"]:
+            with self.subTest(method=method):
+                out = deadtime_correction(self.data, 0, method=method)
+                self.assertTrue(np.allclose(out, self.data))
+
+    def test_pandas(self):
+        df = pd.DataFrame(self.data, columns=["a", "b", "c"], index=range(5, 25))
+        for data in [df, df["a"]]:
+            with self.subTest(data=type(data)):
+                out = deadtime_correction(data, 20)
+                self.assertIsInstance(out, type(data))
+                self.assertTrue(out.index.equals(data.index))
+                expect = deadtime_correction(data.values, 20)
+                self.assertTrue(np.allclose(out.values, expect))
+
+
+class TestBlockStatistics(unittest.TestCase):
+    def setUp(self):
+        self.ratios = np.random.normal(0.7, 0.001, size=(4, 20, 2))
+
+    def test_default(self):
+        mean, std, se, n = block_statistics(self.ratios, nsigma=None)
+        self.assertEqual(mean.shape, (4, 2))
+        self.assertTrue(np.allclose(mean, self.ratios.mean(axis=1)))
+        self.assertTrue(np.allclose(std, self.ratios.std(axis=1, ddof=1)))
+        self.assertTrue((n == 20).all())
+
+    def test_outlier_rejection(self):
+        ratios = self.ratios.copy()
+        ratios[1, 5, 0] = 1.0
+        mean, std, se, n = block_statistics(ratios, nsigma=3)
+        self.assertEqual(n[1, 0], 19)
+        self.assertTrue(np.isclose(mean[1, 0], 0.7, atol=0.001))
+
+    def test_missing(self):
+        ratios = self.ratios.copy()
+        ratios[0, :19, 1] = np.nan  # single remaining cycle
+        mean, std, se, n = block_statistics(ratios)
+        self.assertEqual(n[0, 1], 1)
+        self.assertTrue(np.isfinite(mean[0, 1]))
+
+
+class TestReduceCounts(unittest.TestCase):
+    def setUp(self):
+        self.counts = np.random.poisson([50000, 70000, 30000], size=(105, 3)).astype(
+            float
+        )
+        self.ratios = [(0, 1), (2, 1)]
+
+    def test_default(self):
+        out = reduce_counts(self.counts, self.ratios, 20)
+        self.assertEqual(out.index.size, 6)  # final block of 5 cycles
+        self.assertLessEqual(out[("0/1", "n")].iloc[-1], 5)
+        expect = self.counts[:20, 0] / self.counts[:20, 1]
+        self.assertTrue(
+            np.isclose(
+                reduce_counts(self.counts, self.ratios, 20, nsigma=None).iloc[0, 0],
+                expect.mean(),
+            )
+        )
+
+    def test_chunked(self):
+        kwargs = dict(deadtime=20, blank=[10.0, 5.0, 2.0])
+        expect = reduce_counts(self.counts, self.ratios, 20, **kwargs)
+        out = reduce_counts(self.counts, self.ratios, 20, chunksize=4, **kwargs)
+        self.assertTrue(np.allclose(out.values, expect.values))
+
+    def test_memmap_inplace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "counts.npy")
+            np.save(path, self.counts)
+            counts = np.load(path, mmap_mode="r+")
+            out = reduce_counts(
+                counts, self.ratios, 20, deadtime=20, inplace=True, chunksize=2
+            )
+            del counts
+            corrected = np.load(path)
+            self.assertTrue(
+                np.allclose(corrected, deadtime_correction(self.counts, 20))
+            )
+            expect = reduce_counts(self.counts, self.ratios, 20, deadtime=20)
+            self.assertTrue(np.allclose(out.values, expect.values))
+            del corrected
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pyrolite.geochem
+from pyrolite.comp.codata import renormalise
+from pyrolite.util.synthetic import test_df
+from pyrolite.geochem.transform import (
+    to_molecular,
+    to_weight,
+    devolatilise,
+    recalculate_Fe,
+)
+from pyrolite.geochem.lazy import LazyChain
+
+
+class TestLazyChain(unittest.TestCase):
+    def setUp(self):
+        self.cols = ["MgO", "SiO2", "CaO", "FeO", "Fe2O3", "TiO2", "H2O", "CO2"]
+        self.df = renormalise(test_df(cols=self.cols, index_length=20))
+
+    def test_empty_chain(self):
+        out = LazyChain(self.df).compute()
+        self.assertTrue(np.allclose(out.values, self.df.values))
+        self.assertIsNot(out, self.df)
+
+    def test_accessor(self):
+        chain = self.df.pyrochem.lazy()
+        self.assertIsInstance(chain, LazyChain)
+        self.assertIsInstance(chain.to_molecular(), LazyChain)  # chainable
+        self.assertIn("to_molecular", repr(chain))
+
+    def test_deferred(self):
+        df = self.df.copy()
+        chain = df.pyrochem.lazy().devolatilise().to_molecular()
+        self.assertTrue((df.columns == self.df.columns).all())
+        self.assertTrue(np.allclose(df.values, self.df.values))
+
+    def test_scalings(self):
+        out = self.df.pyrochem.lazy().to_molecular(renorm=False).to_weight().compute()
+        self.assertTrue(np.allclose(out.values, renormalise(self.df).values))
+
+    def test_consistent_with_eager(self):
+        df = self.df.copy()
+        df.iloc[0, 3] = np.nan  # missing FeO
+        eager = (
+            to_molecular(
+                recalculate_Fe(devolatilise(df), to="FeOT", renorm=True), renorm=False
+            )
+            * 10000
+        )
+        lazy = (
+            df.pyrochem.lazy()
+            .devolatilise()
+            .recalculate_Fe(to="FeOT", renorm=True)
+            .to_molecular(renorm=False)
+            .scale("wt%", "ppm")
+            .compute()
+        )
+        self.assertEqual(list(lazy.columns), list(eager.columns))
+        self.assertTrue(np.allclose(lazy.values, eager.values, equal_nan=True))
+
+    def test_fe_speciation_consistent_with_eager(self):
+        to = {"FeO": 0.9, "Fe2O3": 0.1}
+        eager = to_weight(recalculate_Fe(to_molecular(self.df), to=to, molecular=True))
+        lazy = (
+            self.df.pyrochem.lazy()
+            .to_molecular()
+            .recalculate_Fe(to=to, molecular=True)
+            .to_weight()
+            .compute()
+        )
+        self.assertEqual(list(lazy.columns), list(eager.columns))
+        self.assertTrue(np.allclose(lazy.values, eager.values))
+
+    def test_renormalise(self):
+        out = self.df.pyrochem.lazy().devolatilise(renorm=False).renormalise(1.0)
+        out = out.compute()
+        self.assertTrue(np.allclose(out.sum(axis=1), 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
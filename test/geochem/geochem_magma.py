@@ -1,5 +1,8 @@
+import os
 import unittest
+import tempfile
 import numpy as np
+from numpy.lib.format import open_memmap
 from pyrolite.geochem.magma import *
 from io import StringIO
 
@@ -105,6 +108,45 @@ class TestSCSS(unittest.TestCase):
         self.assertIsInstance(sulfide, np.ndarray)
         self.assertTrue(sulfide.ndim == 3)
 
+    def test_grid_chunked(self):
+        T, P = self.T[:5], self.P[:3]
+        expect = SCSS(self.df, T=T, P=P, grid="grid")
+        for grid, chunked in zip(
+            expect, SCSS(self.df, T=T, P=P, grid="grid", chunksize=3)
+        ):
+            self.assertTrue(np.allclose(grid, chunked))
+
+    def test_float32(self):
+        sulfate, sulfide = SCSS(
+            self.df, T=self.T, P=self.P, grid="grid", dtype="float32"
+        )
+        self.assertEqual(sulfide.dtype, np.float32)
+        expect = SCSS(self.df, T=self.T, P=self.P, grid="grid")[1]
+        self.assertTrue(np.allclose(sulfide, expect, rtol=1e-6))
+
+    def test_out(self):
+        shape = (self.df.index.size, self.T.size)
+        out = tuple(np.zeros(shape) for _ in range(2))
+        sulfate, sulfide = SCSS(self.df, T=self.T, P=self.P, grid="geotherm", out=out)
+        self.assertIs(sulfide, out[1])
+        expect = SCSS(self.df, T=self.T, P=self.P, grid="geotherm")[1]
+        self.assertTrue(np.allclose(sulfide, expect))
+
+    def test_memmap(self):
+        T, P = self.T[:5], self.P[:3]
+        shape = (self.df.index.size, T.size, P.size)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, f) for f in ["sulfate.npy", "sulfide.npy"]]
+            out = tuple(
+                open_memmap(p, mode="w+", dtype="float32", shape=shape) for p in paths
+            )
+            SCSS(self.df, T=T, P=P, grid="grid", out=out, chunksize=4)
+            del out
+            sulfide = np.load(paths[1])
+            expect = SCSS(self.df, T=T, P=P, grid="grid")[1]
+            self.assertTrue(np.allclose(sulfide, expect, rtol=1e-6))
+            del sulfide
+
 
 if __name__ == "__main__":
     unittest.main()
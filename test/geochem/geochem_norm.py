@@ -8,9 +8,13 @@ from pyrolite.geochem.norm import (
     Composition,
     get_reference_composition,
     all_reference_compositions,
+    reference_registry,
+    clear_reference_registry,
+    get_reference_abundances,
 )
 from pyrolite.util.general import temp_path, remove_tempdir
 from pyrolite.util.meta import pyrolite_datafolder
+from pyrolite.util.units import scale
 
 
 class TestComposition(unittest.TestCase):
@@ -44,6 +48,94 @@ class TestGetReferenceComposition(unittest.TestCase):
         self.assertIsInstance(out, Composition)
 
 
+class TestReferenceRegistry(unittest.TestCase):
+    def setUp(self):
+        self.name = "Chondrite_PON"
+
+    def test_shared(self):
+        self.assertIs(reference_registry()[self.name], reference_registry()[self.name])
+        rc = get_reference_composition(self.name)
+        self.assertIsNot(rc, reference_registry()[self.name])
+        self.assertIsNot(rc, get_reference_composition(self.name))
+
+    def test_modifiable(self):
+        """Check that returned compositions can be modified in place."""
+        rc = get_reference_composition(self.name)
+        ppm = rc.comp.values * rc.units.apply(scale, target_unit="ppm").values
+        rc.set_units("ppm")
+        self.assertTrue(np.allclose(rc.comp.values, ppm))
+        self.assertTrue((rc.units == "ppm").all())
+        new = get_reference_composition(self.name)
+        self.assertFalse(np.allclose(new.comp.values, ppm))
+
+    def test_immutable(self):
+        rc = reference_registry()[self.name]
+        before, units = rc.comp, rc.units
+        with self.assertRaises(AttributeError):
+            rc.comp = rc.comp * 2
+        with self.assertRaises(AttributeError):
+            rc.comp *= 2
+        rc.comp.loc[:, :] = 0.0  # modifies a copy only
+        rc.units[:] = "ppb"
+        self.assertTrue(np.allclose(rc.comp.values, before.values))
+        self.assertTrue((rc.units == units).all())
+
+    def test_immutable_set_units(self):
+        rc = reference_registry()[self.name]
+        with self.assertRaises(AttributeError):
+            rc.set_units("ppm")
+
+    def test_copy(self):
+        rc = reference_registry()[self.name]
+        cp = rc.copy()
+        self.assertIsNot(cp, rc)
+        cp.comp = cp.comp * 2  # copies can be modified
+        self.assertTrue(np.allclose(cp.comp.values, rc.comp.values * 2))
+
+    def test_clear(self):
+        rc = reference_registry()[self.name]
+        clear_reference_registry()
+        new = reference_registry()[self.name]
+        self.assertIsNot(rc, new)
+        self.assertTrue(np.allclose(rc.comp.values, new.comp.values))
+
+
+class TestGetReferenceAbundances(unittest.TestCase):
+    def setUp(self):
+        self.name = "Chondrite_PON"
+        self.columns = ["La", "Ce", "SiO2", "Ti", "Unknown"]
+
+    def test_default(self):
+        rc = get_reference_composition(self.name)
+        out = get_reference_abundances(self.name, self.columns)
+        self.assertEqual(out.size, len(self.columns))
+        self.assertTrue(np.allclose(out, rc[self.columns], equal_nan=True))
+
+    def test_cached(self):
+        out = get_reference_abundances(self.name, self.columns, units="ppm")
+        self.assertIs(out, get_reference_abundances(self.name, self.columns, "ppm"))
+        self.assertIs(
+            out,
+            get_reference_abundances(
+                reference_registry()[self.name], self.columns, "ppm"
+            ),
+        )
+        self.assertFalse(out.flags.writeable)
+
+    def test_units(self):
+        ppm = get_reference_abundances(self.name, self.columns, units="ppm")
+        wt = get_reference_abundances(self.name, self.columns, units="wt%")
+        self.assertTrue(np.allclose(ppm, wt * 10000, equal_nan=True))
+
+    def test_convert_first(self):
+        out = get_reference_abundances(self.name, ["TiO2"], convert_first=True)
+        self.assertTrue(np.isfinite(out).all())
+
+    def test_array(self):
+        out = get_reference_abundances(np.ones(3), ["La", "Ce", "Pr"])
+        self.assertTrue(np.allclose(out, 1.0))
+
+
 class TestUpdateReferenceDataBase(unittest.TestCase):
     def setUp(self):
         self.tmppath = temp_path(suffix="refdbtest")
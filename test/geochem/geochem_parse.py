@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 from pyrolite.geochem.ind import REE
 from pyrolite.geochem.parse import *
+from pyrolite.geochem.parse import _tochem
 
 
 class TestIsChem(unittest.TestCase):
@@ -45,6 +46,25 @@ class TestToChem(unittest.TestCase):
         ret = tochem(self.ree)
         self.assertTrue(ret == list(map(str, self.ree)))
 
+    def test_tochem_single(self):
+        self.assertEqual(tochem("sio2"), "SiO2")
+
+    def test_tochem_index(self):
+        headers = pd.Index(["sio2", "MGO", "co", "87sr/86sr", "Notachemical"] * 50)
+        ret = tochem(headers)
+        self.assertIsInstance(ret, list)
+        self.assertEqual(
+            ret[:5], ["SiO2", "MgO", "Co", "87Sr86Sr", "Notachemical"]
+        )  # elements take precedence over oxides (Co vs CO)
+        self.assertEqual(ret, tochem(list(headers)))
+
+    def test_tochem_memoised(self):
+        headers = ["Notachemical{}".format(ix) for ix in range(5)] * 10
+        tochem(headers)
+        hits = _tochem.cache_info().hits
+        tochem(headers)
+        self.assertEqual(_tochem.cache_info().hits - hits, 50)
+
 
 class TestMultipleCationInclusion(unittest.TestCase):
     """Tests the pandas dataframe multiple inclusion checking."""
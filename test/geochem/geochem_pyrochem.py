@@ -38,6 +38,32 @@ class TestPyrochem(unittest.TestCase):
                 out = getattr(obj.pyrochem, index)
                 self.assertIsInstance(out, list)
 
+    def test_pyrochem_column_index(self):
+        obj = self.df
+        index = obj.pyrochem._columns
+        self.assertIs(index, obj.copy().pyrochem._columns)  # cached by columns
+        positions, labels = index["compositional"]
+        self.assertEqual(list(labels), list(obj.columns[positions]))
+        self.assertEqual(list(labels), obj.pyrochem.list_compositional)
+        self.assertFalse(positions.flags.writeable)
+
+    def test_pyrochem_column_index_ordering(self):
+        obj = self.df.loc[:, self.df.columns[::-1]]
+        self.assertEqual(obj.pyrochem.list_REE, pyrolite.geochem.REE())
+        self.assertEqual(obj.pyrochem.list_oxides, ["H2O", "FeO", "CaO", "SiO2", "MgO"])
+        self.assertTrue(
+            np.allclose(obj.pyrochem.REE.values, self.df.pyrochem.REE.values)
+        )
+
+    def test_pyrochem_subset_copies(self):
+        obj = self.df.copy()
+        for subset in ["REE", "oxides"]:  # contiguous and non-contiguous columns
+            with self.subTest(subset=subset):
+                out = getattr(obj.pyrochem, subset)
+                self.assertFalse(np.shares_memory(out.values, obj.values))
+                out.iloc[:, 0] = -1.0
+                self.assertTrue((obj[out.columns[0]] != -1.0).all())
+
     def test_pyrochem_subsetters(self):
         obj = self.df
         for subset in ["REE", "elements", "oxides"]:
@@ -97,6 +123,13 @@ class TestPyrochem(unittest.TestCase):
                 obj.pyrochem.add_ratio(ratio)
                 self.assertIn(ratio, obj.columns)
 
+    def test_pyrochem_get_ratios(self):
+        obj = self.df.copy(deep=True)
+        ratios = ["MgO/SiO2", "MgO/Ti", "Lu/Hf", "Mg/TiO2"]
+        out = obj.pyrochem.get_ratios(ratios)
+        self.assertEqual(list(out.columns), ratios)
+        self.assertTrue((obj.columns == self.df.columns).all())
+
     def test_pyrochem_aggregate_element(self):
         obj = self.df.copy(deep=True)
 
@@ -147,6 +180,29 @@ class TestPyrochem(unittest.TestCase):
         obj = self.df.copy(deep=True)
         out = obj.pyrochem.normalize_to(np.ones(obj.columns.size))
 
+    def test_pyrochem_normalize_to_multiple(self):
+        obj = self.df.copy(deep=True)
+        refs = ["Chondrite_PON", get_reference_composition("PM_PON")]
+        out = obj.pyrochem.normalize_to(refs, units="ppm")
+        self.assertEqual(out.columns.nlevels, 2)
+        self.assertEqual(
+            list(out.columns.levels[0]), sorted(["Chondrite_PON", "PM_PON"])
+        )
+        for r in refs:
+            with self.subTest(reference=r):
+                name = r if isinstance(r, str) else r.name
+                expect = obj.pyrochem.normalize_to(r, units="ppm")
+                self.assertTrue(np.allclose(out[name], expect, equal_nan=True))
+        arr = obj.pyrochem.normalize_to(refs, units="ppm", as_array=True)
+        self.assertEqual(arr.shape, (obj.index.size, 2, out.columns.size // 2))
+
+    def test_pyrochem_normalize_to_multiple_invalid(self):
+        obj = self.df.copy(deep=True)
+        for refs in [[], ["Chondrite_PON", get_reference_composition("Chondrite_PON")]]:
+            with self.subTest(refs=refs):
+                with self.assertRaises(ValueError):
+                    obj.pyrochem.normalize_to(refs, units="ppm")
+
     def test_pyrochem_denormalize_from_str(self):
         obj = self.df.copy(deep=True)
         out = obj.pyrochem.denormalize_from("Chondrite_PON")
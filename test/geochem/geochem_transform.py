@@ -406,6 +406,13 @@ class TestGetRatio(unittest.TestCase):
             with self.subTest(norm_to=norm_to):
                 r = get_ratio(df, ratio=ratio, norm_to=norm_to)
 
+    def test_same_cation(self):
+        """Check ratios of components of the same cation."""
+        df = self.df.copy()
+        ratio = get_ratio(df, "CaO/Ca")
+        expect = pt.formula("CaO").mass / pt.Ca.mass
+        self.assertTrue(np.allclose(ratio, expect))
+
     def test_alias(self):
         """Check that aliases can be used."""
         df = self.df.copy()
@@ -414,6 +421,50 @@ class TestGetRatio(unittest.TestCase):
         r = get_ratio(df, ratio=ratio, alias=alias)
         self.assertTrue(r.name == alias)
 
+    def test_norm_applied(self):
+        """Check that ratios are normalised to the reference composition."""
+        df = self.df.copy()
+        raw = get_ratio(df, "Li/B")
+        r = get_ratio(df, "Li/B_n", norm_to=(1.0, 2.0))
+        self.assertTrue(np.allclose(r, raw * 2.0))
+
+
+class TestGetRatios(unittest.TestCase):
+    """Tests the batch ratio calculation."""
+
+    def setUp(self):
+        self.df = test_df(cols=["Si", "Mg", "MgO", "CaO", "Li", "B", "La", "Yb"])
+        self.ratios = ["CaO/Si", "Mg/Si", "Li/B", "La/Yb"]
+
+    def test_none(self):
+        """Check the ratio calculation copes with no records."""
+        out = get_ratios(self.df.head(0), self.ratios)
+        self.assertEqual(list(out.columns), self.ratios)
+
+    def test_consistent_with_get_ratio(self):
+        """Check the batch calculation matches individual ratios."""
+        out = get_ratios(self.df, self.ratios)
+        for ratio in self.ratios:
+            with self.subTest(ratio=ratio):
+                self.assertTrue(np.allclose(out[ratio], get_ratio(self.df, ratio)))
+
+    def test_aliases(self):
+        """Check that aliases can be used."""
+        aliases = ["a", None, "c", "d"]
+        out = get_ratios(self.df, self.ratios, aliases=aliases)
+        self.assertEqual(list(out.columns), ["a", "Mg/Si", "c", "d"])
+
+    def test_norm(self):
+        """Check that normalisation applies only where requested."""
+        norm = get_reference_composition("Chondrite_PON")
+        out = get_ratios(self.df, ["La/Yb", "La/Yb_n"], norm_to=None)
+        expect = out["La/Yb"] / (norm["La"] / norm["Yb"])
+        self.assertTrue(np.allclose(out["La/Yb_n"], expect))
+        for norm_to in ["Chondrite_PON", norm, {"La": norm["La"], "Yb": norm["Yb"]}]:
+            with self.subTest(norm_to=norm_to):
+                out = get_ratios(self.df, ["La/Yb"], norm_to=norm_to)
+                self.assertTrue(np.allclose(out["La/Yb"], expect))
+
 
 class TestAddMgNo(unittest.TestCase):
     """Tests the MgNo addition."""
@@ -459,6 +510,14 @@ class TestAddMgNo(unittest.TestCase):
         """Check that the function works for multiple component Fe."""
         pass
 
+    def test_total_approx(self):
+        """Check the total iron approximation increases Mg# with oxidation."""
+        df = self.df.copy()
+        reduced = add_MgNo(df.copy(), use_total_approx=True, approx_Fe203_frac=0.0)
+        approx = add_MgNo(df.copy(), use_total_approx=True, approx_Fe203_frac=0.5)
+        self.assertTrue((approx["Mg#"] > reduced["Mg#"]).all())
+        self.assertTrue(((approx["Mg#"] > 0) & (approx["Mg#"] < 1)).all())
+
 
 class TestLambdaLnREE(unittest.TestCase):
     def setUp(self):
@@ -469,6 +528,20 @@ class TestLambdaLnREE(unittest.TestCase):
         self.df.loc[1, :] = self.df.loc[0, :]
         self.default_degree = 3
 
+    def smooth_df(self, lambdas, size=2):
+        """
+        Generate REE data with a chondrite-normalised pattern which is exactly
+        described by a set of lambdas.
+        """
+        ree = [i for i in self.df.columns if i not in ["Eu"]]
+        radii = np.array(get_ionic_radii(ree, coordination=8, charge=3))
+        params = OP_constants(radii, degree=len(lambdas))
+        els = list(self.df.columns)
+        all_radii = np.array(get_ionic_radii(els, coordination=8, charge=3))
+        func = lambda_poly_func(lambdas, pxs=radii, params=params)
+        pattern = self.C[els] * np.exp(func(all_radii))
+        return pd.DataFrame(np.repeat([pattern], size, axis=0), columns=els)
+
     def test_exclude(self):
         """
         Tests the ability to generate lambdas from different element sets.
@@ -498,12 +571,75 @@ class TestLambdaLnREE(unittest.TestCase):
                 ret = lambda_lnREE(self.df, norm_to=norm_to, degree=self.default_degree)
                 self.assertTrue(ret.columns.size == self.default_degree)
 
+    def test_algorithm(self):
+        """
+        Tests that the least squares and optimization algorithms agree.
+        """
+        df = self.df * np.linspace(50.0, 5.0, self.df.columns.size)
+        ls = lambda_lnREE(df, degree=self.default_degree, algorithm="lstsq")
+        opt = lambda_lnREE(
+            df, degree=self.default_degree, algorithm="opt", costf_power=1.0
+        )
+        self.assertTrue(np.allclose(ls.values, opt.values, rtol=10 ** -3))
+        # least squares is used by default only for the equivalent cost function
+        l2 = lambda_lnREE(df, degree=self.default_degree, costf_power=1.0)
+        self.assertTrue(np.allclose(l2.values, ls.values))
+        l4 = lambda_lnREE(df, degree=self.default_degree)
+        expect = lambda_lnREE(df, degree=self.default_degree, algorithm="opt")
+        self.assertTrue(np.allclose(l4.values, expect.values))
+        with self.assertRaises(ValueError):
+            lambda_lnREE(
+                df, degree=self.default_degree, algorithm="lstsq", costf_power=2
+            )
+
+    def test_missing_values(self):
+        """
+        Tests that rows with missing REE are fit using the available REE.
+        """
+        lambdas = np.array([1.0, 10.0, -50.0])
+        df = self.smooth_df(lambdas, 6)
+        ree = [i for i in df.columns if i not in ["Eu"]]
+        df.loc[[2, 4], "La"] = np.nan
+        df.loc[3, ["Ce", "Gd"]] = np.nan
+        df.loc[5, "Lu"] = 0.0
+        df.loc[1, ree[2:]] = np.nan  # too few values to fit
+        for algorithm, kw in [("lstsq", {}), ("opt", dict(costf_power=1.0))]:
+            with self.subTest(algorithm=algorithm):
+                ret = lambda_lnREE(
+                    df, degree=self.default_degree, algorithm=algorithm, **kw
+                )
+                self.assertTrue(np.isnan(ret.loc[1, :]).all())
+                valid = ret.drop(index=1).values
+                self.assertTrue(np.allclose(valid, lambdas, rtol=10 ** -3))
+
     def test_append(self):
         """
         Tests the ability to append a function to the dataframe returned.
         """
         ret = lambda_lnREE(self.df, degree=self.default_degree, append=["function"])
         self.assertTrue("lambda_poly_func" in ret.columns)
+        self.assertTrue(all(callable(f) for f in ret["lambda_poly_func"]))
+
+    def test_append_residuals_anomalies(self):
+        """
+        Tests the residuals and anomalies appended to the dataframe returned.
+        """
+        lambdas = np.array([1.0, 10.0, -50.0])
+        df = self.smooth_df(lambdas, 3)
+        df.loc[1, "Eu"] *= 0.5
+        df.loc[2, "Ce"] *= 2.0
+        ret = lambda_lnREE(
+            df,
+            degree=self.default_degree,
+            append=["residuals", "Eu", "Ce"],
+            costf_power=1.0,
+        )
+        residuals = [c for c in ret.columns if c.endswith("_residual")]
+        self.assertEqual(len(residuals), df.columns.size - 1)  # Eu excluded
+        self.assertTrue(np.allclose(ret.loc[[0, 1], residuals], 0.0))
+        self.assertTrue(np.allclose(ret.loc[[0, 1], "Eu/Eu*"], [1.0, 0.5]))
+        self.assertTrue(np.allclose(ret.loc[[0, 1], "Ce/Ce*"], 1.0))
+        self.assertTrue(ret.loc[2, "Ce/Ce*"] > 1.0)  # Ce is included in the fit
 
 
 class TestConvertChemistry(unittest.TestCase):
@@ -541,6 +677,13 @@ class TestConvertChemistry(unittest.TestCase):
         conv_df = convert_chemistry(self.df, to=out_components, renorm=False)
         self.assertTrue(all([a == b for a, b in zip(conv_df.columns, out_components)]))
 
+    def test_multiple_ratios(self):
+        ratios = ["CaO/MgO", "Na/Te", "Si/Mg"]
+        conv_df = convert_chemistry(self.df, to=self.expect + ratios, renorm=False)
+        for r in ratios:
+            with self.subTest(ratio=r):
+                self.assertTrue(np.allclose(conv_df[r], get_ratio(self.df, r)))
+
     def test_logdata(self):
         out_components = self.expect
         for logdata in [True, False]:
@@ -565,6 +708,32 @@ class TestConvertChemistry(unittest.TestCase):
                     all([a == b for a, b in zip(conv_df.columns, out_components)])
                 )
 
+    def test_renorm_closed(self):
+        out_components = ["MgO", "SiO2", "FeO", "CaO", "TeO2", "K2O", "Na2O"]
+        conv_df = convert_chemistry(self.df, to=out_components, renorm=True)
+        self.assertTrue(np.allclose(conv_df.sum(axis=1), 100.0))
+
+    def test_coupled_set(self):
+        out_components = ["SiO2", {"FeO": 0.9, "Fe2O3": 0.1}]
+        conv_df = convert_chemistry(self.df, to=out_components)
+        self.assertTrue(all([c in conv_df.columns for c in ["FeO", "Fe2O3"]]))
+        # sum of iron should be preserved
+        fe = elemental_sum(self.df, "Fe")
+        self.assertTrue(np.allclose(elemental_sum(conv_df, "Fe"), fe))
+
+    def test_noncompositional_passthrough(self):
+        df = self.df.copy()
+        df["Sample"] = np.arange(df.index.size)
+        conv_df = convert_chemistry(df, to=["MgO", "Ca"])
+        self.assertTrue((conv_df["Sample"] == df["Sample"]).all())
+
+    def test_consistent_with_aggregate_element(self):
+        for target in ["Ca", "CaO", "Na2O", "Mg"]:
+            with self.subTest(target=target):
+                conv_df = convert_chemistry(self.df, to=[target])
+                expect = aggregate_element(self.df, to=target)[target]
+                self.assertTrue(np.allclose(conv_df[target], expect))
+
 
 if __name__ == "__main__":
     unittest.main()
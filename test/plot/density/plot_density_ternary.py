@@ -4,6 +4,7 @@ import numpy as np
 from pyrolite.plot.density.ternary import ternary_heatmap
 from pyrolite.util.skl import ILRTransform, ALRTransform
 from pyrolite.comp.codata import ilr, alr, inverse_ilr, inverse_alr
+from pyrolite.util.math import balance_basis
 
 
 class TestTernaryHeatmap(unittest.TestCase):
@@ -34,6 +35,7 @@ class TestTernaryHeatmap(unittest.TestCase):
             (ilr, inverse_ilr),
             (ILRTransform, None),
             (ALRTransform, None),
+            (ILRTransform(psi=balance_basis([[1, -1, -1], [0, 1, -1]])), None),
         ]:
             with self.subTest(tfm=tfm, itfm=itfm):
                 out = ternary_heatmap(self.data, transform=tfm, inverse_transform=itfm)
@@ -1,6 +1,7 @@
 import unittest
 from pyrolite.util.synthetic import test_df
-from pyrolite.comp.codata import close
+from pyrolite.comp.codata import close, ilr, boxcox
+from pyrolite.util.math import balance_basis
 from pyrolite.geochem.ind import REE
 
 try:
@@ -88,6 +89,18 @@ class TestLogTransformers(unittest.TestCase):
                 inv = tmr.inverse_transform(out)
                 self.assertTrue(np.allclose(np.array(inv), np.array(input)))
 
+    def test_ILR_transformer_basis(self):
+        """Test the isometric log ratio transfomer with a balance basis."""
+        df = self.df
+        D = df.shape[1]
+        sbp = (np.eye(D) - np.triu(np.ones((D, D)), k=1))[:-1]  # (a | b, c, ..)
+        psi = balance_basis(sbp)
+        tmr = ILRTransform(psi=psi)
+        out = tmr.transform(df)
+        self.assertTrue(np.allclose(np.array(out), ilr(df.values, psi=psi)))
+        inv = tmr.inverse_transform(out)
+        self.assertTrue(np.allclose(np.array(inv), df.values))
+
     def test_BoxCox_transformer(self):
         """Test the isometric log ratio transfomer."""
         df = self.df
@@ -98,6 +111,29 @@ class TestLogTransformers(unittest.TestCase):
                 inv = tmr.inverse_transform(out)
                 self.assertTrue(np.allclose(np.array(inv), np.array(input)))
 
+    def test_BoxCox_transformer_lambdas(self):
+        """Test that the BoxCox transformer stores a lambda for each column."""
+        df = self.df
+        tmr = BoxCoxTransform().fit(df)
+        self.assertEqual(np.shape(tmr.lmbda), (df.columns.size,))
+        tmr = BoxCoxTransform(per_column=False).fit(df)
+        self.assertTrue(np.isscalar(tmr.lmbda))
+
+    def test_BoxCox_transformer_single_pass(self):
+        """Test that the BoxCox transformer is fit and applied in one pass."""
+        df = self.df
+        tmr = BoxCoxTransform()
+        calls = []
+
+        def forward(*args, **kwargs):
+            calls.append(kwargs)
+            return boxcox(*args, **kwargs)
+
+        tmr.forward = forward
+        out = tmr.transform(df)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(np.allclose(out, boxcox(df, lmbda=tmr.lmbda)))
+
 
 @unittest.skipUnless(HAVE_SKLEARN, "Requires Scikit-learn")
 class TestAgumentors(unittest.TestCase):
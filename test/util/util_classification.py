@@ -1,4 +1,5 @@
 import unittest
+import matplotlib.pyplot as plt
 from pyrolite.util.classification import *
 from pyrolite.comp.codata import renormalise
 
@@ -0,0 +1,33 @@
+import unittest
+from pyrolite.util.general import import_in_subprocess
+
+
+class TestHeadlessImports(unittest.TestCase):
+    """
+    Checks that the numerical subpackages can be imported without the plotting and
+    symbolic stacks.
+    """
+
+    def setUp(self):
+        self.heavy = ["matplotlib", "matplotlib.pyplot", "mpltern", "sympy"]
+
+    def test_headless_subpackages(self):
+        for module in ["pyrolite.geochem", "pyrolite.comp", "pyrolite.mineral"]:
+            with self.subTest(module=module):
+                result = import_in_subprocess(module, check=self.heavy)
+                msg = "{} imported {} ({:.2f} s).".format(
+                    module, ", ".join(result["loaded"]), result["time"]
+                )
+                self.assertEqual(result["loaded"], [], msg)
+
+    def test_classification(self):
+        result = import_in_subprocess("pyrolite.util.classification", self.heavy)
+        self.assertEqual(result["loaded"], [])
+
+    def test_plot(self):
+        result = import_in_subprocess("pyrolite.plot", check=self.heavy)
+        self.assertIn("matplotlib.pyplot", result["loaded"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 import unittest
 import pandas as pd
 import numpy as np
+import pyrolite.util.math
 from pyrolite.util.math import *
 from pyrolite.util.synthetic import random_cov_matrix
 from pyrolite.geochem.ind import REE, get_ionic_radii
+from pyrolite.util.general import temp_path, remove_tempdir
 
 
 class TestAugmentedCovarianceMatrix(unittest.TestCase):
@@ -428,6 +430,44 @@ class TestOrthogonalBasis(unittest.TestCase):
     def test_orthogonal_basis_default(self):
         basis = orthogonal_basis_default(self.X.shape[0])
 
+    def test_default_basis_cached(self):
+        basis = orthogonal_basis_default(self.X.shape[1])
+        self.assertIs(basis, orthogonal_basis_from_array(self.X))
+        self.assertFalse(basis.flags.writeable)
+        self.assertTrue(np.allclose(basis @ basis.T, np.eye(self.X.shape[1] - 1)))
+
+
+class TestBalanceBasis(unittest.TestCase):
+    """Test the generation of balance bases from sequential binary partitions."""
+
+    def setUp(self):
+        self.sbp = [[1, 1, -1, -1], [1, -1, 0, 0], [0, 0, 1, -1]]
+
+    def test_default(self):
+        basis = balance_basis(self.sbp)
+        self.assertEqual(basis.shape, (3, 4))
+        self.assertTrue(np.allclose(basis @ basis.T, np.eye(3)))
+        self.assertTrue(np.allclose(basis.sum(axis=1), 0))
+        # the first balance contrasts (a, b) with (c, d)
+        self.assertTrue(np.allclose(basis[0], np.array([1, 1, -1, -1]) / 2))
+
+    def test_cached(self):
+        self.assertIs(balance_basis(self.sbp), balance_basis(np.array(self.sbp)))
+
+    def test_helmert_partition(self):
+        sbp = np.sign(orthogonal_basis_default(4)).astype(int)
+        self.assertTrue(np.allclose(balance_basis(sbp), orthogonal_basis_default(4)))
+
+    def test_invalid(self):
+        for sbp in [
+            [[1, 1, -1, -1], [1, 1, 0, 0], [0, 0, 1, -1]],  # no denominator
+            [[1, 1, -1, -1], [1, 0, -1, 0], [0, 1, 0, -1]],  # not hierarchical
+            [[1, -1, 0], [1, 1, -1], [0, 0, 1]],  # wrong shape
+        ]:
+            with self.subTest(sbp=sbp):
+                with self.assertRaises(ValueError):
+                    balance_basis(sbp)
+
 
 class TestOPConstants(unittest.TestCase):
     """Checks the generation of orthagonal polynomial parameters."""
@@ -492,6 +532,106 @@ class TestOPConstants(unittest.TestCase):
                         self.assertTrue(np.allclose(a, b, atol=test_tol))
 
 
+class TestOPConstantsAlgorithms(unittest.TestCase):
+    """Checks the numeric and symbolic orthogonal polynomial parameters agree."""
+
+    def setUp(self):
+        self.xs = np.array(get_ionic_radii(REE(), coordination=8, charge=3))
+
+    def test_numeric_symbolic(self):
+        for degree in range(1, 6):
+            with self.subTest(degree=degree):
+                numeric = OP_constants(self.xs, degree=degree, cache=False)
+                symbolic = OP_constants(self.xs, degree=degree, algorithm="symbolic")
+                for a, b in zip(numeric, symbolic):
+                    self.assertTrue(
+                        np.allclose(np.array(a, dtype=float), np.array(b, dtype=float))
+                    )
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(NotImplementedError):
+            OP_constants(self.xs, algorithm="unknown")
+
+
+class TestOPCache(unittest.TestCase):
+    """Checks the caching of orthogonal polynomial parameters."""
+
+    def setUp(self):
+        self.xs = np.array(get_ionic_radii(REE(), coordination=8, charge=3))
+        self.tmppath = temp_path(suffix="opcachetest")
+        if not self.tmppath.exists():
+            self.tmppath.mkdir(parents=True)
+        self.path = self.tmppath / "OP_cache.json"
+        clear_OP_cache()
+
+    def test_cached(self):
+        ret = OP_constants(self.xs, degree=4)
+        self.assertEqual(ret, OP_constants(self.xs, degree=4))
+        self.assertEqual(len(pyrolite.util.math.__OP_cache__), 1)
+
+    def test_save_load(self):
+        ret = OP_constants(self.xs, degree=4)
+        save_OP_cache(self.path)
+        clear_OP_cache()
+        self.assertEqual(load_OP_cache(self.path), 1)
+        self.assertTrue(
+            all(np.allclose(a, b) for a, b in zip(ret, OP_constants(self.xs, 4)))
+        )
+
+    def tearDown(self):
+        clear_OP_cache()
+        remove_tempdir(self.tmppath)
+
+
+class TestLambdasLstsq(unittest.TestCase):
+    """Checks the batched least squares solution for lambdas."""
+
+    def setUp(self):
+        self.xs = np.array(get_ionic_radii(REE(dropPm=True), coordination=8, charge=3))
+        self.params = OP_constants(self.xs, degree=4)
+        self.lambdas = np.array([[2.0, -10.0, 50.0, -100.0], [1.0, 5.0, 10.0, 20.0]])
+        B = lambda_poly_basis(self.xs, self.params)
+        self.arr = self.lambdas @ B.T
+
+    def test_default(self):
+        ret = lambdas_lstsq(self.arr, xs=self.xs, params=self.params)
+        self.assertEqual(ret.shape, self.lambdas.shape)
+        self.assertTrue(np.allclose(ret, self.lambdas))
+
+    def test_residuals(self):
+        ret, res = lambdas_lstsq(
+            self.arr, xs=self.xs, params=self.params, residuals=True
+        )
+        self.assertEqual(res.shape, self.arr.shape)
+        self.assertTrue(np.allclose(res, 0.0))
+
+    def test_missing_patterns(self):
+        arr = np.vstack([self.arr, self.arr, self.arr])
+        arr[[0, 2], 2] = np.nan
+        arr[3, [0, 5]] = np.nan
+        ret, res = lambdas_lstsq(arr, xs=self.xs, params=self.params, residuals=True)
+        self.assertTrue(np.allclose(ret, np.vstack([self.lambdas] * 3)))
+        self.assertTrue((np.isnan(res) == np.isnan(arr)).all())
+
+    def test_underdetermined_rows(self):
+        arr = self.arr.copy()
+        arr[0, 3:] = np.nan  # fewer values than parameters
+        ret = lambdas_lstsq(arr, xs=self.xs, params=self.params)
+        self.assertTrue(np.isnan(ret[0]).all())
+        self.assertTrue(np.allclose(ret[1], self.lambdas[1]))
+
+    def test_matches_optimisation(self):
+        noisy = self.arr + np.random.randn(*self.arr.shape) * 0.01
+        ret = lambdas_lstsq(noisy, xs=self.xs, params=self.params)
+        expect = np.array(
+            [
+                lambdas(r, xs=self.xs, params=self.params, degree=4, costf_power=1.0)
+                for r in noisy
+            ]
+        )
+        self.assertTrue(np.allclose(ret, expect, rtol=10 ** -3))
+
+
 class TestLambdaPolyFunc(unittest.TestCase):
     """Checks the generation of lambda polynomial functions."""
 
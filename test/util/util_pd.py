@@ -240,5 +240,46 @@ class TestDFFromCSVs(unittest.TestCase):
         remove_tempdir(self.dir)
 
 
+class TestPipelines(unittest.TestCase):
+    """Tests chunked application of pipelines of operations."""
+
+    def setUp(self):
+        import pyrolite.geochem
+        import pyrolite.comp
+
+        self.dir = temp_path()
+        self.df = test_df(cols=["SiO2", "CaO", "MgO", "FeO", "TiO2"], index_length=20)
+        self.chunks = [self.df.iloc[i : i + 6] for i in range(0, 20, 6)]
+        self.pipeline = [
+            lambda df: df * 2,
+            "pyrochem.to_molecular",
+            ("pyrocomp.renormalise", dict(scale=1.0)),
+            "pyrocomp.CLR",
+        ]
+
+    def test_apply_pipeline(self):
+        out = apply_pipeline(self.df, self.pipeline)
+        expect = self.df.pyrochem.to_molecular().pyrocomp.renormalise(scale=1.0)
+        expect = expect.pyrocomp.CLR()
+        self.assertTrue(np.allclose(out.values, expect.values))
+
+    def test_iter_pipeline(self):
+        out = pd.concat(list(iter_pipeline(iter(self.chunks), self.pipeline)))
+        expect = apply_pipeline(self.df, self.pipeline)
+        self.assertTrue((out.index == self.df.index).all())
+        self.assertTrue(np.allclose(out.values, expect.values))
+
+    def test_write_pipeline(self):
+        path = self.dir / "pipeline.csv"
+        rows = write_pipeline(iter(self.chunks), self.pipeline, path=path)
+        self.assertEqual(rows, self.df.index.size)
+        out = pd.read_csv(str(path), index_col=0)
+        expect = apply_pipeline(self.df, self.pipeline)
+        self.assertTrue(np.allclose(out.values, expect.values))
+
+    def tearDown(self):
+        remove_tempdir(self.dir)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@ import unittest
 import pandas as pd
 import numpy as np
 from pyrolite.util.synthetic import *
+from pyrolite.util.math import balance_basis
+from pyrolite.comp.codata import ilr
 
 
 class TestRandomCovMatrix(unittest.TestCase):
@@ -65,6 +67,16 @@ class TestRandomComposition(unittest.TestCase):
         cov = random_cov_matrix(self.D - 1)
         rc = random_composition(size=self.size, D=self.D, mean=mean, cov=cov)
 
+    def test_basis_specified(self):
+        psi = balance_basis([[1, 1, -1, -1], [1, -1, 0, 0], [0, 0, 1, -1]])
+        mean = random_composition(size=1, D=self.D)
+        cov = np.diag([0.1, 0.2, 0.3])
+        rc = random_composition(size=self.size, D=self.D, mean=mean, cov=cov, psi=psi)
+        self.assertEqual(rc.shape, (self.size, self.D))
+        # the sample covariance should be approximately that in the specified basis
+        tcov = np.cov(ilr(rc, psi=psi), rowvar=False)
+        self.assertTrue(np.argmax(np.diag(tcov)) == 2)
+
     def test_missing_mechanism(self):
         for missing in [None, "MCAR", "MAR", "MNAR"]:
             rc = random_composition(size=self.size, D=self.D, missing=missing)